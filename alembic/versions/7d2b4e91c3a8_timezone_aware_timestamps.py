@@ -0,0 +1,42 @@
+"""timezone aware timestamps
+
+Revision ID: 7d2b4e91c3a8
+Revises: f8744c27ea51
+Create Date: 2026-10-16 11:02:17.304911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2b4e91c3a8'
+down_revision: Union[str, Sequence[str], None] = 'f8744c27ea51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('user', 'userprofile')
+COLUMNS = ('created_at', 'updated_at')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing values were written as UTC
+    for table in TABLES:
+        for column in COLUMNS:
+            op.alter_column(table, column,
+                       type_=sa.DateTime(timezone=True),
+                       existing_type=sa.DateTime(),
+                       postgresql_using=f'{column} AT TIME ZONE \'UTC\'')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        for column in COLUMNS:
+            op.alter_column(table, column,
+                       type_=sa.DateTime(),
+                       existing_type=sa.DateTime(timezone=True),
+                       postgresql_using=f'{column} AT TIME ZONE \'UTC\'')
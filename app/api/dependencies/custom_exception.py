@@ -1,7 +1,6 @@
 from typing import Callable, Optional, Dict, Any
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from slowapi.errors import RateLimitExceeded
 
 from app.api.dependencies.response import error_response
 from app.core.config import Config
@@ -46,26 +45,60 @@ class ServerError(BaseAppException):
         super().__init__(message, errors)
 
 
+class ServiceUnavailableError(BaseAppException):
+    """Exception raised when the server is overloaded and sheds load."""
+    def __init__(self, message: str = "Service temporarily unavailable", errors: Optional[Dict[str, Any]] = None):
+        super().__init__(message, errors)
+
+
+class BadRequestError(BaseAppException):
+    """Exception raised for malformed or unacceptable requests."""
+    def __init__(self, message: str = "Bad request", errors: Optional[Dict[str, Any]] = None):
+        super().__init__(message, errors)
+
+
+class ForbiddenError(BaseAppException):
+    """Exception raised when the user may not perform an action."""
+    def __init__(self, message: str = "Forbidden", errors: Optional[Dict[str, Any]] = None):
+        super().__init__(message, errors)
+
+
+class NotFoundError(BaseAppException):
+    """Exception raised when a requested resource does not exist."""
+    def __init__(self, message: str = "Resource not found", errors: Optional[Dict[str, Any]] = None):
+        super().__init__(message, errors)
+
+
+class ConflictError(BaseAppException):
+    """Exception raised when a request conflicts with the current state of a resource."""
+    def __init__(self, message: str = "Conflict", errors: Optional[Dict[str, Any]] = None):
+        super().__init__(message, errors)
+
+
+class PayloadTooLargeError(BaseAppException):
+    """Exception raised when a request body exceeds the allowed size."""
+    def __init__(self, message: str = "Payload too large", errors: Optional[Dict[str, Any]] = None):
+        super().__init__(message, errors)
+
+
+class UnsupportedMediaTypeError(BaseAppException):
+    """Exception raised when a request body has a content type the endpoint doesn't accept."""
+    def __init__(self, message: str = "Unsupported media type", errors: Optional[Dict[str, Any]] = None):
+        super().__init__(message, errors)
+
+
+class RateLimitExceededError(BaseAppException):
+    """Exception raised when a client exceeds a rate limit."""
+    def __init__(self, message: str = "Too many requests", errors: Optional[Dict[str, Any]] = None):
+        super().__init__(message, errors)
+
+
 class OauthError(BaseAppException):
     """Exception raised for failed Google Initiation tokens."""
     def __init__(self, message: str = "Authentication failed", errors: Optional[Dict[str, Any]] = None):
         super().__init__(message, errors)
  
         
-def create_rate_limit_exception_handler(
-    status_code: int,
-    default_message: str
-) -> Callable[[Request, Exception], JSONResponse]:
-    async def exception_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
-        message = getattr(exc, "message", default_message)
-        errors = getattr(exc, "errors", {})
-        return error_response(
-            status_code=status_code,
-            message=message,
-            errors=errors,
-        )
-    return exception_handler
-
 def create_exception_handler(
     status_code: int,
     default_message: str
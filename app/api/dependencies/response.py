@@ -1,33 +1,84 @@
 import json
 from typing import Any, Dict, List, Optional, Union
 
-from fastapi.encoders import jsonable_encoder
+import orjson
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlmodel import SQLModel
+from typing_extensions import TypedDict
+
+
+class SuccessEnvelope(TypedDict):
+    status: str
+    status_code: int
+    message: str
+    data: Any
+
+
+class ErrorEnvelope(TypedDict):
+    status: str
+    status_code: int
+    message: str
+    errors: Any
+
+
+# A pydantic schema or plain JSON-like containers; never a table model, whose
+# dump would include every column (password hashes, soft-delete flags, ...)
+ResponseData = Union[BaseModel, Dict[str, Any], List[Any]]
+
+# Built once; dump_json serializes nested pydantic models, UUIDs and datetimes in a single pass
+success_envelope = TypeAdapter(SuccessEnvelope)
+error_envelope = TypeAdapter(ErrorEnvelope)
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _reject_table_models(data: Any) -> None:
+    for item in data if isinstance(data, list) else [data]:
+        if isinstance(item, SQLModel) and hasattr(type(item), "__table__"):
+            raise TypeError(f"{type(item).__name__} is a table model; respond with a schema built from it")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson; pre-rendered bytes are sent as-is."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content, default=_orjson_default)
 
 
 def success_response(
     status_code: int,
     message: str = "Request successful",
-    data: Optional[Union[Dict[str, Any], List[Any]]] = None,
-) -> JSONResponse:
+    data: Optional[ResponseData] = None,
+) -> ORJSONResponse:
     """
     Standardized success response format.
 
     Args:
         status_code (int): HTTP status code
         message (str): Human-readable success message
-        data (Optional): Optional response payload
+        data (Optional): Optional response payload; a schema, not a table model
 
     Returns:
-        JSONResponse: Standardized success JSON response
+        ORJSONResponse: Standardized success JSON response
+
+    Raises:
+        TypeError: If ``data`` is a table model, or a list of them
     """
-    return JSONResponse(
+    _reject_table_models(data)
+    return ORJSONResponse(
         status_code=status_code,
-        content=jsonable_encoder({
+        content=success_envelope.dump_json({
             "status": "success",
             "status_code": status_code,
             "message": message,
-            "data": data or {}
+            "data": {} if data is None else data,
         }),
     )
 
@@ -36,7 +87,7 @@ def error_response(
     status_code: int,
     message: str = "An error occurred",
     errors: Optional[Union[str, Dict[str, Any], List[Dict[str, Any]]]] = None,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Standardized error response format.
 
@@ -46,7 +97,7 @@ def error_response(
         errors (Optional): Error detail (e.g., field issues, exceptions)
 
     Returns:
-        JSONResponse: Standardized error JSON response
+        ORJSONResponse: Standardized error JSON response
     """
     # Try to decode JSON error strings if passed as raw strings
     parsed_errors = errors
@@ -56,9 +107,9 @@ def error_response(
         except json.JSONDecodeError:
             parsed_errors = {"detail": errors}
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
-        content=jsonable_encoder({
+        content=error_envelope.dump_json({
             "status": "error",
             "status_code": status_code,
             "message": message,
@@ -0,0 +1,73 @@
+import time
+from uuid import uuid4
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.logger import log_context_var
+from app.utils.metrics import http_request_duration_seconds, http_requests_in_flight
+
+
+class RequestContextMiddleware:
+    """Sets the request id (from X-Request-ID or a new one) for log records and echoes it back."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:64]
+                break
+        request_id = request_id or uuid4().hex
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"].append((b"x-request-id", request_id.encode("latin-1")))
+            await send(message)
+
+        token = log_context_var.set({"request_id": request_id})
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            log_context_var.reset(token)
+
+
+class MetricsMiddleware:
+    """Records in-flight requests and per-route latency histograms."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+            # Label by route template rather than raw path to keep cardinality bounded
+            route = scope.get("route")
+            http_request_duration_seconds.observe(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                str(status_code),
+                value=time.perf_counter() - start,
+            )
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import RedirectResponse
+
+from app.api.dependencies.custom_exception import NotFoundError
+from app.schemas.enums import EventType
+from app.services.affiliate import affiliate_service
+from app.services.events import event_pipeline
+
+
+redirect_router = APIRouter(tags=["Redirects"])
+
+
+@redirect_router.get("/r/{code}", include_in_schema=False)
+async def follow_short_link(code: str, request: Request):
+    """
+    Redirect an affiliate short link to its product.
+
+    This is the hottest route in the app: it takes no DB session and resolves
+    the code from the link cache, which only falls back to the database on a miss.
+    The click is handed to the event pipeline, which writes it in a later batch.
+    """
+    target = await affiliate_service.resolve(code)
+    if target is None:
+        raise NotFoundError("Link not found")
+    event_pipeline.track(EventType.CLICK, request, link_code=code)
+    return RedirectResponse(target, status_code=302, headers={"Cache-Control": "private, max-age=0"})
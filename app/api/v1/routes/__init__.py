@@ -1,8 +1,26 @@
 from fastapi import APIRouter
 from .auth import auth_router
 from .oauth import google_auth
+from .upload import upload_router
+from .job import job_router
+from .review import review_router
+from .admin import admin_router
+from .link import link_router
+from .dashboard import dashboard_router
+from .search import search_router
+from .creator import creator_router
+from .user import user_router
 
 router = APIRouter(prefix="/v1")
 
 router.include_router(auth_router)
-router.include_router(google_auth)
\ No newline at end of file
+router.include_router(google_auth)
+router.include_router(upload_router)
+router.include_router(job_router)
+router.include_router(review_router)
+router.include_router(admin_router)
+router.include_router(link_router)
+router.include_router(dashboard_router)
+router.include_router(search_router)
+router.include_router(creator_router)
+router.include_router(user_router)
@@ -0,0 +1,102 @@
+from typing import List, Literal
+from uuid import uuid4
+
+from fastapi import APIRouter, Body, Depends, Query, Request, status
+
+from app.api.dependencies.custom_exception import PayloadTooLargeError
+from app.api.dependencies.response import success_response
+from app.core.config import Config
+from app.db.session import AsyncSessionDep
+from app.schemas.commission import ConversionCreate
+from app.schemas.job import JobProgress
+from app.schemas.user import Principal
+from app.services.catalog import PRODUCT_IMPORT_JOB
+from app.services.jobs import job_queue
+from app.services.ledger import commission_ledger
+from app.services.storage import storage
+from app.services.upload import multipart_file_chunks, raw_body_chunks
+from app.services.user import user_service
+
+
+admin_router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@admin_router.post("/products/import", status_code=status.HTTP_202_ACCEPTED)
+async def import_products(
+    request: Request,
+    db: AsyncSessionDep,
+    merchant: str = Query(min_length=1, max_length=200),
+    format: Literal["csv", "jsonl"] = Query(default="csv"),
+    current_user: Principal = Depends(user_service.get_current_superadmin),
+):
+    """
+    Import a merchant product feed.
+
+    The feed (raw body or a single-file multipart form) is streamed to storage
+    and imported by a background worker; poll the returned job for progress.
+
+    Args:
+        request (Request): The HTTP request carrying the feed.
+        db (AsyncSession): Database session.
+        merchant (str): Merchant the feed belongs to.
+        format (str): ``csv`` (with a header row) or ``jsonl``.
+        current_user (Principal): The currently authenticated superadmin.
+
+    Returns:
+        JobProgress: The queued import job.
+
+    Raises:
+        PayloadTooLargeError: If the feed is larger than MAX_UPLOAD_SIZE.
+    """
+    storage_key = f"imports/{uuid4()}.{format}"
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        chunks = multipart_file_chunks(request)
+    else:
+        chunks = raw_body_chunks(request)
+    # One byte over the limit tells a feed that is too large from one that fits exactly
+    written = await storage.write_stream(storage_key, offset=0, chunks=chunks, limit=Config.MAX_UPLOAD_SIZE + 1)
+    if written > Config.MAX_UPLOAD_SIZE:
+        await storage.delete(storage_key)
+        raise PayloadTooLargeError(
+            "Product feed too large",
+            errors={"max_upload_size": Config.MAX_UPLOAD_SIZE},
+        )
+
+    job = await job_queue.enqueue(
+        PRODUCT_IMPORT_JOB,
+        {"storage_key": storage_key, "merchant": merchant, "format": format},
+        session=db,
+        owner_id=current_user.uuid,
+    )
+    response = success_response(
+        status_code=status.HTTP_202_ACCEPTED,
+        message="Product import queued",
+        data=JobProgress.model_validate(job),
+    )
+    response.headers["Location"] = f"/api/v1/jobs/{job.uuid}"
+    return response
+
+
+@admin_router.post("/conversions", status_code=status.HTTP_201_CREATED)
+async def record_conversions(
+    db: AsyncSessionDep,
+    conversions: List[ConversionCreate] = Body(min_length=1, max_length=1000),
+    current_user: Principal = Depends(user_service.get_current_superadmin),
+):
+    """
+    Record sales reported by merchants; orders already recorded are ignored.
+
+    Args:
+        db (AsyncSession): Database session.
+        conversions (List[ConversionCreate]): Up to 1000 conversions.
+        current_user (Principal): The currently authenticated superadmin.
+
+    Returns:
+        dict: How many conversions were new.
+    """
+    inserted = await commission_ledger.record_conversions(conversions, session=db)
+    return success_response(
+        status_code=status.HTTP_201_CREATED,
+        message="Conversions recorded",
+        data={"received": len(conversions), "inserted": inserted},
+    )
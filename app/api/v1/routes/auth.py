@@ -1,32 +1,42 @@
 from datetime import timedelta
 from fastapi import Depends, Request, Response, status, APIRouter
 from fastapi.responses import JSONResponse
-import logging
 
 from app.api.dependencies.custom_exception import InvalidTokenError
 from app.core.security import security
-from app.db.session import SessionDep
+from app.db.session import AsyncSessionDep
 from app.api.dependencies.response import success_response
-from app.db.models import User
 from app.schemas.enums import TokenType
 from app.schemas.responses.user import UserResponse
-from app.schemas.user import RegisteredUserData, UserCreate, UserLogin
+from app.schemas.user import Principal, RegisteredUserData, UserCreate, UserLogin
 from app.services.user import user_service
 from app.schemas.token import AccessTokenDetails, Token, TokenCreate, TokenDetails
 
-from app.utils.limiter import limiter
+from app.utils.limiter import ip_key, limiter
+from app.utils.logger import get_logger
 
-# Setup logger
-logger = logging.getLogger("auth")
-logging.basicConfig(level=logging.INFO)
+logger = get_logger(__name__)
 
 
 auth_router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+async def limit_login_attempts(email: str, ip: str) -> None:
+    """
+    Count a login attempt against ``email`` from ``ip``.
+
+    Raises:
+        RateLimitExceededError: If the account has seen too many attempts.
+    """
+    # Per account and client, so bad logins from elsewhere can't lock the owner out quickly;
+    # per account alone, more loosely, so rotating IPs doesn't buy unlimited guesses
+    await limiter.check("login_account_ip", f"{email}:{ip}", "20/hour")
+    await limiter.check("login_account", email, "100/hour")
+
+
 @auth_router.post("/register", status_code=status.HTTP_201_CREATED)
-def register(user_schema: UserCreate, db: SessionDep):
-    user = user_service.create_user(session=db, user_data=user_schema)
+async def register(user_schema: UserCreate, db: AsyncSessionDep):
+    user = await user_service.create_user_async(session=db, user_data=user_schema)
 
     logger.info(f"User {user.email} registered successfully")
 
@@ -55,11 +65,15 @@ def register(user_schema: UserCreate, db: SessionDep):
     return response
 
 
-@auth_router.post("/login", status_code=status.HTTP_200_OK)
-@limiter.limit("5/minute")
-def login(request: Request, user_data: UserLogin, db: SessionDep):
-    
-    user = user_service.authenticate_user(user_data=user_data, session=db)
+@auth_router.post(
+    "/login",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(limiter.limit("5/minute"))],
+)
+async def login(request: Request, user_data: UserLogin, db: AsyncSessionDep):
+    email = user_data.email.lower()
+    await limit_login_attempts(email, ip_key(request))
+    user = await user_service.authenticate_user_async(user_data=user_data, session=db)
     logger.info(f"User {user.email} logged in successfully")
 
     response = success_response(
@@ -87,17 +101,23 @@ def login(request: Request, user_data: UserLogin, db: SessionDep):
     return response
 
 
-@auth_router.post("/refresh-access-token", status_code=status.HTTP_200_OK, response_model=None)
-@limiter.limit("10/minute")
-def refresh_access_token(request: Request, current_user: User = Depends(user_service.get_current_user)):
+@auth_router.post(
+    "/refresh-access-token",
+    status_code=status.HTTP_200_OK,
+    response_model=None,
+    dependencies=[Depends(limiter.limit("10/minute"))],
+)
+def refresh_access_token(request: Request, current_user: Principal = Depends(user_service.get_current_user)):
     current_refresh_token = request.cookies.get("refresh_token")
     if not current_refresh_token or not security.is_refresh_token_active(
-        data=Token(token=current_refresh_token)
+        token=Token(token=current_refresh_token)
     ):
         logger.warning("Invalid or expired refresh token during refresh attempt")
-        raise InvalidTokenError(detail="Invalid or expired refresh token")
+        raise InvalidTokenError("Invalid or expired refresh token")
 
-    access_token, refresh_token = security.refresh_access_token(current_refresh_token=current_refresh_token)
+    access_token, refresh_token = security.refresh_access_token(
+        current_refresh_token=Token(token=current_refresh_token)
+    )
 
     logger.info(f"Token refreshed for user {current_user.uuid}")
 
@@ -128,14 +148,12 @@ def refresh_access_token(request: Request, current_user: User = Depends(user_ser
 def logout(
     request: Request,
     response: Response,
-    current_user: User = Depends(user_service.get_current_user),
+    current_user: Principal = Depends(user_service.get_current_user),
 ):
     refresh_token = request.cookies.get("refresh_token")
     if refresh_token:
-        security.redis_client.setex(
-            f"blacklisted_token:{refresh_token}", timedelta(days=30), "blacklisted"
-        )
-        logger.info(f"Refresh token for user {current_user.uuid} blacklisted")
+        security.revoke_refresh_token(token=Token(token=refresh_token))
+        logger.info(f"Refresh token for user {current_user.uuid} revoked")
 
     response.delete_cookie(
         key="refresh_token",
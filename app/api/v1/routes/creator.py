@@ -0,0 +1,44 @@
+from typing import Optional
+
+from fastapi import APIRouter, Header, Path, Response, status
+
+from app.api.dependencies.custom_exception import NotFoundError
+from app.api.dependencies.response import ORJSONResponse
+from app.services.creator import creator_page_cache, etag_matches
+
+
+creator_router = APIRouter(prefix="/creators", tags=["Creators"])
+
+# Shared caches may keep the page but must revalidate it, which usually costs a 304
+CACHE_CONTROL = "public, no-cache"
+
+
+@creator_router.get("/{username}")
+async def get_creator(
+    username: str = Path(min_length=1, max_length=100),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """
+    Get a creator's public profile.
+
+    Served from the creator page cache; a request whose If-None-Match matches
+    the current ETag gets a 304 without a database query.
+
+    Args:
+        username (str): The creator's username.
+        if_none_match (Optional[str]): ETag(s) of a copy the client already has.
+
+    Returns:
+        CreatorProfile: The profile, or an empty 304 if the client's copy is current.
+
+    Raises:
+        NotFoundError: If there is no creator with that username.
+    """
+    page = await creator_page_cache.get(username)
+    if page is None:
+        raise NotFoundError("Creator not found")
+
+    headers = {"ETag": page.etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(if_none_match, page.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return ORJSONResponse(status_code=status.HTTP_200_OK, content=page.body, headers=headers)
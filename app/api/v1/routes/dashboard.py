@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, status
+
+from app.api.dependencies.custom_exception import BadRequestError
+from app.api.dependencies.response import success_response
+from app.db.base_model import utcnow
+from app.schemas.enums import Granularity
+from app.schemas.user import Principal
+from app.services.rollup import dashboard_service
+from app.services.user import user_service
+
+
+dashboard_router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+DEFAULT_PERIOD = {Granularity.HOUR: timedelta(hours=48), Granularity.DAY: timedelta(days=30)}
+MAX_PERIOD = {Granularity.HOUR: timedelta(days=31), Granularity.DAY: timedelta(days=731)}
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Treat a datetime given without an offset as UTC."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def resolve_period(granularity: Granularity, since: Optional[datetime], until: Optional[datetime]):
+    since, until = as_utc(since), as_utc(until)
+    until = until or utcnow()
+    since = since or until - DEFAULT_PERIOD[granularity]
+    if since >= until:
+        raise BadRequestError("since must be before until")
+    if until - since > MAX_PERIOD[granularity]:
+        raise BadRequestError(f"Period too long for {granularity.value}ly stats")
+    return since, until
+
+
+@dashboard_router.get("/timeseries")
+async def get_timeseries(
+    granularity: Granularity = Granularity.DAY,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    current_user: Principal = Depends(user_service.get_current_user),
+):
+    """
+    Views, clicks, conversions and earnings of the current creator per hour or day.
+
+    Args:
+        granularity (Granularity): Bucket size.
+        since (Optional[datetime]): Period start (UTC if without offset); defaults to 48 hours or 30 days ago.
+        until (Optional[datetime]): Period end (exclusive); defaults to now.
+        current_user (Principal): The currently authenticated user.
+
+    Returns:
+        List[TimeBucketStats]: Non-empty buckets, oldest first.
+
+    Raises:
+        BadRequestError: If the period is empty or too long for the granularity.
+    """
+    since, until = resolve_period(granularity, since, until)
+    buckets = await dashboard_service.get_timeseries(current_user.uuid, granularity, since, until)
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Dashboard stats retrieved",
+        data=buckets,
+    )
+
+
+@dashboard_router.get("/content")
+async def get_content_stats(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    current_user: Principal = Depends(user_service.get_current_user),
+):
+    """
+    Totals of each of the current creator's reviews and linked products over a period.
+
+    Args:
+        since (Optional[datetime]): Period start (UTC if without offset), rounded down to the day; defaults to 30 days ago.
+        until (Optional[datetime]): Period end (exclusive); defaults to now.
+        current_user (Principal): The currently authenticated user.
+
+    Returns:
+        List[ContentStats]: Per-content totals, highest earning first.
+
+    Raises:
+        BadRequestError: If the period is empty or too long.
+    """
+    since, until = resolve_period(Granularity.DAY, since, until)
+    stats = await dashboard_service.get_content_stats(current_user.uuid, since, until)
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Dashboard stats retrieved",
+        data=stats,
+    )
@@ -0,0 +1,40 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+
+from app.api.dependencies.response import success_response
+from app.db.session import AsyncSessionDep
+from app.schemas.job import JobProgress
+from app.schemas.user import Principal
+from app.services.jobs import job_queue
+from app.services.user import user_service
+
+
+job_router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+@job_router.get("/{job_id}")
+async def get_job(
+    job_id: UUID,
+    db: AsyncSessionDep,
+    current_user: Principal = Depends(user_service.get_current_user),
+):
+    """
+    Return the status and progress of a background job.
+
+    Args:
+        job_id (UUID): The job to look up.
+        db (AsyncSession): Database session.
+        current_user (Principal): The currently authenticated user.
+
+    Returns:
+        JobProgress: Status, progress (0-100) and, once finished, the result or error.
+    """
+    job = await job_queue.get_job(job_id, owner_id=current_user.uuid, session=db)
+    response = success_response(
+        status_code=status.HTTP_200_OK,
+        message="Job status retrieved",
+        data=JobProgress.model_validate(job),
+    )
+    response.headers["Cache-Control"] = "no-store"
+    return response
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends, status
+
+from app.api.dependencies.response import success_response
+from app.db.session import AsyncSessionDep
+from app.schemas.affiliate import AffiliateLinkCreate, AffiliateLinkRead
+from app.schemas.user import Principal
+from app.services.affiliate import affiliate_service
+from app.services.user import user_service
+
+
+link_router = APIRouter(prefix="/links", tags=["Affiliate Links"])
+
+
+@link_router.post("", status_code=status.HTTP_201_CREATED)
+async def create_link(
+    link_data: AffiliateLinkCreate,
+    db: AsyncSessionDep,
+    current_user: Principal = Depends(user_service.get_current_user),
+):
+    """
+    Get a short affiliate link to a product, creating it on first use.
+
+    Args:
+        link_data (AffiliateLinkCreate): The product and, optionally, the review it's shared from.
+        db (AsyncSession): Database session.
+        current_user (Principal): The currently authenticated user.
+
+    Returns:
+        AffiliateLinkRead: The link, including its short URL.
+    """
+    link = await affiliate_service.create_link(current_user.uuid, link_data, session=db)
+    return success_response(
+        status_code=status.HTTP_201_CREATED,
+        message="Affiliate link created",
+        data=AffiliateLinkRead.model_validate(link),
+    )
@@ -1,7 +1,6 @@
 from datetime import timedelta
 from urllib.parse import urlencode
 from fastapi.responses import RedirectResponse
-import requests
 from fastapi import APIRouter, Depends, Request, status
 
 from app.api.dependencies.custom_exception import GoogleInitiationError, OauthError, ServerError
@@ -16,8 +15,10 @@ from app.schemas.user import RegisteredUserData
 from app.services.user import user_service
 from app.services.oauth import google_oauth_service
 from app.core.security import security
-from app.db.session import SessionDep
+from app.core.google_id_token import google_id_token_verifier
+from app.db.session import AsyncSessionDep
 from app.schemas.oauth import OAuthToken, UserOauthEmail
+from app.utils.http_client import HTTPClient, get_http_client
 from app.utils.logger import get_logger
 
 
@@ -26,7 +27,7 @@ logger = get_logger(__name__)
 google_auth = APIRouter(prefix="/oauth", tags=["Oauth"])
 
 
-async def handle_google_login(profile_data: dict, db: SessionDep) -> tuple[User, bool]:
+async def handle_google_login(profile_data: dict, db: AsyncSessionDep) -> tuple[User, bool]:
     """
     Shared logic to handle Google login.
     Returns (user, is_new_user)
@@ -35,28 +36,19 @@ async def handle_google_login(profile_data: dict, db: SessionDep) -> tuple[User,
     if not email and "sub" in profile_data:
         email = f"{profile_data['sub']}@placeholder.google.com"
 
-    user = user_service.get_user_by_email(session=db, email=email)
+    user = await user_service.get_user_by_email_async(session=db, email=email)
     is_new_user = False
 
     if not user:
-        user = google_oauth_service.create(session=db, email_data=UserOauthEmail(email=email))
+        user = await google_oauth_service.create_async(session=db, email_data=UserOauthEmail(email=email))
         is_new_user = True
 
     return user, is_new_user
 
 
 @google_auth.post("/google")
-async def google_login(request: Request, token_request: OAuthToken, db: SessionDep):
-    profile_endpoint = f"https://www.googleapis.com/oauth2/v3/tokeninfo?id_token={token_request.id_token}"
-    profile_response = requests.get(profile_endpoint)
-
-    if profile_response.status_code != 200:
-        raise OauthError(
-            message="Google Authentication failed",
-            errors={"error": "Invalid ID token"}
-        )
-
-    profile_data = profile_response.json()
+async def google_login(request: Request, token_request: OAuthToken, db: AsyncSessionDep):
+    profile_data = await google_id_token_verifier.verify(token_request.id_token)
     user, created = await handle_google_login(profile_data, db)
 
     response = success_response(
@@ -148,7 +140,11 @@ async def initiate_google_auth(request_params: EnvironmentParams = Depends()):
 
 
 @google_auth.get("/google/callback")
-async def google_callback(request: Request, db: SessionDep):
+async def google_callback(
+    request: Request,
+    db: AsyncSessionDep,
+    http_client: HTTPClient = Depends(get_http_client),
+):
     query_params = dict(request.query_params)
     code = query_params.get("code")
     state = query_params.get("state", "")
@@ -169,9 +165,8 @@ async def google_callback(request: Request, db: SessionDep):
         return RedirectResponse(url=redirect_url, status_code=302)
 
     try:
-        token_url = "https://oauth2.googleapis.com/token"
-        token_response = requests.post(
-            token_url,
+        token_response = await http_client.post(
+            Config.GOOGLE_TOKEN_URL,
             headers={"Content-Type": "application/x-www-form-urlencoded"},
             data={
                 "grant_type": "authorization_code",
@@ -191,16 +186,9 @@ async def google_callback(request: Request, db: SessionDep):
         token_data = token_response.json()
         id_token = token_data.get("id_token")
 
-        profile_endpoint = f"https://www.googleapis.com/oauth2/v3/tokeninfo?id_token={id_token}"
-        profile_response = requests.get(profile_endpoint)
-
-        if profile_response.status_code != 200:
-            raise OauthError(
-                message="Google Authentication failed",
-                errors={"error": "Invalid ID token"}
-            )
-
-        profile_data = profile_response.json()
+        profile_data = await google_id_token_verifier.verify(
+            id_token, access_token=token_data.get("access_token")
+        )
         user, _ = await handle_google_login(profile_data, db)
 
         if "local" in state:
@@ -0,0 +1,96 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+
+from app.api.dependencies.response import success_response
+from app.core.config import Config
+from app.db.session import AsyncSessionDep
+from app.schemas.enums import EventType
+from app.schemas.pagination import Page
+from app.schemas.review import ReviewRead
+from app.services.events import event_pipeline
+from app.services.review import review_service
+from app.utils.limiter import limiter
+
+
+review_router = APIRouter(prefix="/reviews", tags=["Reviews"])
+
+
+@review_router.get("/feed")
+async def get_feed(
+    db: AsyncSessionDep,
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    limit: int = Query(default=20, ge=1, le=100),
+    creator_id: Optional[UUID] = None,
+):
+    """
+    List published reviews, newest first.
+
+    Args:
+        db (AsyncSession): Database session.
+        cursor (Optional[str]): Opaque cursor from the previous page.
+        limit (int): Page size.
+        creator_id (Optional[UUID]): Only list this creator's reviews.
+
+    Returns:
+        Page[ReviewRead]: The reviews and the cursor for the next page.
+    """
+    reviews, next_cursor = await review_service.get_feed(
+        db, limit=limit, cursor=cursor, creator_id=creator_id
+    )
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Feed retrieved",
+        data=Page[ReviewRead](
+            items=[ReviewRead.model_validate(review) for review in reviews],
+            next_cursor=next_cursor,
+        ),
+    )
+
+
+@review_router.get("/trending")
+async def get_trending(
+    db: AsyncSessionDep,
+    category: Optional[str] = Query(default=None, max_length=200, description="Product category; all reviews if omitted"),
+    offset: int = Query(default=0, ge=0, lt=Config.TRENDING_TOP_K),
+    limit: int = Query(default=20, ge=1, le=100),
+):
+    """
+    List the hottest reviews right now, optionally within a product category.
+
+    Args:
+        db (AsyncSession): Database session.
+        category (Optional[str]): Only reviews linking to products of this category.
+        offset (int): Number of reviews to skip; rankings hold the top TRENDING_TOP_K.
+        limit (int): Page size.
+
+    Returns:
+        List[ReviewRead]: The reviews, hottest first.
+    """
+    reviews = await review_service.get_trending(db, limit=limit, offset=offset, category=category)
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Trending reviews retrieved",
+        data=[ReviewRead.model_validate(review) for review in reviews],
+    )
+
+
+@review_router.post(
+    "/{review_id}/views",
+    status_code=status.HTTP_202_ACCEPTED,
+    # Views feed the trending scores: bound what one client can add, per review and overall
+    dependencies=[
+        Depends(limiter.limit("5/minute")),
+        Depends(limiter.limit("60/minute", scope="review_views")),
+    ],
+)
+async def record_view(review_id: UUID, request: Request):
+    """
+    Record a view of a review video; meant to be sent as a beacon by the player.
+
+    The view is buffered and written in a batch, so this never touches the database.
+    Views are rate limited per client IP.
+    """
+    event_pipeline.track(EventType.VIEW, request, review_id=review_id)
+    return Response(status_code=status.HTTP_202_ACCEPTED)
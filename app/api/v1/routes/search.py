@@ -0,0 +1,43 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
+
+from app.api.dependencies.response import success_response
+from app.schemas.enums import SearchKind
+from app.schemas.pagination import Page
+from app.schemas.search import SearchHit
+from app.services.search import search_service
+from app.utils.limiter import limiter
+
+
+search_router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@search_router.get("", dependencies=[Depends(limiter.limit("60/minute"))])
+async def search(
+    q: str = Query(min_length=1, max_length=200, description="Words to search for; each matches as a prefix"),
+    kind: SearchKind = SearchKind.REVIEW,
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    limit: int = Query(default=20, ge=1, le=50),
+):
+    """
+    Search published reviews or products, best match first with newer content favoured.
+
+    Args:
+        q (str): The search box text.
+        kind (SearchKind): Whether to search reviews or products.
+        cursor (Optional[str]): Opaque cursor from the previous page.
+        limit (int): Page size.
+
+    Returns:
+        Page[SearchHit]: The hits and the cursor for the next page.
+
+    Raises:
+        BadRequestError: If the query has no words or the cursor is malformed.
+    """
+    hits, next_cursor = await search_service.search(kind, q, limit=limit, cursor=cursor)
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="Search results retrieved",
+        data=Page[SearchHit](items=hits, next_cursor=next_cursor),
+    )
@@ -0,0 +1,123 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, Request, Response, status
+
+from app.api.dependencies.response import success_response
+from app.db.session import AsyncSessionDep
+from app.schemas.upload import UploadCreate, UploadStatus
+from app.schemas.user import Principal
+from app.services.upload import upload_service
+from app.services.user import user_service
+
+
+upload_router = APIRouter(prefix="/uploads", tags=["Uploads"])
+
+
+def upload_headers(status_data: UploadStatus) -> dict:
+    return {
+        "Upload-Offset": str(status_data.upload_offset),
+        "Upload-Length": str(status_data.upload_length),
+        "Cache-Control": "no-store",
+    }
+
+
+@upload_router.post("", status_code=status.HTTP_201_CREATED)
+async def create_upload(
+    upload_data: UploadCreate,
+    db: AsyncSessionDep,
+    current_user: Principal = Depends(user_service.get_current_user),
+):
+    """
+    Start a resumable video upload.
+
+    Args:
+        upload_data (UploadCreate): Review details and total file size.
+        db (AsyncSession): Database session.
+        current_user (Principal): The currently authenticated user.
+
+    Returns:
+        UploadStatus: The new upload; send the file to its PATCH endpoint.
+    """
+    review = await upload_service.create_upload(
+        creator_id=current_user.uuid, data=upload_data, session=db
+    )
+    upload = UploadStatus.model_validate(review)
+
+    response = success_response(
+        status_code=status.HTTP_201_CREATED,
+        message="Upload created",
+        data=upload,
+    )
+    response.headers.update(upload_headers(upload))
+    response.headers["Location"] = f"/api/v1/uploads/{review.uuid}"
+    return response
+
+
+@upload_router.head("/{upload_id}")
+async def get_upload_offset(
+    upload_id: UUID,
+    db: AsyncSessionDep,
+    current_user: Principal = Depends(user_service.get_current_user),
+):
+    """Return the current offset of an upload in the Upload-Offset header."""
+    review = await upload_service.get_upload(upload_id, creator_id=current_user.uuid, session=db)
+    return Response(
+        status_code=status.HTTP_200_OK,
+        headers=upload_headers(UploadStatus.model_validate(review)),
+    )
+
+
+@upload_router.get("/{upload_id}")
+async def get_upload(
+    upload_id: UUID,
+    db: AsyncSessionDep,
+    current_user: Principal = Depends(user_service.get_current_user),
+):
+    """Return the progress of an upload."""
+    review = await upload_service.get_upload(upload_id, creator_id=current_user.uuid, session=db)
+    upload = UploadStatus.model_validate(review)
+
+    response = success_response(
+        status_code=status.HTTP_200_OK,
+        message="Upload status retrieved",
+        data=upload,
+    )
+    response.headers.update(upload_headers(upload))
+    return response
+
+
+@upload_router.patch("/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def upload_chunk(
+    upload_id: UUID,
+    request: Request,
+    db: AsyncSessionDep,
+    upload_offset: int = Header(alias="Upload-Offset", ge=0),
+    current_user: Principal = Depends(user_service.get_current_user),
+):
+    """
+    Append a chunk to an upload.
+
+    The body is either raw bytes (application/offset+octet-stream) or a
+    multipart form with a single file part. It is streamed straight to storage.
+
+    Args:
+        upload_id (UUID): The upload to append to.
+        request (Request): The HTTP request carrying the chunk.
+        db (AsyncSession): Database session.
+        upload_offset (int): Byte offset the chunk starts at; must match the server's.
+        current_user (Principal): The currently authenticated user.
+
+    Returns:
+        Response: 204 with the new Upload-Offset header.
+    """
+    review = await upload_service.write_chunk(
+        upload_id,
+        creator_id=current_user.uuid,
+        offset=upload_offset,
+        request=request,
+        session=db,
+    )
+    return Response(
+        status_code=status.HTTP_204_NO_CONTENT,
+        headers=upload_headers(UploadStatus.model_validate(review)),
+    )
@@ -1,22 +1,38 @@
-from typing import Annotated, Optional, Union
+from typing import Annotated, List, Optional, Union
+from uuid import UUID
 
 from fastapi import APIRouter, Body, Depends, Query, Request, status
-from fastapi.encoders import jsonable_encoder
 from sqlmodel import Session
 
 from app.db.session import SessionDep
+from app.api.dependencies.custom_exception import BadRequestError, NotFoundError
 from app.api.dependencies.response import error_response, success_response
-from app.db.models import User
+from app.schemas.user import Principal, UserSummary
 from app.services.user import user_service
 
 user_router = APIRouter(prefix="/users", tags=["users"])
 
+MAX_BATCH_IDS = 100
+
+
+def parse_user_ids(ids: str) -> List[UUID]:
+    """Parse a comma-separated list of user ids."""
+    try:
+        user_ids = [UUID(user_id.strip()) for user_id in ids.split(",") if user_id.strip()]
+    except ValueError:
+        raise BadRequestError("ids must be comma-separated user ids")
+    if not user_ids:
+        raise BadRequestError("ids must contain at least one user id")
+    if len(user_ids) > MAX_BATCH_IDS:
+        raise BadRequestError(f"At most {MAX_BATCH_IDS} user ids can be requested at once")
+    return user_ids
+
 
 @user_router.get("/me")
 def get_current_user_details(
     request: Request,
-    db: Session = SessionDep,
-    current_user: User = Depends(user_service.get_current_user),
+    db: SessionDep,
+    current_user: Principal = Depends(user_service.get_current_user),
 ):
     """
     Get current user details.
@@ -24,7 +40,7 @@ def get_current_user_details(
     Args:
         request (Request): The HTTP request.
         db (Session): Database session.
-        current_user (User): The currently authenticated user.
+        current_user (Principal): The currently authenticated user.
 
     Returns:
         CurrentUserDetailResponse: The current user's details.
@@ -32,71 +48,75 @@ def get_current_user_details(
     return success_response(
         status_code=status.HTTP_200_OK,
         message="User details retrieved successfully",
-        data=jsonable_encoder(
-            current_user,
-            exclude=[
-                "password",
-                "is_deleted",
-                "updated_at",
-            ],
-        ),
+        data=current_user.model_dump(exclude={"is_deleted"}),
     )
 
 
-@user_router.delete("/me", status_code=status.HTTP_200_OK)
-async def delete_account(
-    request: Request,
-    db: Session = SessionDep,
-    current_user: User = Depends(user_service.get_current_user),
+@user_router.get("")
+def get_users_by_ids(
+    db: SessionDep,
+    ids: str = Query(min_length=1, description=f"Comma-separated user ids, at most {MAX_BATCH_IDS}"),
+    current_user: Principal = Depends(user_service.get_current_user),
 ):
     """
-    Delete current user account.
+    Get several users at once, e.g. the authors of a list of reviews.
+
+    Two queries whatever the number of ids: the users, then their profiles.
 
     Args:
-        request (Request): The HTTP request.
         db (Session): Database session.
-        current_user (User): The currently authenticated user.
+        ids (str): Comma-separated ids of the users to retrieve.
+        current_user (Principal): The currently authenticated user.
 
     Returns:
-        StandardResponse: Success message.
-    """
-    # Delete current user
-    # user_service.delete(db=db)
+        List[UserSummary]: The users in the order asked for; unknown ids are left out.
 
+    Raises:
+        BadRequestError: If an id is malformed or too many are asked for.
+    """
+    users = user_service.get_users_by_ids(parse_user_ids(ids), session=db)
     return success_response(
         status_code=status.HTTP_200_OK,
-        message="User deleted successfully",
+        message="Users retrieved successfully",
+        data=[UserSummary.model_validate(user) for user in users],
     )
 
 
-
-@user_router.get(
-    "/{user_id}"
-)
+@user_router.get("/{user_id}")
 def get_user_by_id(
-    user_id: str,
-    db: Session = SessionDep,
-    current_user: User = Depends(user_service.get_current_user),
+    user_id: UUID,
+    db: SessionDep,
+    current_user: Principal = Depends(user_service.get_current_user),
 ):
     """
     Get a user by ID.
 
     Args:
-        user_id (str): The ID of the user to retrieve.
+        user_id (UUID): The ID of the user to retrieve.
         db (Session): Database session.
-        current_user (User): The currently authenticated user.
+        current_user (Principal): The currently authenticated user.
 
     Returns:
-        UserDetailResponse: The user details.
+        UserSummary: The user details.
+
+    Raises:
+        NotFoundError: If there is no such user.
     """
-    return user_service.get_user_by_id(session=db, user_id=user_id)
+    users = user_service.get_users_by_ids([user_id], session=db)
+    if not users:
+        raise NotFoundError("User not found")
+    return success_response(
+        status_code=status.HTTP_200_OK,
+        message="User retrieved successfully",
+        data=UserSummary.model_validate(users[0]),
+    )
 
 
 # @user_router.patch("/me/password", status_code=status.HTTP_200_OK)
 # def change_password(
 #     request: ChangePasswordSchema,
 #     db: Session = Depends(get_db),
-#     current_user: User = Depends(user_service.get_current_user),
+#     current_user: Principal = Depends(user_service.get_current_user),
 # ):
 #     """
 #     Change current user's password.
@@ -104,7 +124,7 @@ def get_user_by_id(
 #     Args:
 #         request (ChangePasswordSchema): Password change data.
 #         db (Session): Database session.
-#         current_user (User): The currently authenticated user.
+#         current_user (Principal): The currently authenticated user.
 
 #     Returns:
 #         StandardResponse: Success message.
@@ -0,0 +1,121 @@
+"""
+Management commands, e.g. ``python -m app.cli import-products feed.csv --merchant acme``.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.core.config import Config
+from app.db.base_model import utcnow
+from app.services.catalog import FEED_FORMATS, ImportReport, catalog_importer
+from app.services.ledger import commission_ledger
+from app.services.payouts import create_payout_runner
+from app.services.rollup import rollup_aggregator
+from app.services.trending import trending_ranker
+from app.services.verification import purchase_matcher
+from app.utils.logger import log_pipeline
+
+
+def import_products(args: argparse.Namespace) -> None:
+    def print_progress(report: ImportReport) -> None:
+        print(
+            f"\r{report.percent:5.1f}%  {report.rows_read} rows  "
+            f"{report.rows_read / max(report.elapsed_seconds, 1e-9):,.0f} rows/s",
+            end="",
+            file=sys.stderr,
+        )
+
+    report = catalog_importer.import_file(
+        Path(args.path), merchant=args.merchant, feed_format=args.format, on_progress=print_progress
+    )
+    print(file=sys.stderr)
+    print(
+        f"Read {report.rows_read} rows in {report.elapsed_seconds:.1f}s: "
+        f"{report.rows_inserted} inserted, {report.rows_updated} updated, {report.rows_invalid} invalid"
+    )
+    for error in report.errors:
+        print(f"  line {error['line']}: {'; '.join(error['errors'])}")
+
+
+def parse_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def settle_commissions(args: argparse.Namespace) -> None:
+    report = commission_ledger.settle(args.since, args.until or utcnow())
+    print(report.model_dump_json(indent=2))
+
+
+def repeat(task, every) -> None:
+    while True:
+        task()
+        if not every:
+            break
+        time.sleep(every)
+
+
+def rollup_engagement(args: argparse.Namespace) -> None:
+    repeat(rollup_aggregator.run, args.every)
+
+
+def rank_trending(args: argparse.Namespace) -> None:
+    repeat(trending_ranker.run, args.every)
+
+
+def match_purchases(args: argparse.Namespace) -> None:
+    repeat(purchase_matcher.run, args.every)
+
+
+def run_payouts(args: argparse.Namespace) -> None:
+    report = asyncio.run(create_payout_runner().run())
+    print(report.model_dump_json(indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    products = commands.add_parser("import-products", help="Import a merchant product feed")
+    products.add_argument("path", help="CSV (with a header row) or JSONL feed")
+    products.add_argument("--merchant", required=True)
+    products.add_argument("--format", choices=FEED_FORMATS, help="Defaults to the file extension")
+    products.set_defaults(handler=import_products)
+
+    settle = commands.add_parser("settle-commissions", help="Split unsettled conversions into the commission ledger")
+    settle.add_argument("--since", type=parse_datetime, default=datetime.min.replace(tzinfo=timezone.utc),
+                        help="Window start (ISO 8601, UTC unless given); defaults to the beginning of time")
+    settle.add_argument("--until", type=parse_datetime, help="Window end (exclusive); defaults to now")
+    settle.set_defaults(handler=settle_commissions)
+
+    rollup = commands.add_parser("rollup-engagement", help="Fold new engagement into the dashboard rollups")
+    rollup.add_argument("--every", type=int, metavar="SECONDS",
+                        help=f"Keep running, once per interval (e.g. {Config.ROLLUP_INTERVAL})")
+    rollup.set_defaults(handler=rollup_engagement)
+
+    trending = commands.add_parser("rank-trending", help="Recompute the trending review rankings")
+    trending.add_argument("--every", type=int, metavar="SECONDS",
+                          help=f"Keep running, once per interval (e.g. {Config.TRENDING_INTERVAL})")
+    trending.set_defaults(handler=rank_trending)
+
+    purchases = commands.add_parser("match-purchases", help="Mark reviews whose creator bought the product as verified")
+    purchases.add_argument("--every", type=float, metavar="SECONDS",
+                           help=f"Keep running, once per interval (e.g. {Config.PURCHASE_MATCH_INTERVAL})")
+    purchases.set_defaults(handler=match_purchases)
+
+    payouts = commands.add_parser("run-payouts", help="Pay out creator balances above the payout minimum")
+    payouts.set_defaults(handler=run_payouts)
+
+    args = parser.parse_args()
+    try:
+        args.handler(args)
+    finally:
+        log_pipeline.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+from decimal import Decimal
+from typing import Optional
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 from decouple import config
@@ -27,6 +29,9 @@ class Settings(BaseSettings):
     DB_HOST: str
     DB_PORT: int
     DB_TYPE: str
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_PREWARM: int = 5  # Connections opened per pool before the worker reports ready
     
     # Security settings
     ALGORITHM: str
@@ -35,10 +40,24 @@ class Settings(BaseSettings):
     ACCESS_SECRET_KEY: str
     REFRESH_SECRET_KEY: str
     
+    # Password hashing settings
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 0  # 0 means one worker per CPU core
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    
     # OAuth configuration
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
     GOOGLE_REDIRECT_URI: str
+    GOOGLE_TOKEN_URL: str = "https://oauth2.googleapis.com/token"
+    GOOGLE_DISCOVERY_URL: str = "https://accounts.google.com/.well-known/openid-configuration"
+    GOOGLE_JWKS_URL: Optional[str] = None  # Overrides the discovery jwks_uri, e.g. file:// fixture
+    
+    # Outbound HTTP client settings
+    HTTP_CLIENT_TIMEOUT: float = 5.0
+    HTTP_CLIENT_MAX_RETRIES: int = 2
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE: int = 20
     
     
     MAIL_FROM_NAME: str
@@ -51,6 +70,91 @@ class Settings(BaseSettings):
     # Redis configuration
     REDIS_URL: str
     
+    # Video uploads
+    UPLOAD_DIR: str = "uploads"
+    MAX_UPLOAD_SIZE: int = 2 * 1024 ** 3
+    UPLOAD_LOCK_TTL: int = 300
+    
+    # Background jobs - JOB_WORKER_PROCESSES=0 uses one process per CPU core
+    JOB_WORKER_PROCESSES: int = 0
+    JOB_POLL_INTERVAL: float = 1.0
+    JOB_VISIBILITY_TIMEOUT: int = 300
+    JOB_RETRY_BASE_DELAY: int = 10
+    FFMPEG_BINARY: str = "ffmpeg"
+    FFPROBE_BINARY: str = "ffprobe"
+    
+    # Product catalog imports
+    PRODUCT_IMPORT_BATCH_SIZE: int = 5000
+    
+    # Affiliate short links
+    SHORT_LINK_BASE_URL: str = "https://api.vidkarma.ad/r"
+    SHORT_LINK_CACHE_TTL: int = 86400
+    SHORT_LINK_NEGATIVE_CACHE_TTL: int = 60
+    SHORT_LINK_LOCAL_CACHE_TTL: int = 60
+    SHORT_LINK_LOCAL_CACHE_SIZE: int = 100_000
+    
+    # Click/view event ingestion
+    EVENT_BUFFER_SIZE: int = 100_000
+    EVENT_BATCH_SIZE: int = 5000
+    EVENT_FLUSH_INTERVAL: float = 1.0
+    EVENT_SPOOL_DIR: str = "spool/events"
+    
+    # Commission settlement - creators get this share of each commission
+    CREATOR_COMMISSION_SHARE: Decimal = Decimal("0.70")
+    SETTLEMENT_CHUNK_SIZE: int = 10_000
+    
+    # Creator payouts - balances below the minimum roll over to the next run.
+    # No default provider: "fake" (which pays nothing) is only accepted in dev/test.
+    PAYOUT_PROVIDER: Optional[str] = None
+    PAYOUT_MINIMUM: Decimal = Decimal("10.00")
+    PAYOUT_CHUNK_SIZE: int = 500
+    PAYOUT_CONCURRENCY: int = 20
+    PAYOUT_LEASE_SECONDS: int = 300
+    PAYOUT_RETRY_DELAY: int = 600
+    
+    # Dashboard rollups - conversions/commissions younger than the lag wait for the next run
+    ROLLUP_SAFETY_LAG: int = 60
+    ROLLUP_INTERVAL: int = 60
+    # Earnings on dashboards are totalled in this currency only
+    DEFAULT_CURRENCY: str = "USD"
+    
+    # Verified purchases - conversions/reviews younger than the lag wait for the next run;
+    # a sweep of all unverified reviews every SWEEP_INTERVAL seconds catches late commits
+    PURCHASE_MATCH_LAG: int = 2
+    PURCHASE_MATCH_INTERVAL: int = 5
+    PURCHASE_MATCH_SWEEP_INTERVAL: int = 3600
+    
+    # Trending reviews - engagement in the window counts half every half-life
+    TRENDING_WINDOW_HOURS: int = 72
+    TRENDING_HALF_LIFE_HOURS: float = 12.0
+    TRENDING_TOP_K: int = 500
+    TRENDING_INTERVAL: int = 300
+    # Views of pseudo-evidence pulling a review's click-through rate towards the average
+    TRENDING_PRIOR_VIEWS: float = 100.0
+    
+    # Search backend - either "postgres" or "memory" (in-process index, for tests)
+    SEARCH_BACKEND: str = "postgres"
+    # Age at which a search result's relevance counts half
+    SEARCH_RECENCY_HALF_LIFE_DAYS: float = 30.0
+    
+    # Rate limiting backend - either "redis" or "memory"
+    RATE_LIMIT_BACKEND: str = "redis"
+    
+    # Authenticated principal cache
+    PRINCIPAL_CACHE_TTL: int = 300
+    PRINCIPAL_LOCAL_CACHE_TTL: int = 15
+    PRINCIPAL_LOCAL_CACHE_SIZE: int = 10_000
+    
+    # Public creator profile cache
+    CREATOR_CACHE_TTL: int = 300
+    CREATOR_NEGATIVE_CACHE_TTL: int = 30
+    CREATOR_LOCAL_CACHE_TTL: int = 10
+    CREATOR_LOCAL_CACHE_SIZE: int = 10_000
+    
+    # Refresh token revocation filter
+    REVOCATION_FILTER_CAPACITY: int = 1_000_000
+    REVOCATION_FILTER_REBUILD_SECONDS: int = 3600
+    
     @property
     def frontend_url(self) -> str:
         """
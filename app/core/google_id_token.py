@@ -0,0 +1,201 @@
+import asyncio
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+from jose import ExpiredSignatureError, JWTError, jwt
+
+from app.api.dependencies.custom_exception import OauthError, ServiceUnavailableError
+from app.utils.http_client import HTTPClient, http_client
+from app.utils.logger import get_logger
+from .config import Config
+
+
+logger = get_logger(__name__)
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+DEFAULT_MAX_AGE = 3600
+MIN_FORCED_REFRESH_INTERVAL = 30
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+# Ways fetching or parsing the discovery document or JWKS can fail
+REFRESH_ERRORS = (httpx.HTTPError, OSError, ValueError, KeyError)
+
+
+def parse_max_age(cache_control: Optional[str], default: int = DEFAULT_MAX_AGE) -> int:
+    """Extract max-age (in seconds) from a Cache-Control header."""
+    if not cache_control:
+        return default
+    match = MAX_AGE_PATTERN.search(cache_control)
+    return int(match.group(1)) if match else default
+
+
+class GoogleKeyStore:
+    """In-process cache of Google's OpenID discovery document and signing keys (JWKS).
+
+    Both documents are cached for as long as their Cache-Control max-age allows and
+    refreshed by a background task shortly before they expire. A token signed with an
+    unknown ``kid`` triggers an immediate (rate-limited) refetch to pick up rotated keys.
+    ``discovery_url`` and ``jwks_url`` may be ``file://`` URLs pointing at local fixtures.
+    """
+
+    def __init__(self, client: HTTPClient, discovery_url: str, jwks_url: Optional[str] = None):
+        self.client = client
+        self.discovery_url = discovery_url
+        self.jwks_url = jwks_url
+        self.discovery: Dict[str, Any] = {}
+        self.keys: Dict[str, Dict[str, Any]] = {}
+        self._discovery_expires_at = 0.0
+        self._keys_expires_at = 0.0
+        self._last_forced_refresh = 0.0
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def _fetch_json(self, url: str) -> tuple[Dict[str, Any], int]:
+        parsed = urlparse(url)
+        if parsed.scheme == "file":
+            return json.loads(Path(parsed.path).read_text()), DEFAULT_MAX_AGE
+
+        response = await self.client.get(url)
+        response.raise_for_status()
+        return response.json(), parse_max_age(response.headers.get("cache-control"))
+
+    async def refresh(self, force: bool = False) -> None:
+        """Refetch discovery metadata and keys if they have expired (or when forced)."""
+        async with self._lock:
+            now = time.monotonic()
+
+            if not self.jwks_url and (force or now >= self._discovery_expires_at):
+                self.discovery, max_age = await self._fetch_json(self.discovery_url)
+                self._discovery_expires_at = now + max_age
+
+            if force or now >= self._keys_expires_at:
+                jwks_url = self.jwks_url or self.discovery["jwks_uri"]
+                jwks, max_age = await self._fetch_json(jwks_url)
+                self.keys = {key["kid"]: key for key in jwks.get("keys", [])}
+                self._keys_expires_at = now + max_age
+                logger.info(f"Loaded {len(self.keys)} Google signing keys (max-age {max_age}s)")
+
+    async def get_key(self, kid: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the JWK for ``kid``, refetching once if it is unknown or the cache is stale.
+
+        If Google can't be reached, keys already cached keep being served.
+
+        Raises:
+            ServiceUnavailableError: If a refetch failed and no cached key matches ``kid``.
+        """
+        refresh_failed = False
+        if time.monotonic() >= self._keys_expires_at:
+            refresh_failed = not await self._try_refresh()
+
+        key = self.keys.get(kid)
+        if key is None and time.monotonic() - self._last_forced_refresh >= MIN_FORCED_REFRESH_INTERVAL:
+            self._last_forced_refresh = time.monotonic()
+            refresh_failed = not await self._try_refresh(force=True)
+            key = self.keys.get(kid)
+        if key is None and refresh_failed:
+            raise ServiceUnavailableError("Google sign-in is temporarily unavailable")
+        return key
+
+    async def _try_refresh(self, force: bool = False) -> bool:
+        try:
+            await self.refresh(force=force)
+        except REFRESH_ERRORS as e:
+            logger.warning(f"Google JWKS refresh failed, serving {len(self.keys)} cached keys: {e}")
+            return False
+        return True
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            delay = max(self._keys_expires_at - time.monotonic() - 60, MIN_FORCED_REFRESH_INTERVAL)
+            await asyncio.sleep(delay)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Background Google JWKS refresh failed: {e}")
+
+    async def start(self) -> None:
+        """Load the keys and start the background refresh task."""
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"Initial Google JWKS fetch failed, will retry on demand: {e}")
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class GoogleIdTokenVerifier:
+    """Verifies Google id_tokens locally against the cached signing keys."""
+
+    def __init__(self, key_store: GoogleKeyStore, client_id: str):
+        self.key_store = key_store
+        self.client_id = client_id
+
+    async def verify(self, id_token: str, access_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Validate an id_token's signature, audience, issuer and expiry.
+
+        Args:
+            id_token: The id_token issued by Google.
+            access_token: Access token issued alongside it, used to check ``at_hash``.
+
+        Returns:
+            dict: The verified token claims.
+
+        Raises:
+            OauthError: If the token is invalid.
+            ServiceUnavailableError: If Google's keys can't be fetched.
+        """
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except JWTError:
+            raise OauthError(message="Google Authentication failed", errors={"error": "Invalid ID token"})
+
+        key = await self.key_store.get_key(header.get("kid", ""))
+        if key is None:
+            raise OauthError(message="Google Authentication failed", errors={"error": "Unknown signing key"})
+
+        try:
+            claims = jwt.decode(
+                id_token,
+                key,
+                algorithms=[key.get("alg", "RS256")],
+                audience=self.client_id,
+                access_token=access_token,
+                options={"verify_at_hash": access_token is not None},
+            )
+        except ExpiredSignatureError:
+            raise OauthError(message="Google Authentication failed", errors={"error": "ID token has expired"})
+        except JWTError:
+            raise OauthError(message="Google Authentication failed", errors={"error": "Invalid ID token"})
+
+        if claims.get("iss") not in GOOGLE_ISSUERS:
+            raise OauthError(message="Google Authentication failed", errors={"error": "Invalid token issuer"})
+
+        return claims
+
+
+google_key_store = GoogleKeyStore(
+    client=http_client,
+    discovery_url=Config.GOOGLE_DISCOVERY_URL,
+    jwks_url=Config.GOOGLE_JWKS_URL,
+)
+google_id_token_verifier = GoogleIdTokenVerifier(
+    key_store=google_key_store,
+    client_id=Config.GOOGLE_CLIENT_ID,
+)
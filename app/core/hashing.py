@@ -0,0 +1,107 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+
+from app.api.dependencies.custom_exception import ServiceUnavailableError
+from app.utils.metrics import (
+    password_hash_duration_seconds,
+    password_hash_pending,
+    password_hash_rejected_total,
+)
+from .config import Config
+
+
+@lru_cache(maxsize=4)
+def _get_context(rounds: int) -> CryptContext:
+    """Build (once per worker process) the bcrypt context for a given cost."""
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+def _warm(rounds: int) -> None:
+    _get_context(rounds)
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _get_context(rounds).hash(password)
+
+
+def _verify_and_update(password: str, hashed_password: str, rounds: int) -> Tuple[bool, Optional[str]]:
+    return _get_context(rounds).verify_and_update(password, hashed_password)
+
+
+class PasswordHasher:
+    """Runs bcrypt in a bounded process pool so hashing never blocks the event loop."""
+
+    def __init__(self, rounds: int, max_workers: int, max_pending: int):
+        self.rounds = rounds
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of hashing jobs queued or running in the pool."""
+        return self._pending
+
+    def start(self) -> None:
+        """Start the worker processes and warm them up."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            for _ in range(self.max_workers):
+                self._executor.submit(_warm, self.rounds)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def _submit(self, operation: str, fn, *args):
+        if self._pending >= self.max_pending:
+            password_hash_rejected_total.inc()
+            raise ServiceUnavailableError(
+                "Server is busy, please try again shortly.",
+                errors={"error": "Password hashing queue is full"},
+            )
+        self.start()
+        self._pending += 1
+        password_hash_pending.set(value=self._pending)
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+            password_hash_pending.set(value=self._pending)
+            password_hash_duration_seconds.observe(operation, value=time.perf_counter() - start)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password in the pool."""
+        return await self._submit("hash", _hash, password, self.rounds)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify a password in the pool.
+
+        Returns (valid, new_hash); new_hash is set when the stored hash was made
+        with a different cost than the configured one and should be replaced.
+        """
+        return await self._submit("verify", _verify_and_update, password, hashed_password, self.rounds)
+
+    def hash_sync(self, password: str) -> str:
+        return _hash(password, self.rounds)
+
+    def verify_sync(self, password: str, hashed_password: str) -> bool:
+        return _get_context(self.rounds).verify(password, hashed_password)
+
+
+password_hasher = PasswordHasher(
+    rounds=Config.BCRYPT_ROUNDS,
+    max_workers=Config.PASSWORD_HASH_WORKERS,
+    max_pending=Config.PASSWORD_HASH_MAX_PENDING,
+)
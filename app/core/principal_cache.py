@@ -0,0 +1,112 @@
+import asyncio
+from typing import Optional, Set, Union
+from uuid import UUID
+
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy import event
+
+from app.db.base_model import now_and_after_commit, on_update
+from app.db.models import User
+from app.schemas.user import Principal
+from app.utils.cache import TTLCache
+from app.utils.logger import get_logger
+from app.utils.redis_client import InstrumentedAsyncRedis, delete_keys
+from .config import Config
+from .security import security
+
+
+logger = get_logger(__name__)
+
+
+class PrincipalCache:
+    """Two-tier cache of authenticated principals keyed by user uuid.
+
+    A short-lived in-process LRU absorbs repeated lookups within a worker, and a
+    shared Redis tier lets every worker skip the database. The local TTL bounds how
+    long another worker may serve a principal after it was invalidated.
+    """
+
+    KEY_PREFIX = "principal:"
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        async_redis_client: aioredis.Redis,
+        ttl: int,
+        local_ttl: int,
+        local_max_size: int,
+    ):
+        self.redis_client = redis_client
+        self.async_redis_client = async_redis_client
+        self.ttl = ttl
+        self.local = TTLCache[Principal](max_size=local_max_size, ttl=local_ttl)
+        # Redis deletes still in flight on the event loop
+        self._pending: Set[asyncio.Task] = set()
+
+    def _key(self, user_id: Union[UUID, str]) -> str:
+        return f"{self.KEY_PREFIX}{user_id}"
+
+    def get(self, user_id: Union[UUID, str]) -> Optional[Principal]:
+        """Return the cached principal, or None on a miss in both tiers."""
+        key = str(user_id)
+        principal = self.local.get(key)
+        if principal is not None:
+            return principal
+
+        try:
+            raw = self.redis_client.get(self._key(key))
+        except redis.RedisError as e:
+            logger.warning(f"Principal cache read failed: {e}")
+            return None
+
+        if raw is None:
+            return None
+        principal = Principal.model_validate_json(raw)
+        self.local.set(key, principal)
+        return principal
+
+    def set(self, principal: Principal) -> None:
+        """Store a principal in both tiers."""
+        key = str(principal.uuid)
+        self.local.set(key, principal)
+        try:
+            self.redis_client.setex(self._key(key), self.ttl, principal.model_dump_json())
+        except redis.RedisError as e:
+            logger.warning(f"Principal cache write failed: {e}")
+
+    def invalidate(self, user_id: Union[UUID, str]) -> None:
+        """Drop a principal from the local tier now, and from Redis (see ``delete_keys``)."""
+        key = str(user_id)
+        self.local.pop(key)
+        task = delete_keys(self.redis_client, self.async_redis_client, self._key(key))
+        if task is not None:
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def close(self) -> None:
+        """Finish pending invalidations and close the async Redis client's connections."""
+        await asyncio.gather(*self._pending)
+        await self.async_redis_client.aclose()
+
+
+principal_cache = PrincipalCache(
+    redis_client=security.redis_client,
+    async_redis_client=InstrumentedAsyncRedis.from_url(Config.REDIS_URL, decode_responses=True),
+    ttl=Config.PRINCIPAL_CACHE_TTL,
+    local_ttl=Config.PRINCIPAL_LOCAL_CACHE_TTL,
+    local_max_size=Config.PRINCIPAL_LOCAL_CACHE_SIZE,
+)
+
+
+@on_update(User)
+def invalidate_principal(user: User) -> None:
+    """Drop the cached principal of a user being updated."""
+    user_id = user.uuid
+    now_and_after_commit(user, lambda: principal_cache.invalidate(user_id))
+
+
+@event.listens_for(User, "after_delete")
+def drop_principal(mapper, connection, target):
+    user_id = target.uuid
+    now_and_after_commit(target, lambda: principal_cache.invalidate(user_id))
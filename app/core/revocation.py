@@ -0,0 +1,107 @@
+import threading
+import time
+from typing import Optional
+
+import redis
+
+from app.utils.bloom import BloomFilter
+from app.utils.logger import get_logger
+from .config import Config
+
+
+logger = get_logger(__name__)
+
+
+class RefreshTokenRevocationStore:
+    """Tracks revoked refresh-token families.
+
+    Revocations are stored in Redis as one small key per token family, expiring
+    when the family's newest token would have expired anyway. Each worker keeps a
+    Bloom filter of revoked families, kept in sync over pub/sub, so checking a
+    token that was never revoked doesn't touch Redis. Hits in the filter are
+    confirmed against Redis to rule out false positives.
+    """
+
+    KEY_PREFIX = "revoked_family:"
+    CHANNEL = "revoked_families"
+
+    def __init__(self, redis_client: redis.Redis, capacity: int, rebuild_interval: int):
+        self.redis_client = redis_client
+        self.capacity = capacity
+        self.rebuild_interval = rebuild_interval
+        self._bloom = BloomFilter(capacity)
+        self._synced = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _key(self, family_id: str) -> str:
+        return f"{self.KEY_PREFIX}{family_id}"
+
+    def revoke(self, family_id: str, expires_at: int) -> None:
+        """Revoke every refresh token in a family until ``expires_at`` (unix seconds)."""
+        ttl = int(expires_at - time.time())
+        if ttl <= 0:
+            return
+        self.redis_client.set(self._key(family_id), 1, ex=ttl)
+        self._bloom.add(family_id)
+        self.redis_client.publish(self.CHANNEL, family_id)
+
+    def is_revoked(self, family_id: str) -> bool:
+        """Check whether a token family has been revoked."""
+        if self._synced and family_id not in self._bloom:
+            return False
+        return self.redis_client.exists(self._key(family_id)) > 0
+
+    def rebuild(self) -> None:
+        """Rebuild the local filter from Redis, dropping families whose revocation expired."""
+        bloom = BloomFilter(self.capacity)
+        for key in self.redis_client.scan_iter(match=f"{self.KEY_PREFIX}*", count=1000):
+            bloom.add(key[len(self.KEY_PREFIX):])
+        self._bloom = bloom
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.CHANNEL)
+                # Subscribe before scanning so no revocation falls between the two
+                self.rebuild()
+                self._synced = True
+                rebuilt_at = time.monotonic()
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message["type"] == "message":
+                        self._bloom.add(message["data"])
+                    if time.monotonic() - rebuilt_at >= self.rebuild_interval:
+                        self.rebuild()
+                        rebuilt_at = time.monotonic()
+            except redis.RedisError as e:
+                # Until resynced, fall back to asking Redis on every check
+                self._synced = False
+                logger.warning(f"Revocation sync lost, retrying: {e}")
+                self._stop.wait(1.0)
+            finally:
+                pubsub.close()
+
+    def start(self) -> None:
+        """Start syncing the local filter in a background thread."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._listen, name="revocation-sync", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background sync thread."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=5)
+            self._thread = None
+            self._synced = False
+
+
+def create_revocation_store(redis_client: redis.Redis) -> RefreshTokenRevocationStore:
+    return RefreshTokenRevocationStore(
+        redis_client=redis_client,
+        capacity=Config.REVOCATION_FILTER_CAPACITY,
+        rebuild_interval=Config.REVOCATION_FILTER_REBUILD_SECONDS,
+    )
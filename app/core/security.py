@@ -1,16 +1,20 @@
 from datetime import timedelta
 import secrets
-from passlib.context import CryptContext
+from uuid import uuid4
+from typing import Optional, Tuple
 from jose import ExpiredSignatureError, JWTError, jwt
-import redis 
 
 from app.api.dependencies.custom_exception import InvalidTokenError
 from app.schemas.enums import TokenType
 from app.schemas.token import Token, TokenCreate, TokenData, TokenDetails
 
 from .config import Config
+from .hashing import password_hasher
+from .revocation import create_revocation_store
 from app.db.base_model import utcnow
+from app.utils.redis_client import InstrumentedRedis
 
+BASE62_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
 
 
 
@@ -23,13 +27,14 @@ class Security:
         """Initialize the security class with secret keys and password context."""
         self.access_secret_key = Config.APP_SECRET_KEY
         self.refresh_secret_key = Config.REFRESH_SECRET_KEY
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        self.redis_client = redis.Redis.from_url(Config.REDIS_URL, decode_responses=True)
+        self.password_hasher = password_hasher
+        self.redis_client = InstrumentedRedis.from_url(Config.REDIS_URL, decode_responses=True)
+        self.revocation_store = create_revocation_store(self.redis_client)
         
         
     def hash_password(self, password: str) -> str:
         """Hashes a password using bcrypt."""
-        return self.pwd_context.hash(password)
+        return self.password_hasher.hash_sync(password)
     
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
@@ -37,7 +42,26 @@ class Security:
         Returns True if they match, False otherwise.
         """
         
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return self.password_hasher.verify_sync(plain_password, hashed_password)
+    
+    async def hash_password_async(self, password: str) -> str:
+        """Hashes a password using bcrypt in the hashing process pool."""
+        return await self.password_hasher.hash(password)
+    
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verifies a plain password against a hashed password in the hashing process pool."""
+        valid, _ = await self.password_hasher.verify_and_update(plain_password, hashed_password)
+        return valid
+    
+    async def verify_and_update_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verifies a password and returns a replacement hash if the bcrypt cost has changed.
+
+        Returns:
+            tuple: (is_valid, new_hash or None)
+        """
+        return await self.password_hasher.verify_and_update(plain_password, hashed_password)
     
     def create_token(self, token_data: TokenCreate) -> str:
         """Creates a JWT token."""
@@ -56,6 +80,11 @@ class Security:
             "exp": int(expire.timestamp())
         }
 
+        if token_data.token_type == TokenType.REFRESH:
+            # Rotated refresh tokens share a family so they can be revoked together
+            to_encode["jti"] = uuid4().hex
+            to_encode["fid"] = token_data.family_id or uuid4().hex
+
         return jwt.encode(to_encode, secret_key, algorithm=Config.ALGORITHM)
     
     
@@ -73,20 +102,50 @@ class Security:
     
     
     def is_refresh_token_active(self, token: Token) -> bool:
-        """Check if refresh token is valid (not blacklisted).
+        """Check if refresh token is valid (not revoked).
 
         Args:
-            refresh_token: Token to check
+            token: Token to check
 
         Returns:
             bool: True if token is active
         """
-        blacklisted = self.redis_client.get(f"blacklisted_token:{token.token}")
-        return blacklisted is None
+        token_data = self.verify_refresh_token(refresh_token=token)
+        if token_data.family_id is None:
+            # Tokens issued before token families existed
+            return self.redis_client.get(f"blacklisted_token:{token.token}") is None
+        return not self.revocation_store.is_revoked(token_data.family_id)
+    
+    def revoke_refresh_token(self, token: Token) -> None:
+        """Revoke a refresh token and every token rotated from it.
+
+        Args:
+            token: Token to revoke
+        """
+        try:
+            payload = self.decode_token(
+                data=TokenDetails(token=token.token, token_type=TokenType.REFRESH)
+            )
+        except InvalidTokenError:
+            return  # Expired or invalid tokens can't be used anyway
+
+        family_id = payload.get("fid")
+        if family_id is None:
+            self.redis_client.set(
+                f"blacklisted_token:{token.token}", "blacklisted",
+                exat=payload["exp"],
+            )
+            return
+        # A newer token of the family may have been issued up to now and outlive
+        # this one, so the revocation lasts a whole refresh-token lifetime
+        expires_at = utcnow() + timedelta(minutes=Config.REFRESH_TOKEN_EXPIRE_MINUTES)
+        self.revocation_store.revoke(family_id, expires_at=int(expires_at.timestamp()))
     
     def refresh_access_token(self, current_refresh_token: Token)->tuple[str, str]:
         """Generate new access and refresh tokens.
 
+        The new refresh token stays in the family of the one it replaces.
+
         Args:
             current_refresh_token: Valid refresh token
 
@@ -94,16 +153,21 @@ class Security:
             tuple: (new_access_token, new_refresh_token)
 
         Raises:
-            HTTPException: If refresh token is invalid
+            InvalidTokenError: If refresh token is invalid
         """
 
         token = self.verify_refresh_token(refresh_token=current_refresh_token)
 
-        if token:
-            access = self.create_token(token_data=TokenCreate(user_id=token.user_id, token_type=TokenType.access))
-            refresh = self.create_token(token_data=TokenCreate(user_id=token.user_id, token_type=TokenType.REFRESH))
+        access = self.create_token(token_data=TokenCreate(user_id=token.user_id, token_type=TokenType.ACCESS))
+        refresh = self.create_token(
+            token_data=TokenCreate(
+                user_id=token.user_id,
+                token_type=TokenType.REFRESH,
+                family_id=token.family_id,
+            )
+        )
 
-            return access, refresh
+        return access, refresh
     
     
     def verify_refresh_token(self, refresh_token: Token)-> TokenData:
@@ -119,12 +183,16 @@ class Security:
         if user_id is None:
             raise InvalidTokenError()
         
-        return TokenData(user_id=user_id)
+        return TokenData(user_id=user_id, family_id=payload.get("fid"))
     
     def generate_random_hex(self):
         """Generate random hex"""
         return secrets.token_urlsafe(16)
 
+    def generate_short_code(self, length: int = 8) -> str:
+        """Generate a random URL-safe base62 code (62^8 ~ 2e14 possibilities at the default length)."""
+        return "".join(secrets.choice(BASE62_ALPHABET) for _ in range(length))
+
 
 security = Security()
 
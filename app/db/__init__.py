@@ -1,51 +1,171 @@
-# Connection Using SQLModel and Tenacity for retry logic
+# Lazily created SQLModel engines; the app lifespan warms them up before serving
 
-from tenacity import retry, stop_after_attempt, wait_fixed, RetryError
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from tenacity import AsyncRetrying, stop_after_attempt, wait_fixed
 from sqlmodel import create_engine, text
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 
 from app.core.config import Config  # Import your configuration
+from app.utils.logger import get_logger
+from app.utils.metrics import (
+    db_pool_checkout_wait_seconds,
+    db_pool_connections,
+    db_pool_saturation,
+    registry,
+)
+
 
+logger = get_logger(__name__)
 
 DATABASE_URL = f"{Config.DB_TYPE}+psycopg2://{Config.DB_USER}:{Config.DB_PASSWORD}@{Config.DB_HOST}:{Config.DB_PORT}/{Config.DB_NAME}"
-engine = None  # Global placeholder
+ASYNC_DATABASE_URL = f"{Config.DB_TYPE}+asyncpg://{Config.DB_USER}:{Config.DB_PASSWORD}@{Config.DB_HOST}:{Config.DB_PORT}/{Config.DB_NAME}"
 
+POOL_OPTIONS = dict(
+    echo=False,               # Disable verbose SQL logging in prod
+    pool_size=Config.DB_POOL_SIZE,
+    max_overflow=Config.DB_MAX_OVERFLOW,
+    pool_timeout=30,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+)
 
-@retry(stop=stop_after_attempt(5), wait=wait_fixed(2))
-def connect_to_database():
-    global engine
-    try:
-        engine = create_engine(
-            DATABASE_URL,
-            echo=False,               # Disable verbose SQL logging in prod
-            pool_size=10,
-            max_overflow=20,
-            pool_timeout=30,
-            pool_recycle=1800,
-            future=True
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a connection."""
+
+    metrics_label = "sync"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_wait_seconds.observe(self.metrics_label, value=time.perf_counter() - start)
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    metrics_label = "async"
+
+
+# SQLAlchemy names pool loggers after the pool class, which puts these under
+# this module's INFO handlers; keep routine dispose/recreate messages out
+for pool_class in (InstrumentedQueuePool, InstrumentedAsyncQueuePool):
+    logging.getLogger(f"{pool_class.__module__}.{pool_class.__name__}").setLevel(logging.WARNING)
+
+
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+
+
+def get_engine() -> Engine:
+    """Return the sync engine (used by sync routes, scripts and Alembic), creating it on first use."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            DATABASE_URL, future=True, poolclass=InstrumentedQueuePool, **POOL_OPTIONS
         )
-        
-        # Force connection to verify success
-        with engine.connect() as conn:
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the async engine used by async request handlers, creating it on first use."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL, poolclass=InstrumentedAsyncQueuePool, **POOL_OPTIONS
+        )
+    return _async_engine
+
+
+def _prewarm_sync(count: int) -> None:
+    connections = []
+    try:
+        for _ in range(count):
+            conn = get_engine().connect()
+            connections.append(conn)
             conn.execute(text("SELECT 1"))
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+async def _prewarm_async(count: int) -> None:
+    async def open_connection():
+        conn = await get_async_engine().connect()
+        try:
+            await conn.execute(text("SELECT 1"))
+        except BaseException:
+            await conn.close()
+            raise
+        return conn
+
+    # Let every attempt finish, so the connections that did open can be closed
+    results = await asyncio.gather(*(open_connection() for _ in range(count)), return_exceptions=True)
+    for result in results:
+        if not isinstance(result, BaseException):
+            await result.close()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+async def init_db(prewarm: int = Config.DB_POOL_PREWARM) -> None:
+    """Create both engines and fill their pools with ``prewarm`` open connections.
+
+    Retries while the database is unreachable and raises if it never comes up,
+    so a worker never reports ready without a working pool.
+    """
+    async for attempt in AsyncRetrying(stop=stop_after_attempt(5), wait=wait_fixed(2), reraise=True):
+        with attempt:
+            await _prewarm_async(prewarm)
+            await asyncio.to_thread(_prewarm_sync, prewarm)
+    logger.info(f"Connected to the database, {prewarm} pooled connections warmed up.")
+
+
+async def close_db() -> None:
+    """Close every pooled connection."""
+    global _engine, _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
+
+
+def _stats(pool) -> Dict[str, Any]:
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
 
-        print("Connected to the database.")
-        return engine
 
-    except OperationalError as oe:
-        print(f"OperationalError: {oe}")
-        raise oe
-    except Exception as e:
-        print(f"Unexpected error: {e}")
-        raise e
+def pool_stats() -> Dict[str, Any]:
+    """Connection pool statistics for each engine that has been created."""
+    stats = {}
+    if _engine is not None:
+        stats["sync"] = _stats(_engine.pool)
+    if _async_engine is not None:
+        stats["async"] = _stats(_async_engine.pool)
+    return stats
 
 
-# Try to connect at module import time
-try:
-    connect_to_database()
-except RetryError:
-    print("Failed to connect to database after multiple attempts.")
-    engine = None
+def collect_pool_metrics() -> None:
+    capacity = Config.DB_POOL_SIZE + Config.DB_MAX_OVERFLOW
+    for label, stats in pool_stats().items():
+        for state in ("checked_in", "checked_out", "overflow"):
+            db_pool_connections.set(label, state, value=stats[state])
+        db_pool_saturation.set(label, value=stats["checked_out"] / capacity)
 
 
+registry.add_collector(collect_pool_metrics)
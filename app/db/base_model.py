@@ -1,10 +1,12 @@
+from collections import defaultdict
 from sqlmodel import SQLModel, Field
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
 
 
-from sqlalchemy import event
+from sqlalchemy import DateTime, event
+from sqlalchemy.orm import object_session
 
 
 
@@ -25,12 +27,14 @@ class BaseModel(SQLModel):
 
     created_at: datetime = Field(
         default_factory=utcnow,
+        sa_type=DateTime(timezone=True),
         nullable=False,
         index=True
     )
 
     updated_at: Optional[datetime] = Field(
         default=None,
+        sa_type=DateTime(timezone=True),
         nullable=True,
         index=True
     )
@@ -42,7 +46,34 @@ class BaseModel(SQLModel):
 
 
 
-# Automatically update `updated_at` on DB-level update
+# Functions called with every instance of a model about to be updated
+update_hooks: Dict[type, List[Callable[[Any], None]]] = defaultdict(list)
+
+
+def on_update(model: type):
+    """Register the decorated function to run, with the instance, before each update of a ``model`` row."""
+    def register(func: Callable[[Any], None]) -> Callable[[Any], None]:
+        update_hooks[model].append(func)
+        return func
+    return register
+
+
+def now_and_after_commit(target: Any, callback: Callable[[], None]) -> None:
+    """
+    Call ``callback`` now, and again once ``target``'s transaction commits.
+
+    For cache invalidation in update hooks: a read between the flush and the
+    commit would otherwise re-cache the old row.
+    """
+    callback()
+    session = object_session(target)
+    if session is not None:
+        event.listen(session, "after_commit", lambda session: callback(), once=True)
+
+
+# Automatically update `updated_at` on DB-level update, then run the model's update hooks
 @event.listens_for(BaseModel, "before_update", propagate=True)
 def update_timestamp(mapper, connection, target):
-    target.updated_at = utcnow()
\ No newline at end of file
+    target.updated_at = utcnow()
+    for hook in update_hooks.get(type(target), ()):
+        hook(target)
\ No newline at end of file
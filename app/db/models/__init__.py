@@ -1,3 +1,11 @@
 # from .post import Post
 from .user import User
-from .profile import UserProfile
\ No newline at end of file
+from .profile import UserProfile
+from .review import Review
+from .job import Job
+from .product import Product
+from .affiliate_link import AffiliateLink
+from .event import Event
+from .commission import CommissionEntry, Conversion, CreatorBalance
+from .rollup import EngagementRollupDaily, EngagementRollupHourly, RollupWatermark
+from .payout import Payout
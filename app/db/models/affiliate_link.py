@@ -0,0 +1,19 @@
+from typing import Optional
+from uuid import UUID
+
+from ..base_model import BaseModel, Field
+
+
+class AffiliateLink(BaseModel, table=True):
+    """A creator's short link to a product; clicks on it earn the creator commission."""
+    __tablename__ = "affiliate_link"
+
+    code: str = Field(index=True, unique=True, nullable=False)
+    creator_id: UUID = Field(foreign_key="user.uuid", index=True, nullable=False)
+    product_id: UUID = Field(foreign_key="product.uuid", index=True, nullable=False)
+    review_id: Optional[UUID] = Field(default=None, foreign_key="review.uuid", nullable=True)
+    target_url: str = Field(nullable=False)
+    is_active: bool = Field(default=True, nullable=False)
+
+    def __repr__(self):
+        return f"<AffiliateLink(code={self.code}, creator_id={self.creator_id}, product_id={self.product_id})>"
@@ -0,0 +1,81 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, Index, Numeric, UniqueConstraint, text
+
+from ..base_model import BaseModel, Field
+
+
+class Conversion(BaseModel, table=True):
+    """A sale a merchant attributed to one of our affiliate links."""
+    __table_args__ = (
+        # Merchants may report an order more than once
+        UniqueConstraint("merchant", "order_id", name="uq_conversion_merchant_order"),
+        # Settlement scans unsettled conversions in time order
+        Index(
+            "ix_conversion_unsettled",
+            "occurred_at",
+            "uuid",
+            postgresql_where=text("settled_at IS NULL"),
+        ),
+        # Purchase verification looks up a buyer's conversions of a product
+        Index(
+            "ix_conversion_buyer_product",
+            "buyer_id",
+            "product_id",
+            postgresql_where=text("buyer_id IS NOT NULL AND product_id IS NOT NULL"),
+        ),
+    )
+
+    merchant: str = Field(nullable=False)
+    order_id: str = Field(nullable=False)
+    link_code: str = Field(index=True, nullable=False)
+    product_id: Optional[UUID] = Field(default=None, foreign_key="product.uuid", nullable=True)
+    buyer_id: Optional[UUID] = Field(default=None, foreign_key="user.uuid", nullable=True)
+
+    sale_amount: Decimal = Field(ge=0, sa_type=Numeric(12, 2), nullable=False)
+    commission_amount: Decimal = Field(ge=0, sa_type=Numeric(12, 2), nullable=False)
+    currency: str = Field(default="USD", max_length=3, nullable=False)
+    occurred_at: datetime = Field(sa_type=DateTime(timezone=True), nullable=False)
+
+    settled_at: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True), nullable=True)
+    settlement_id: Optional[UUID] = Field(default=None, nullable=True)
+
+    def __repr__(self):
+        return f"<Conversion(merchant={self.merchant}, order_id={self.order_id}, commission={self.commission_amount})>"
+
+
+class CommissionEntry(BaseModel, table=True):
+    """Append-only ledger line: one account's share of a conversion's commission."""
+    __tablename__ = "commission_entry"
+    __table_args__ = (
+        UniqueConstraint("conversion_id", "account", name="uq_commission_entry_conversion_account"),
+    )
+
+    conversion_id: UUID = Field(foreign_key="conversion.uuid", nullable=False)
+    settlement_id: UUID = Field(index=True, nullable=False)
+    account: str = Field(nullable=False)
+    creator_id: Optional[UUID] = Field(default=None, foreign_key="user.uuid", index=True, nullable=True)
+    amount: Decimal = Field(sa_type=Numeric(12, 2), nullable=False)
+    currency: str = Field(max_length=3, nullable=False)
+
+    def __repr__(self):
+        return f"<CommissionEntry(conversion_id={self.conversion_id}, account={self.account}, amount={self.amount})>"
+
+
+class CreatorBalance(BaseModel, table=True):
+    """A creator's running commission balance in one currency, updated in bulk by settlements."""
+    __tablename__ = "creator_balance"
+    __table_args__ = (
+        UniqueConstraint("creator_id", "currency", name="uq_creator_balance_creator_currency"),
+    )
+
+    creator_id: UUID = Field(foreign_key="user.uuid", nullable=False)
+    currency: str = Field(max_length=3, nullable=False)
+    balance: Decimal = Field(default=Decimal("0"), sa_type=Numeric(14, 2), nullable=False)
+    lifetime_earned: Decimal = Field(default=Decimal("0"), sa_type=Numeric(14, 2), nullable=False)
+
+    def __repr__(self):
+        return f"<CreatorBalance(creator_id={self.creator_id}, balance={self.balance} {self.currency})>"
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Column, DateTime, Identity
+from sqlmodel import Field, SQLModel
+
+
+class Event(SQLModel, table=True):
+    """
+    Append-only log of clicks and views, written in batches by the event pipeline.
+
+    Unlike other tables it has a bigint identity key instead of BaseModel's uuid:
+    rows are never updated, and downstream jobs read them in ``id`` order.
+    """
+    id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger, Identity(always=False), primary_key=True),
+    )
+    occurred_at: datetime = Field(sa_type=DateTime(timezone=True), index=True, nullable=False)
+    event_type: str = Field(nullable=False)
+    link_code: Optional[str] = Field(default=None, index=True, nullable=True)
+    review_id: Optional[UUID] = Field(default=None, index=True, nullable=True)
+    user_id: Optional[UUID] = Field(default=None, nullable=True)
+    visitor_id: Optional[str] = Field(default=None, nullable=True)
+    referrer: Optional[str] = Field(default=None, nullable=True)
+
+    def __repr__(self):
+        return f"<Event(id={self.id}, event_type={self.event_type}, occurred_at={self.occurred_at})>"
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.schemas.enums import JobStatus
+from ..base_model import BaseModel, Field, utcnow
+
+
+class Job(BaseModel, table=True):
+    """A unit of background work, claimed by workers with SELECT ... FOR UPDATE SKIP LOCKED."""
+    __table_args__ = (
+        # Matches the claim query's filter and ordering
+        Index(
+            "ix_job_claim",
+            text("priority DESC"),
+            "run_at",
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+    )
+
+    kind: str = Field(index=True, nullable=False)
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_type=JSONB, nullable=False)
+    status: str = Field(default=JobStatus.QUEUED.value, index=True, nullable=False)
+    priority: int = Field(default=0, nullable=False)
+
+    attempts: int = Field(default=0, nullable=False)
+    max_attempts: int = Field(default=5, nullable=False)
+    run_at: datetime = Field(default_factory=utcnow, sa_type=DateTime(timezone=True), nullable=False)
+    locked_until: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True), nullable=True)
+
+    progress: float = Field(default=0, ge=0, le=100, nullable=False)
+    result: Optional[Dict[str, Any]] = Field(default=None, sa_type=JSONB, nullable=True)
+    error: Optional[str] = Field(default=None, nullable=True)
+    owner_id: Optional[UUID] = Field(default=None, foreign_key="user.uuid", index=True, nullable=True)
+
+    def __repr__(self):
+        return f"<Job(uuid={self.uuid}, kind={self.kind}, status={self.status}, attempts={self.attempts})>"
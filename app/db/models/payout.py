@@ -0,0 +1,41 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, Index, Numeric, text
+
+from app.schemas.enums import PayoutStatus
+from ..base_model import BaseModel, Field
+
+
+class Payout(BaseModel, table=True):
+    """A transfer of a creator's commission balance through the payment provider."""
+    __table_args__ = (
+        # At most one payout in flight per balance; also scanned to resume stale ones
+        Index(
+            "uq_payout_pending_creator_currency",
+            "creator_id",
+            "currency",
+            unique=True,
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    run_id: UUID = Field(index=True, nullable=False)
+    creator_id: UUID = Field(foreign_key="user.uuid", index=True, nullable=False)
+    currency: str = Field(max_length=3, nullable=False)
+    amount: Decimal = Field(sa_type=Numeric(14, 2), nullable=False)
+    status: str = Field(default=PayoutStatus.PENDING.value, nullable=False)
+
+    # Sent with every attempt, so the provider pays a retried payout at most once
+    idempotency_key: str = Field(unique=True, nullable=False)
+    provider_reference: Optional[str] = Field(default=None, nullable=True)
+    attempts: int = Field(default=0, nullable=False)
+    last_error: Optional[str] = Field(default=None, nullable=True)
+    # A pending payout is being worked on by a runner until then
+    claimed_until: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True), nullable=True)
+    completed_at: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<Payout(creator_id={self.creator_id}, amount={self.amount} {self.currency}, status={self.status})>"
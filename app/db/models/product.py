@@ -0,0 +1,46 @@
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import Column, Computed, Index, Numeric, UniqueConstraint
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from ..base_model import BaseModel, Field
+
+
+# Maintained by Postgres on every write; see app/services/search.py
+PRODUCT_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(brand, '') || ' ' || coalesce(category, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+
+class Product(BaseModel, table=True):
+    """A product from a merchant's catalog feed that reviews can be tagged with."""
+    __table_args__ = (
+        # Upsert key for catalog imports
+        UniqueConstraint("merchant", "sku", name="uq_product_merchant_sku"),
+        Index("ix_product_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+    merchant: str = Field(index=True, nullable=False)
+    sku: str = Field(nullable=False)
+    title: str = Field(nullable=False)
+    description: Optional[str] = Field(default=None, nullable=True)
+    brand: Optional[str] = Field(default=None, index=True, nullable=True)
+    category: Optional[str] = Field(default=None, index=True, nullable=True)
+
+    price: Decimal = Field(ge=0, sa_type=Numeric(12, 2), nullable=False)
+    currency: str = Field(default="USD", max_length=3, nullable=False)
+    url: str = Field(nullable=False)
+    image_url: Optional[str] = Field(default=None, nullable=True)
+    in_stock: bool = Field(default=True, nullable=False)
+
+    search_vector: Optional[str] = Field(
+        default=None,
+        exclude=True,
+        sa_column=Column(TSVECTOR, Computed(PRODUCT_SEARCH_VECTOR, persisted=True)),
+    )
+
+    def __repr__(self):
+        return f"<Product(uuid={self.uuid}, merchant={self.merchant}, sku={self.sku}, title={self.title})>"
@@ -1,4 +1,5 @@
 from typing import Optional
+from sqlalchemy import Index, text
 from sqlmodel import Relationship
 from uuid import UUID
 
@@ -7,6 +8,11 @@ from ..base_model import BaseModel, Field
 
 
 class UserProfile(BaseModel, table=True):
+    __table_args__ = (
+        # Keyset pagination order (created_at DESC, uuid DESC), see app/db/pagination.py
+        Index("ix_userprofile_listing", text("created_at DESC"), text("uuid DESC")),
+    )
+
     first_name: Optional[str] = Field(default=None, nullable=True)
     last_name: Optional[str] = Field(default=None, nullable=True)
     username: str = Field(index=True, unique=True, nullable=False)
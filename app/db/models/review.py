@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Column, Computed, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.schemas.enums import ReviewStatus
+from ..base_model import BaseModel, Field
+
+
+# Maintained by Postgres on every write; see app/services/search.py
+REVIEW_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+class Review(BaseModel, table=True):
+    """A short video product review and the state of its upload."""
+    __table_args__ = (
+        # Keyset pagination order (created_at DESC, uuid DESC), see app/db/pagination.py
+        Index(
+            "ix_review_feed",
+            text("created_at DESC"),
+            text("uuid DESC"),
+            postgresql_where=text("status = 'ready'"),
+        ),
+        Index(
+            "ix_review_creator_feed",
+            "creator_id",
+            text("created_at DESC"),
+            text("uuid DESC"),
+        ),
+        Index("ix_review_search_vector", "search_vector", postgresql_using="gin"),
+        # Purchase verification looks up a creator's unverified reviews of a product
+        Index(
+            "ix_review_unverified_product",
+            "creator_id",
+            "product_id",
+            postgresql_where=text("NOT is_verified AND product_id IS NOT NULL"),
+        ),
+    )
+
+    creator_id: UUID = Field(foreign_key="user.uuid", index=True, nullable=False)
+    title: str = Field(nullable=False)
+    description: Optional[str] = Field(default=None, nullable=True)
+    status: str = Field(default=ReviewStatus.UPLOADING.value, index=True, nullable=False)
+
+    # The product reviewed; the review is verified once its creator is seen buying it through a link
+    product_id: Optional[UUID] = Field(default=None, foreign_key="product.uuid", nullable=True)
+    is_verified: bool = Field(default=False, nullable=False)
+    verified_at: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True), nullable=True)
+
+    content_type: str = Field(nullable=False)
+    storage_key: str = Field(nullable=False)
+    upload_length: int = Field(ge=0, sa_type=BigInteger, nullable=False)
+    upload_offset: int = Field(default=0, ge=0, sa_type=BigInteger, nullable=False)
+
+    processing_job_id: Optional[UUID] = Field(default=None, nullable=True)
+    playback_key: Optional[str] = Field(default=None, nullable=True)
+    thumbnail_key: Optional[str] = Field(default=None, nullable=True)
+    duration_seconds: Optional[float] = Field(default=None, nullable=True)
+
+    search_vector: Optional[str] = Field(
+        default=None,
+        exclude=True,
+        sa_column=Column(TSVECTOR, Computed(REVIEW_SEARCH_VECTOR, persisted=True)),
+    )
+
+    def __repr__(self):
+        return f"<Review(uuid={self.uuid}, title={self.title}, status={self.status})>"
+
+    @property
+    def is_upload_complete(self) -> bool:
+        return self.upload_offset >= self.upload_length
@@ -0,0 +1,44 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, Index, Numeric
+from sqlmodel import Field, SQLModel
+
+
+class EngagementRollup(SQLModel):
+    """Engagement totals of one piece of a creator's content over a time bucket."""
+    # Primary key leads with creator_id: dashboards read one creator's buckets in a time range
+    creator_id: UUID = Field(foreign_key="user.uuid", primary_key=True)
+    bucket_start: datetime = Field(sa_type=DateTime(timezone=True), primary_key=True)
+    content_type: str = Field(primary_key=True)  # "review", or "product" for links not tied to a review
+    content_id: UUID = Field(primary_key=True)
+
+    views: int = Field(default=0, sa_type=BigInteger, nullable=False)
+    clicks: int = Field(default=0, sa_type=BigInteger, nullable=False)
+    conversions: int = Field(default=0, sa_type=BigInteger, nullable=False)
+    earnings: Decimal = Field(default=Decimal("0"), sa_type=Numeric(14, 2), nullable=False)
+
+
+class EngagementRollupHourly(EngagementRollup, table=True):
+    __tablename__ = "engagement_rollup_hourly"
+    __table_args__ = (
+        # Recent buckets of all creators, for the trending ranker
+        Index("ix_engagement_rollup_hourly_bucket_start", "bucket_start"),
+    )
+
+
+class EngagementRollupDaily(EngagementRollup, table=True):
+    __tablename__ = "engagement_rollup_daily"
+
+
+class RollupWatermark(SQLModel, table=True):
+    """How far a periodic job (engagement rollups, purchase verification) has consumed a source table."""
+    __tablename__ = "rollup_watermark"
+
+    source: str = Field(primary_key=True)
+    last_id: int = Field(default=0, sa_type=BigInteger, nullable=False)
+    # Highest id seen by the previous run; consumed by the next one, once in-flight inserts have committed
+    next_id: int = Field(default=0, sa_type=BigInteger, nullable=False)
+    last_time: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True), nullable=True)
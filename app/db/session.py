@@ -1,17 +1,27 @@
-from typing import Annotated
+from typing import Annotated, AsyncGenerator
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlmodel import Session
-from . import engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from . import get_async_engine, get_engine
 
 
 
 # Session factory
 def get_session():
-    if not engine:
-        raise RuntimeError("Database engine is not initialized.")
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
+        yield session
+
+
+# Async session factory; objects stay usable after commit without a refresh round trip
+async_session_factory = async_sessionmaker(class_=AsyncSession, expire_on_commit=False)
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    async with async_session_factory(bind=get_async_engine()) as session:
         yield session
 
 
 # For dependency injection in routes
 SessionDep = Annotated[Session, Depends(get_session)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
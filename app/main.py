@@ -1,29 +1,44 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
 from fastapi import FastAPI, status
 from fastapi.exceptions import HTTPException
 from sqlmodel import Session, text
-from slowapi.errors import RateLimitExceeded
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from starlette.middleware.sessions import SessionMiddleware
 
 import uvicorn
 
 
-from app.utils.limiter import limiter
-from app.utils.logger import get_logger
+from app.utils.logger import get_logger, log_pipeline
+from app.api.middleware import MetricsMiddleware, RequestContextMiddleware
+from app.utils.metrics import registry
 from app.core.config import Config
 from app.api.v1.routes import router
-from app.db import engine
-from app.api.dependencies.response import error_response
+from app.api.redirect import redirect_router
+from app.db import close_db, get_engine, init_db, pool_stats
+from app.core.hashing import password_hasher
+from app.core.security import security
+from app.utils.http_client import http_client
+from app.core.google_id_token import google_key_store
+from app.services.events import event_pipeline
+from app.api.dependencies.response import ORJSONResponse, error_response
 from app.api.dependencies.custom_exception import (
     create_exception_handler,
-    create_rate_limit_exception_handler,
     GoogleOAuthConfigError,
     UserAlreadyExistsError,
     InvalidCredentialsError,
     InvalidTokenError,
     GoogleInitiationError,
     ServerError,
+    ServiceUnavailableError,
+    RateLimitExceededError,
+    BadRequestError,
+    ForbiddenError,
+    NotFoundError,
+    ConflictError,
+    PayloadTooLargeError,
+    UnsupportedMediaTypeError,
     OauthError
 )
 
@@ -31,10 +46,29 @@ logger = get_logger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    logger.info("FastAPI server is starting...")
-    yield
-    logger.info("FastAPI server is shutting down...")
-    
+    # Each teardown is registered once its start succeeded, and runs even if a
+    # later start step fails or the app is cancelled while serving
+    async with AsyncExitStack() as stack:
+        # Running since import; restarted if an earlier lifespan in this process stopped it
+        log_pipeline.start()
+        stack.callback(log_pipeline.stop)
+        logger.info("FastAPI server is starting...")
+        stack.push_async_callback(close_db)
+        await init_db()
+        password_hasher.start()
+        # Waiting for the pool's processes to exit would block the event loop
+        stack.push_async_callback(asyncio.to_thread, password_hasher.shutdown)
+        await http_client.start()
+        stack.push_async_callback(http_client.close)
+        await google_key_store.start()
+        stack.push_async_callback(google_key_store.stop)
+        security.revocation_store.start()
+        stack.callback(security.revocation_store.stop)
+        await event_pipeline.start()
+        stack.push_async_callback(event_pipeline.stop)
+        yield
+        logger.info("FastAPI server is shutting down...")
+
 
 app = FastAPI(
     debug=Config.DEBUG, 
@@ -42,9 +76,9 @@ app = FastAPI(
     version=Config.APP_VERSION,
     description=Config.APP_DESCRIPTION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-app.state.limiter = limiter
     
 @app.get("/health", status_code=status.HTTP_200_OK)
 def health_check():
@@ -56,10 +90,9 @@ def health_check():
 def readiness_check():
     """Deep check that the app is ready (DB is reachable)."""
     try:
-        with Session(engine) as session:
+        with Session(get_engine()) as session:
             session.exec(text('SELECT 1'))
-            print("done")
-        return {"status": "ready"}
+        return {"status": "ready", "pool": pool_stats()}
     
     except Exception as e:
         logger.error("Readiness check failed: %s", str(e), exc_info=True)
@@ -69,6 +102,12 @@ def readiness_check():
         )
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Runtime metrics for this worker in Prometheus text format."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 app.add_exception_handler(
     exc_class_or_status_code= GoogleOAuthConfigError,
     handler=create_exception_handler(
@@ -116,6 +155,55 @@ app.add_exception_handler(
         default_message="Internal Server Error"
     ),
 )
+app.add_exception_handler(
+    exc_class_or_status_code=ServiceUnavailableError,
+    handler=create_exception_handler(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        default_message="Service temporarily unavailable"
+    ),
+)
+app.add_exception_handler(
+    exc_class_or_status_code=BadRequestError,
+    handler=create_exception_handler(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        default_message="Bad request"
+    ),
+)
+app.add_exception_handler(
+    exc_class_or_status_code=ForbiddenError,
+    handler=create_exception_handler(
+        status_code=status.HTTP_403_FORBIDDEN,
+        default_message="Forbidden"
+    ),
+)
+app.add_exception_handler(
+    exc_class_or_status_code=NotFoundError,
+    handler=create_exception_handler(
+        status_code=status.HTTP_404_NOT_FOUND,
+        default_message="Resource not found"
+    ),
+)
+app.add_exception_handler(
+    exc_class_or_status_code=ConflictError,
+    handler=create_exception_handler(
+        status_code=status.HTTP_409_CONFLICT,
+        default_message="Conflict"
+    ),
+)
+app.add_exception_handler(
+    exc_class_or_status_code=PayloadTooLargeError,
+    handler=create_exception_handler(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        default_message="Payload too large"
+    ),
+)
+app.add_exception_handler(
+    exc_class_or_status_code=UnsupportedMediaTypeError,
+    handler=create_exception_handler(
+        status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        default_message="Unsupported media type"
+    ),
+)
 app.add_exception_handler(
     exc_class_or_status_code=OauthError,
     handler=create_exception_handler(
@@ -124,14 +212,15 @@ app.add_exception_handler(
     ),
 )
 app.add_exception_handler(
-    exc_class_or_status_code=RateLimitExceeded, 
-    handler=create_rate_limit_exception_handler(
+    exc_class_or_status_code=RateLimitExceededError,
+    handler=create_exception_handler(
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
         default_message="Too many requests, please try again later."
     ),
 )
 
 app.include_router(router=router, prefix="/api")
+app.include_router(router=redirect_router)
 app.add_middleware(SessionMiddleware, secret_key=Config.APP_SECRET_KEY)
 
 
@@ -152,6 +241,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(RequestContextMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, computed_field
+
+from app.core.config import Config
+
+
+class AffiliateLinkCreate(BaseModel):
+    """Schema for creating a short link to a product."""
+    product_id: UUID
+    review_id: Optional[UUID] = None
+
+
+class AffiliateLinkRead(BaseModel):
+    """A creator's affiliate short link."""
+    uuid: UUID
+    code: str
+    product_id: UUID
+    review_id: Optional[UUID] = None
+    target_url: str
+    is_active: bool
+    created_at: datetime
+
+    model_config = {
+        "from_attributes": True
+    }
+
+    @computed_field
+    @property
+    def short_url(self) -> str:
+        return f"{Config.SHORT_LINK_BASE_URL}/{self.code}"
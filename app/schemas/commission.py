@@ -0,0 +1,29 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ConversionCreate(BaseModel):
+    """A sale reported by a merchant for one of our affiliate links."""
+    merchant: str = Field(min_length=1, max_length=200)
+    order_id: str = Field(min_length=1, max_length=200)
+    link_code: str = Field(pattern=r"^[0-9A-Za-z]{4,16}$")
+    product_id: Optional[UUID] = None
+    buyer_id: Optional[UUID] = None
+    sale_amount: Decimal = Field(ge=0, max_digits=12, decimal_places=2)
+    commission_amount: Decimal = Field(ge=0, max_digits=12, decimal_places=2)
+    currency: str = Field(default="USD", pattern=r"^[A-Z]{3}$")
+    occurred_at: datetime
+
+
+class SettlementReport(BaseModel):
+    """Totals of a settlement run."""
+    settlement_id: UUID
+    conversions: int = 0
+    creator_balances_updated: int = 0
+    creator_amounts: Dict[str, Decimal] = {}
+    platform_amounts: Dict[str, Decimal] = {}
+    elapsed_seconds: float = 0.0
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class CreatorProfile(BaseModel):
+    """The public part of a creator's profile."""
+    creator_id: UUID = Field(validation_alias="user_id")
+    username: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    bio: Optional[str] = None
+    profile_picture_url: Optional[str] = None
+    created_at: datetime
+
+    model_config = {
+        "from_attributes": True
+    }
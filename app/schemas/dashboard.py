@@ -0,0 +1,32 @@
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+
+class EngagementStats(BaseModel):
+    """Engagement totals."""
+    views: int = 0
+    clicks: int = 0
+    conversions: int = 0
+    earnings: Decimal = Decimal("0")
+
+    def add(self, other) -> None:
+        """Add another set of totals (anything with the same four attributes) to these."""
+        self.views += other.views
+        self.clicks += other.clicks
+        self.conversions += other.conversions
+        self.earnings += other.earnings
+
+
+class TimeBucketStats(EngagementStats):
+    """Totals of all of a creator's content over one hour or day."""
+    bucket_start: datetime
+
+
+class ContentStats(EngagementStats):
+    """Totals of one review, or of a product linked outside a review."""
+    content_type: str
+    content_id: UUID
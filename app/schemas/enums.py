@@ -18,4 +18,52 @@ class AuthProvider(str, Enum):
 class Environment(str, Enum):
     LOCAL = "local"
     STAGING = "staging"
-    PROD = "prod"
\ No newline at end of file
+    PROD = "prod"
+
+
+class ReviewStatus(str, Enum):
+    """Lifecycle of a video review."""
+    UPLOADING = "uploading"
+    UPLOADED = "uploaded"
+    PROCESSING = "processing"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a background job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class EventType(str, Enum):
+    """Kinds of tracked engagement events."""
+    CLICK = "click"
+    VIEW = "view"
+
+
+class LedgerAccount(str, Enum):
+    """Who a commission ledger entry is credited to."""
+    CREATOR = "creator"
+    PLATFORM = "platform"
+
+
+class Granularity(str, Enum):
+    """Time bucket size of dashboard stats."""
+    HOUR = "hour"
+    DAY = "day"
+
+
+class SearchKind(str, Enum):
+    """What a search looks through."""
+    REVIEW = "review"
+    PRODUCT = "product"
+
+
+class PayoutStatus(str, Enum):
+    """Lifecycle of a creator payout."""
+    PENDING = "pending"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
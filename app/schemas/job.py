@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.schemas.enums import JobStatus
+
+
+class JobProgress(BaseModel):
+    """Status of a background job, for clients polling its progress."""
+    uuid: UUID
+    kind: str
+    status: JobStatus
+    progress: float
+    attempts: int
+    max_attempts: int
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = {
+        "from_attributes": True
+    }
@@ -0,0 +1,12 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """A page of a keyset-paginated list; pass ``next_cursor`` back as ``cursor`` for the next one."""
+    items: List[T]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,23 @@
+from decimal import Decimal
+from typing import Dict
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class PayoutRequest(BaseModel):
+    """What the payment provider is asked to pay."""
+    idempotency_key: str
+    creator_id: UUID
+    amount: Decimal
+    currency: str
+
+
+class PayoutReport(BaseModel):
+    """Totals of a payout run."""
+    run_id: UUID
+    succeeded: int = 0
+    declined: int = 0
+    retrying: int = 0
+    amounts_paid: Dict[str, Decimal] = {}
+    elapsed_seconds: float = 0.0
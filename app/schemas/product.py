@@ -0,0 +1,18 @@
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ProductFeedRow(BaseModel):
+    """A row of a merchant catalog feed (CSV or JSONL)."""
+    sku: str = Field(min_length=1, max_length=128)
+    title: str = Field(min_length=1, max_length=500)
+    description: Optional[str] = None
+    brand: Optional[str] = Field(default=None, max_length=200)
+    category: Optional[str] = Field(default=None, max_length=200)
+    price: Decimal = Field(ge=0, max_digits=12, decimal_places=2)
+    currency: str = Field(default="USD", pattern=r"^[A-Z]{3}$")
+    url: str = Field(pattern=r"^https?://", max_length=2048)
+    image_url: Optional[str] = Field(default=None, pattern=r"^https?://", max_length=2048)
+    in_stock: bool = True
@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ReviewRead(BaseModel):
+    """A published review as shown in listings."""
+    uuid: UUID
+    creator_id: UUID
+    title: str
+    description: Optional[str] = None
+    playback_key: Optional[str] = None
+    thumbnail_key: Optional[str] = None
+    duration_seconds: Optional[float] = None
+    product_id: Optional[UUID] = None
+    is_verified: bool = False
+    created_at: datetime
+
+    model_config = {
+        "from_attributes": True
+    }
@@ -0,0 +1,14 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    """A review or product matching a search, with its relevance score."""
+    uuid: UUID
+    title: str
+    description: Optional[str] = None
+    created_at: datetime
+    score: float
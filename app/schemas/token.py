@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 from uuid import UUID
 from pydantic import BaseModel
 
@@ -11,6 +11,7 @@ from app.schemas.enums import TokenType
 class TokenData(BaseModel):
     """ Data to be encrypted """
     user_id: str
+    family_id: Optional[str] = None
 
 
 class TokenCreate(TokenData):
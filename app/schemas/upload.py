@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.schemas.enums import ReviewStatus
+
+
+class UploadCreate(BaseModel):
+    """Schema for starting a resumable video upload."""
+    title: str = Field(min_length=1, max_length=200)
+    description: Optional[str] = None
+    product_id: Optional[UUID] = None
+    content_type: str = Field(pattern=r"^video/[\w.+-]+$")
+    upload_length: int = Field(gt=0)
+
+
+class UploadStatus(BaseModel):
+    """Progress of a resumable upload."""
+    uuid: UUID
+    status: ReviewStatus
+    upload_offset: int
+    upload_length: int
+    processing_job_id: Optional[UUID] = None
+    created_at: datetime
+
+    model_config = {
+        "from_attributes": True
+    }
@@ -1,5 +1,6 @@
 from datetime import datetime
 from typing import Optional, Union
+from uuid import UUID
 from pydantic import BaseModel, EmailStr
 
 from app.schemas.enums import AuthProvider
@@ -41,4 +42,43 @@ class RegisteredUserData(BaseModel):
 
     
 class UserLogin(UserCreate):
-    """UserLogin schema for user login."""
\ No newline at end of file
+    """UserLogin schema for user login."""
+
+class Principal(BaseModel):
+    """Authenticated user fields cached for request authentication."""
+    uuid: UUID
+    email: EmailStr
+    is_active: bool
+    is_verified: bool
+    is_superadmin: bool
+    is_deleted: bool
+    auth_provider: AuthProvider
+    created_at: datetime
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class UserProfileRead(BaseModel):
+    """The public part of a user's profile."""
+    username: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    bio: Optional[str] = None
+    profile_picture_url: Optional[str] = None
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class UserSummary(BaseModel):
+    """A user as shown to other users, e.g. next to their reviews."""
+    uuid: UUID
+    created_at: datetime
+    profile: Optional[UserProfileRead] = None
+
+    model_config = {
+        "from_attributes": True
+    }
@@ -0,0 +1,189 @@
+import asyncio
+import re
+from typing import Dict, Optional
+from uuid import UUID
+
+import redis.asyncio as aioredis
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.dependencies.custom_exception import NotFoundError, ServerError
+from app.core.config import Config
+from app.core.security import security
+from app.db import get_async_engine
+from app.db.models import AffiliateLink, Product, Review
+from app.db.session import async_session_factory
+from app.schemas.affiliate import AffiliateLinkCreate
+from app.utils.cache import TTLCache
+from app.utils.logger import get_logger
+from app.utils.redis_client import InstrumentedAsyncRedis
+
+
+logger = get_logger(__name__)
+
+SHORT_CODE_LENGTH = 8
+SHORT_CODE_PATTERN = re.compile(r"^[0-9A-Za-z]{4,16}$")
+
+# Cached in place of a target for codes that don't resolve
+MISSING = ""
+
+# Unique index that a freshly generated code can collide with
+CODE_INDEX = "ix_affiliate_link_code"
+
+
+class LinkCache:
+    """Two-tier cache of short code -> target URL, including negative entries.
+
+    In steady state a redirect is answered from the in-process LRU; the shared
+    Redis tier warms new workers and absorbs misses, and the database is only
+    queried once per code per ``ttl``. Unknown codes are cached as ``MISSING``
+    for a short while so scans for random codes can't hammer the database.
+    Concurrent misses for the same code in a worker share one lookup.
+    """
+
+    KEY_PREFIX = "affiliate_link:"
+
+    def __init__(self, redis_client: aioredis.Redis, ttl: int, negative_ttl: int, local_ttl: int, local_max_size: int):
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.local = TTLCache[str](max_size=local_max_size, ttl=local_ttl)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def resolve(self, code: str) -> Optional[str]:
+        """Return the target URL for an active code, or None."""
+        target = self.local.get(code)
+        if target is None:
+            target = await self._resolve_shared(code)
+        return target or None
+
+    async def _resolve_shared(self, code: str) -> str:
+        try:
+            target = await self.redis_client.get(self.KEY_PREFIX + code)
+        except aioredis.RedisError as e:
+            logger.warning(f"Short link cache read failed: {e}")
+            target = None
+
+        if target is None:
+            inflight = self._inflight.get(code)
+            if inflight is not None:
+                return await asyncio.shield(inflight)
+
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[code] = future
+            try:
+                target = await self._load(code)
+                future.set_result(target)
+            except Exception as e:
+                future.set_exception(e)
+                future.exception()  # Mark retrieved when nobody else was waiting
+                raise
+            finally:
+                del self._inflight[code]
+
+        self.local.set(code, target, ttl=None if target else min(self.negative_ttl, self.local.ttl))
+        return target
+
+    async def _load(self, code: str) -> str:
+        async with async_session_factory(bind=get_async_engine()) as session:
+            result = await session.exec(
+                select(AffiliateLink.target_url).where(
+                    AffiliateLink.code == code, AffiliateLink.is_active == True  # noqa: E712
+                )
+            )
+            target = result.first() or MISSING
+
+        try:
+            await self.redis_client.set(
+                self.KEY_PREFIX + code, target, ex=self.ttl if target else self.negative_ttl
+            )
+        except aioredis.RedisError as e:
+            logger.warning(f"Short link cache write failed: {e}")
+        return target
+
+    async def invalidate(self, code: str) -> None:
+        """Drop a code from both tiers; other workers' local copies expire within the local TTL."""
+        self.local.pop(code)
+        try:
+            await self.redis_client.delete(self.KEY_PREFIX + code)
+        except aioredis.RedisError as e:
+            logger.warning(f"Short link cache invalidation failed: {e}")
+
+
+def _is_code_collision(error: IntegrityError) -> bool:
+    """Whether ``error`` is a duplicate short code rather than some other violated constraint."""
+    return getattr(error.orig.__cause__, "constraint_name", None) == CODE_INDEX
+
+
+class AffiliateService:
+    """Service for creating and resolving affiliate short links."""
+
+    def __init__(self, link_cache: LinkCache):
+        self.link_cache = link_cache
+
+    async def create_link(self, creator_id: UUID, data: AffiliateLinkCreate, session: AsyncSession) -> AffiliateLink:
+        """
+        Return the creator's link for a product (and review), creating it if needed.
+
+        Raises:
+            NotFoundError: If the product, or the creator's review, doesn't exist.
+        """
+        product = await session.get(Product, data.product_id)
+        if product is None:
+            raise NotFoundError("Product not found")
+        if data.review_id is not None:
+            review = await session.get(Review, data.review_id)
+            if review is None or review.creator_id != creator_id:
+                raise NotFoundError("Review not found")
+
+        existing = (await session.exec(
+            select(AffiliateLink).where(
+                AffiliateLink.creator_id == creator_id,
+                AffiliateLink.product_id == data.product_id,
+                AffiliateLink.review_id == data.review_id,
+                AffiliateLink.is_active == True,  # noqa: E712
+            )
+        )).first()
+        if existing is not None:
+            return existing
+
+        target_url = product.url
+        for _ in range(5):
+            link = AffiliateLink(
+                code=security.generate_short_code(SHORT_CODE_LENGTH),
+                creator_id=creator_id,
+                product_id=data.product_id,
+                review_id=data.review_id,
+                target_url=target_url,
+            )
+            try:
+                # A savepoint, so a collision only undoes this insert
+                async with session.begin_nested():
+                    session.add(link)
+            except IntegrityError as e:
+                if not _is_code_collision(e):
+                    raise
+                continue
+            await session.commit()
+            # The code may have been probed (and negatively cached) before it existed
+            await self.link_cache.invalidate(link.code)
+            return link
+        raise ServerError("Could not allocate a short link code")
+
+    async def resolve(self, code: str) -> Optional[str]:
+        """Return the target URL for ``code``, or None if it is unknown or inactive."""
+        if not SHORT_CODE_PATTERN.match(code):
+            return None
+        return await self.link_cache.resolve(code)
+
+
+affiliate_service = AffiliateService(
+    link_cache=LinkCache(
+        redis_client=InstrumentedAsyncRedis.from_url(Config.REDIS_URL, decode_responses=True),
+        ttl=Config.SHORT_LINK_CACHE_TTL,
+        negative_ttl=Config.SHORT_LINK_NEGATIVE_CACHE_TTL,
+        local_ttl=Config.SHORT_LINK_LOCAL_CACHE_TTL,
+        local_max_size=Config.SHORT_LINK_LOCAL_CACHE_SIZE,
+    )
+)
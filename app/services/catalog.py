@@ -0,0 +1,302 @@
+import codecs
+import csv
+import io
+import time
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import orjson
+from pydantic import TypeAdapter, ValidationError
+
+from app.core.config import Config
+from app.db import get_engine
+from app.schemas.product import ProductFeedRow
+from app.services.jobs import JobContext, job_queue
+from app.services.storage import storage
+from app.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+PRODUCT_IMPORT_JOB = "products.import"
+FEED_FORMATS = ("csv", "jsonl")
+
+# Columns copied into the staging table, in order
+STAGING_COLUMNS = (
+    "line_no", "sku", "title", "description", "brand", "category",
+    "price", "currency", "url", "image_url", "in_stock",
+)
+PRODUCT_COLUMNS = STAGING_COLUMNS[1:]
+MAX_REPORTED_ERRORS = 100
+
+feed_rows = TypeAdapter(List[ProductFeedRow])
+
+# Rows vanish on commit, so each batch starts with an empty table
+CREATE_STAGING_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS product_import (
+        line_no bigint,
+        sku text,
+        title text,
+        description text,
+        brand text,
+        category text,
+        price numeric(12, 2),
+        currency text,
+        url text,
+        image_url text,
+        in_stock boolean
+    ) ON COMMIT DELETE ROWS
+"""
+
+COPY_STAGING_SQL = f"COPY product_import ({', '.join(STAGING_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+
+# DISTINCT ON keeps the last occurrence of a SKU repeated within a batch;
+# unchanged rows are skipped so re-importing the same feed writes nothing.
+UPSERT_SQL = f"""
+    WITH upserted AS (
+        INSERT INTO product (uuid, created_at, merchant, {', '.join(PRODUCT_COLUMNS)})
+        SELECT DISTINCT ON (sku) gen_random_uuid(), now(), %(merchant)s, {', '.join(PRODUCT_COLUMNS)}
+        FROM product_import
+        ORDER BY sku, line_no DESC
+        ON CONFLICT (merchant, sku) DO UPDATE SET
+            {', '.join(f"{column} = EXCLUDED.{column}" for column in PRODUCT_COLUMNS[1:])},
+            updated_at = now()
+        WHERE ({', '.join(f"product.{column}" for column in PRODUCT_COLUMNS[1:])})
+            IS DISTINCT FROM ({', '.join(f"EXCLUDED.{column}" for column in PRODUCT_COLUMNS[1:])})
+        RETURNING (xmax = 0) AS inserted
+    )
+    SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM upserted
+"""
+
+
+@dataclass
+class ImportReport:
+    """Running totals of a catalog import."""
+    merchant: str
+    total_bytes: int = 0
+    bytes_read: int = 0
+    rows_read: int = 0
+    rows_invalid: int = 0
+    rows_inserted: int = 0
+    rows_updated: int = 0
+    elapsed_seconds: float = 0.0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def percent(self) -> float:
+        return 100 * self.bytes_read / self.total_bytes if self.total_bytes else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def add_error(report: ImportReport, line_no: int, messages: List[str]) -> None:
+    """Count an invalid row, keeping the first MAX_REPORTED_ERRORS for the report."""
+    report.rows_invalid += 1
+    if len(report.errors) < MAX_REPORTED_ERRORS:
+        report.errors.append({"line": line_no, "errors": messages})
+
+
+class ByteCounter:
+    """Decodes a binary stream line by line, tracking how many bytes were consumed.
+
+    Lines that aren't valid UTF-8 are decoded with replacement characters, so
+    the parsers stay in step, and their numbers are kept in ``undecodable``.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.bytes_read = 0
+        self.lines_read = 0
+        self.undecodable: List[int] = []
+
+    def __iter__(self) -> Iterator[str]:
+        for line in self.stream:
+            self.bytes_read += len(line)
+            self.lines_read += 1
+            if self.lines_read == 1:
+                line = line.removeprefix(codecs.BOM_UTF8)
+            try:
+                text = line.decode("utf-8", errors="strict")
+            except UnicodeDecodeError:
+                self.undecodable.append(self.lines_read)
+                text = line.decode("utf-8", errors="replace")
+            yield text
+
+
+def iter_csv_records(lines: Iterable[str]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (line_no, record) pairs from CSV with a header row; blank cells are dropped."""
+    reader = csv.DictReader(lines)
+    for record in reader:
+        yield reader.line_num, {key: value for key, value in record.items() if key and value not in ("", None)}
+
+
+def iter_jsonl_records(lines: Iterable[str]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (line_no, record) pairs from JSON Lines; undecodable lines yield an empty record."""
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            record = None
+        yield line_no, record if isinstance(record, dict) else {}
+
+
+def drop_undecodable(
+    records: Iterator[Tuple[int, Dict[str, Any]]], lines: ByteCounter, report: ImportReport
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Report records spanning a line that isn't valid UTF-8 as invalid instead of importing them."""
+    for line_no, record in records:
+        # A record ends at ``line_no``, so any bad line not yet accounted for is part of it
+        undecodable = False
+        while lines.undecodable and lines.undecodable[0] <= line_no:
+            lines.undecodable.pop(0)
+            undecodable = True
+        if undecodable:
+            report.rows_read += 1
+            add_error(report, line_no, ["row: not valid UTF-8"])
+            continue
+        yield line_no, record
+
+
+def batched(records: Iterator[Tuple[int, Dict[str, Any]]], size: int) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def validate_batch(
+    batch: List[Tuple[int, Dict[str, Any]]], report: ImportReport
+) -> List[Tuple[int, ProductFeedRow]]:
+    """Validate a batch in one TypeAdapter call; invalid rows are dropped and reported."""
+    line_numbers = [line_no for line_no, _ in batch]
+    records = [record for _, record in batch]
+    try:
+        return list(zip(line_numbers, feed_rows.validate_python(records)))
+    except ValidationError as e:
+        invalid: Dict[int, List[str]] = {}
+        for error in e.errors(include_url=False, include_input=False):
+            index, *location = error["loc"]
+            invalid.setdefault(index, []).append(f"{'.'.join(map(str, location)) or 'row'}: {error['msg']}")
+
+    for index, messages in invalid.items():
+        add_error(report, line_numbers[index], messages)
+
+    valid = [i for i in range(len(batch)) if i not in invalid]
+    rows = feed_rows.validate_python([records[i] for i in valid])
+    return [(line_numbers[i], row) for i, row in zip(valid, rows)]
+
+
+def to_copy_buffer(rows: List[Tuple[int, ProductFeedRow]]) -> io.StringIO:
+    """Serialize rows as CSV for COPY; None becomes an unquoted empty field, i.e. NULL."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for line_no, row in rows:
+        writer.writerow((
+            line_no, row.sku, row.title, row.description, row.brand, row.category,
+            row.price, row.currency, row.url, row.image_url, row.in_stock,
+        ))
+    buffer.seek(0)
+    return buffer
+
+
+class CatalogImporter:
+    """
+    Streams a merchant feed into the ``product`` table.
+
+    The feed is read and validated in batches, so memory is bounded by the batch
+    size whatever the file size. Each batch is COPYed into a temporary staging
+    table and merged into ``product`` with one INSERT ... ON CONFLICT, keyed on
+    (merchant, sku), and committed on its own.
+    """
+
+    def __init__(self, batch_size: int = Config.PRODUCT_IMPORT_BATCH_SIZE):
+        self.batch_size = batch_size
+
+    def import_stream(
+        self,
+        stream: BinaryIO,
+        merchant: str,
+        feed_format: str,
+        total_bytes: int = 0,
+        on_progress: Optional[Callable[[ImportReport], None]] = None,
+    ) -> ImportReport:
+        """Import a binary CSV or JSONL stream, calling ``on_progress`` after every batch."""
+        if feed_format not in FEED_FORMATS:
+            raise ValueError(f"Unsupported feed format: {feed_format}")
+
+        report = ImportReport(merchant=merchant, total_bytes=total_bytes)
+        lines = ByteCounter(stream)
+        records = iter_csv_records(lines) if feed_format == "csv" else iter_jsonl_records(lines)
+        records = drop_undecodable(records, lines, report)
+        started = time.perf_counter()
+
+        with closing(get_engine().raw_connection()) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(CREATE_STAGING_SQL)
+            connection.commit()
+
+            for batch in batched(records, self.batch_size):
+                report.rows_read += len(batch)
+                rows = validate_batch(batch, report)
+                if rows:
+                    with connection.cursor() as cursor:
+                        cursor.copy_expert(COPY_STAGING_SQL, to_copy_buffer(rows))
+                        cursor.execute(UPSERT_SQL, {"merchant": merchant})
+                        inserted, updated = cursor.fetchone()
+                    connection.commit()
+                    report.rows_inserted += inserted
+                    report.rows_updated += updated
+
+                report.bytes_read = lines.bytes_read
+                report.elapsed_seconds = time.perf_counter() - started
+                if on_progress:
+                    on_progress(report)
+
+        logger.info(
+            f"Imported catalog for {merchant}: {report.rows_read} rows read, "
+            f"{report.rows_inserted} inserted, {report.rows_updated} updated, "
+            f"{report.rows_invalid} invalid in {report.elapsed_seconds:.1f}s"
+        )
+        return report
+
+    def import_file(
+        self,
+        path: Path,
+        merchant: str,
+        feed_format: Optional[str] = None,
+        on_progress: Optional[Callable[[ImportReport], None]] = None,
+    ) -> ImportReport:
+        """Import a feed file; the format defaults to the file extension."""
+        feed_format = feed_format or path.suffix.lstrip(".").lower()
+        with open(path, "rb") as stream:
+            return self.import_stream(
+                stream, merchant, feed_format, total_bytes=path.stat().st_size, on_progress=on_progress
+            )
+
+
+catalog_importer = CatalogImporter()
+
+
+def import_product_feed(ctx: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Job processor for feeds uploaded through the admin endpoint."""
+    path = storage.local_path(payload["storage_key"])
+    report = catalog_importer.import_file(
+        path,
+        merchant=payload["merchant"],
+        feed_format=payload["format"],
+        on_progress=lambda report: ctx.report_progress(report.percent),
+    )
+    path.unlink(missing_ok=True)
+    return report.as_dict()
+
+
+job_queue.register(PRODUCT_IMPORT_JOB, import_product_feed)
@@ -0,0 +1,222 @@
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import redis
+import redis.asyncio as aioredis
+from fastapi import status
+from sqlalchemy import event, inspect
+from sqlmodel import select
+
+from app.api.dependencies.response import success_response
+from app.core.config import Config
+from app.db import get_async_engine
+from app.db.base_model import now_and_after_commit, on_update
+from app.db.models import User, UserProfile
+from app.db.session import async_session_factory
+from app.schemas.creator import CreatorProfile
+from app.utils.cache import TTLCache
+from app.utils.logger import get_logger
+from app.utils.redis_client import InstrumentedAsyncRedis, InstrumentedRedis, delete_keys
+
+
+logger = get_logger(__name__)
+
+# Bump when the rendered page changes shape, so clients don't keep stale copies
+PAGE_VERSION = "1"
+
+
+@dataclass(frozen=True)
+class CreatorPage:
+    """A rendered creator profile response and its ETag."""
+    etag: str
+    body: bytes
+
+    def dump(self) -> bytes:
+        return self.etag.encode() + b"\n" + self.body
+
+    @classmethod
+    def load(cls, raw: bytes) -> "CreatorPage":
+        etag, body = raw.split(b"\n", 1)
+        return cls(etag.decode(), body)
+
+
+# Cached in place of a page for usernames that don't exist or whose user is deleted or inactive
+MISSING = CreatorPage(etag="", body=b"")
+
+
+def profile_etag(profile: UserProfile) -> str:
+    """Strong ETag; changes whenever the profile row is updated."""
+    version = (profile.updated_at or profile.created_at).isoformat()
+    digest = hashlib.blake2b(f"{PAGE_VERSION}:{profile.uuid}:{version}".encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches ``etag`` (weak comparison, as RFC 9110 specifies)."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+class CreatorPageCache:
+    """Read-through cache of rendered creator profile pages by username.
+
+    Same two tiers as the short link cache: an in-process LRU in front of
+    Redis, negative entries for unknown usernames, and one database lookup per
+    worker for concurrent misses. Only profiles of active, undeleted users are
+    public. Entries are dropped when the profile row is updated, or the user is
+    deleted or (de)activated; other workers' local copies live at most
+    ``local_ttl`` longer.
+    """
+
+    KEY_PREFIX = "creator_page:"
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        sync_redis_client: redis.Redis,
+        ttl: int,
+        negative_ttl: int,
+        local_ttl: int,
+        local_max_size: int,
+    ):
+        self.redis_client = redis_client
+        self.sync_redis_client = sync_redis_client
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.local = TTLCache[CreatorPage](max_size=local_max_size, ttl=local_ttl)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Redis deletes still in flight on the event loop, by username
+        self._pending: Dict[str, asyncio.Task] = {}
+
+    async def get(self, username: str) -> Optional[CreatorPage]:
+        """Return the page for ``username``, or None if there is no such creator."""
+        page = self.local.get(username)
+        if page is None:
+            page = await self._get_shared(username)
+        return page if page is not MISSING else None
+
+    async def _get_shared(self, username: str) -> CreatorPage:
+        pending = self._pending.get(username)
+        if pending is not None:
+            await asyncio.shield(pending)  # Don't read back what is being invalidated
+        try:
+            raw = await self.redis_client.get(self.KEY_PREFIX + username)
+        except aioredis.RedisError as e:
+            logger.warning(f"Creator page cache read failed: {e}")
+            raw = None
+
+        if raw is not None:
+            page = CreatorPage.load(raw) if raw else MISSING
+        else:
+            inflight = self._inflight.get(username)
+            if inflight is not None:
+                return await asyncio.shield(inflight)
+
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[username] = future
+            try:
+                page = await self._load(username)
+                future.set_result(page)
+            except Exception as e:
+                future.set_exception(e)
+                future.exception()  # Mark retrieved when nobody else was waiting
+                raise
+            finally:
+                del self._inflight[username]
+
+        self.local.set(username, page, ttl=None if page is not MISSING else min(self.negative_ttl, self.local.ttl))
+        return page
+
+    async def _load(self, username: str) -> CreatorPage:
+        async with async_session_factory(bind=get_async_engine()) as session:
+            result = await session.exec(
+                select(UserProfile)
+                .join(User, User.uuid == UserProfile.user_id)
+                .where(
+                    UserProfile.username == username,
+                    User.is_deleted.is_not(True),
+                    User.is_active.is_not(False),
+                )
+            )
+            profile = result.first()
+
+        if profile is None:
+            page = MISSING
+        else:
+            response = success_response(
+                status_code=status.HTTP_200_OK,
+                message="Creator profile retrieved",
+                data=CreatorProfile.model_validate(profile),
+            )
+            page = CreatorPage(etag=profile_etag(profile), body=response.body)
+
+        try:
+            await self.redis_client.set(
+                self.KEY_PREFIX + username,
+                page.dump() if page is not MISSING else b"",
+                ex=self.ttl if page is not MISSING else self.negative_ttl,
+            )
+        except aioredis.RedisError as e:
+            logger.warning(f"Creator page cache write failed: {e}")
+        return page
+
+    def invalidate(self, *usernames: str) -> None:
+        """Drop pages from the local tier now, and from Redis (see ``delete_keys``)."""
+        for username in usernames:
+            self.local.pop(username)
+        task = delete_keys(
+            self.sync_redis_client, self.redis_client, *(self.KEY_PREFIX + username for username in usernames)
+        )
+        if task is not None:
+            for username in usernames:
+                self._pending[username] = task
+            task.add_done_callback(lambda task: self._forget(task, usernames))
+
+    def _forget(self, task: asyncio.Task, usernames: Tuple[str, ...]) -> None:
+        for username in usernames:
+            if self._pending.get(username) is task:
+                del self._pending[username]
+
+    async def close(self) -> None:
+        """Finish pending invalidations and close the async Redis client's connections."""
+        await asyncio.gather(*set(self._pending.values()))
+        await self.redis_client.aclose()
+
+
+creator_page_cache = CreatorPageCache(
+    redis_client=InstrumentedAsyncRedis.from_url(Config.REDIS_URL),
+    sync_redis_client=InstrumentedRedis.from_url(Config.REDIS_URL),
+    ttl=Config.CREATOR_CACHE_TTL,
+    negative_ttl=Config.CREATOR_NEGATIVE_CACHE_TTL,
+    local_ttl=Config.CREATOR_LOCAL_CACHE_TTL,
+    local_max_size=Config.CREATOR_LOCAL_CACHE_SIZE,
+)
+
+
+@on_update(UserProfile)
+def invalidate_creator_page(profile: UserProfile) -> None:
+    """Drop the cached page of a profile being updated, under its old username too if that changed."""
+    usernames = (profile.username, *inspect(profile).attrs.username.history.deleted)
+    now_and_after_commit(profile, lambda: creator_page_cache.invalidate(*usernames))
+
+
+@on_update(User)
+def invalidate_creator_page_of_user(user: User) -> None:
+    """Drop the cached page of a user being deleted, restored, activated or deactivated."""
+    state = inspect(user).attrs
+    if not (state.is_deleted.history.has_changes() or state.is_active.history.has_changes()):
+        return
+    if user.profile is not None:
+        username = user.profile.username
+        now_and_after_commit(user, lambda: creator_page_cache.invalidate(username))
+
+
+# A new profile may have been cached as missing
+@event.listens_for(UserProfile, "after_insert")
+@event.listens_for(UserProfile, "after_delete")
+def drop_creator_page(mapper, connection, target):
+    creator_page_cache.invalidate(target.username)
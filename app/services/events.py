@@ -0,0 +1,324 @@
+import asyncio
+import fcntl
+import hashlib
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Awaitable, Callable, Deque, Iterator, List, NamedTuple, Optional
+from uuid import UUID
+
+import orjson
+from fastapi import Request
+
+from app.core.config import Config
+from app.db import get_async_engine
+from app.db.base_model import utcnow
+from app.schemas.enums import EventType
+from app.utils.logger import get_logger
+from app.utils.metrics import (
+    event_buffer_size,
+    event_flush_duration_seconds,
+    events_dropped_total,
+    events_written_total,
+    registry,
+)
+
+
+logger = get_logger(__name__)
+
+
+class EventRecord(NamedTuple):
+    """A row of the ``event`` table, in COPY column order."""
+    occurred_at: datetime
+    event_type: str
+    link_code: Optional[str] = None
+    review_id: Optional[UUID] = None
+    user_id: Optional[UUID] = None
+    visitor_id: Optional[str] = None
+    referrer: Optional[str] = None
+
+    def to_json(self) -> bytes:
+        return orjson.dumps(tuple(self))
+
+    @classmethod
+    def from_json(cls, line: bytes) -> "EventRecord":
+        occurred_at, event_type, link_code, review_id, user_id, visitor_id, referrer = orjson.loads(line)
+        return cls(
+            datetime.fromisoformat(occurred_at),
+            event_type,
+            link_code,
+            UUID(review_id) if review_id else None,
+            UUID(user_id) if user_id else None,
+            visitor_id,
+            referrer,
+        )
+
+
+EVENT_COLUMNS = list(EventRecord._fields)
+
+EventWriter = Callable[[List[EventRecord]], Awaitable[None]]
+
+
+async def copy_events(records: List[EventRecord]) -> None:
+    """Write events with a single binary COPY over an asyncpg connection."""
+    async with get_async_engine().connect() as connection:
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table("event", records=records, columns=EVENT_COLUMNS)
+
+
+def visitor_id(request: Request) -> str:
+    """Pseudonymous visitor id derived from the client IP and user agent."""
+    client = request.client.host if request.client else ""
+    user_agent = request.headers.get("user-agent", "")
+    return hashlib.blake2b(f"{client}|{user_agent}".encode(), digest_size=8).hexdigest()
+
+
+class EventSpool:
+    """Append-only JSON Lines files holding events that couldn't be written to the database.
+
+    Each process writes its own file and holds an exclusive ``flock`` on it, so a
+    file that can be locked belongs to a process that has exited (or rotated it)
+    and is safe to replay.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._file: Optional[IO[bytes]] = None
+        self._lock = threading.Lock()
+
+    def append(self, records: List[EventRecord]) -> None:
+        """Append and fsync ``records``; blocking, so call it from a worker thread."""
+        with self._lock:
+            if self._file is None:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                path = self.directory / f"events-{os.getpid()}-{time.time_ns()}.jsonl"
+                self._file = open(path, "ab")
+                fcntl.flock(self._file, fcntl.LOCK_EX)
+            self._file.write(b"".join(record.to_json() + b"\n" for record in records))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Flush and release this process's file, making it replayable."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
+
+    def replayable(self) -> Iterator[Path]:
+        """Yield spool files no live process is writing to, each locked until the next is requested."""
+        if not self.directory.exists():
+            return
+        for path in sorted(self.directory.glob("events-*.jsonl")):
+            with open(path, "rb") as f:
+                try:
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue
+                yield path
+
+    @staticmethod
+    def read(path: Path, batch_size: int) -> Iterator[List[EventRecord]]:
+        batch = []
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    batch.append(EventRecord.from_json(line))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+
+class EventPipeline:
+    """Buffers engagement events in memory and writes them to Postgres in batches.
+
+    ``record`` only appends to a deque, so handlers never wait on the database
+    or the disk. A background task writes the buffer with one COPY whenever
+    ``batch_size`` events are pending or ``flush_interval`` has passed.
+
+    Memory is bounded by ``max_buffer``: past it, new events are dropped and
+    counted, like the log pipeline does. Batches that fail to write are
+    appended to the spool file from a worker thread, and spool files are
+    replayed once the database is reachable again (and on startup, which picks
+    up files left by crashed processes). Events still in memory when a process
+    is killed outright are lost; at most one flush interval's worth.
+    """
+
+    def __init__(
+        self,
+        writer: EventWriter,
+        spool: EventSpool,
+        max_buffer: int,
+        batch_size: int,
+        flush_interval: float,
+    ):
+        self.writer = writer
+        self.spool = spool
+        self.max_buffer = max_buffer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer: Deque[EventRecord] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._healthy = True
+        self._replay_needed = True
+        self._stopping = False
+        self.dropped = 0
+        self._reported_dropped = 0
+
+    def record(self, event: EventRecord) -> None:
+        """Queue an event for writing, or drop it if the buffer is full. Never blocks on I/O."""
+        if len(self.buffer) >= self.max_buffer:
+            self.dropped += 1
+            events_dropped_total.inc()
+            return
+        self.buffer.append(event)
+        if len(self.buffer) == self.batch_size and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def track(
+        self,
+        event_type: EventType,
+        request: Optional[Request] = None,
+        link_code: Optional[str] = None,
+        review_id: Optional[UUID] = None,
+        user_id: Optional[UUID] = None,
+    ) -> None:
+        """Record an event that happened now, taking visitor details from ``request``."""
+        self.record(EventRecord(
+            occurred_at=utcnow(),
+            event_type=event_type.value,
+            link_code=link_code,
+            review_id=review_id,
+            user_id=user_id,
+            visitor_id=visitor_id(request) if request is not None else None,
+            referrer=request.headers.get("referer") if request is not None else None,
+        ))
+
+    def _take_batch(self) -> List[EventRecord]:
+        batch = []
+        while self.buffer and len(batch) < self.batch_size:
+            batch.append(self.buffer.popleft())
+        return batch
+
+    async def _write(self, batch: List[EventRecord]) -> bool:
+        start = time.perf_counter()
+        try:
+            await self.writer(batch)
+        except Exception as e:
+            if self._healthy:
+                logger.error(f"Event write failed, spooling to disk: {e}")
+            self._healthy = False
+            await asyncio.to_thread(self.spool.append, batch)
+            self._replay_needed = True
+            events_written_total.inc("spool", amount=len(batch))
+            return False
+        finally:
+            event_flush_duration_seconds.observe(value=time.perf_counter() - start)
+        if not self._healthy:
+            logger.info("Event writes recovered")
+        self._healthy = True
+        events_written_total.inc("db", amount=len(batch))
+        return True
+
+    async def flush(self) -> None:
+        """Write everything currently buffered."""
+        while self.buffer:
+            await self._write(self._take_batch())
+
+    async def replay_spool(self) -> None:
+        """
+        Write spooled events back to the database, deleting each file once it's done.
+
+        File access runs in worker threads, off the event loop. Delivery is
+        at-least-once: if a replay fails partway through a file, the whole file
+        is replayed again next time.
+        """
+        await asyncio.to_thread(self.spool.close)
+        paths = self.spool.replayable()
+        while (path := await asyncio.to_thread(next, paths, None)) is not None:
+            replayed = 0
+            batches = self.spool.read(path, self.batch_size)
+            while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+                await self.writer(batch)
+                replayed += len(batch)
+            await asyncio.to_thread(path.unlink)
+            logger.info(f"Replayed {replayed} spooled events from {path.name}")
+        self._replay_needed = False
+
+    async def _replay_if_needed(self) -> None:
+        if not self._replay_needed:
+            return
+        if not self._healthy:
+            # Nothing may have been written since the failure; probe with an empty batch
+            try:
+                await self.writer([])
+            except Exception:
+                return
+            logger.info("Event writes recovered")
+            self._healthy = True
+        try:
+            await self.replay_spool()
+        except Exception as e:
+            logger.error(f"Event spool replay failed: {e}")
+            self._healthy = False
+
+    def _report_dropped(self) -> None:
+        if self.dropped > self._reported_dropped:
+            logger.warning(f"Event buffer full, dropped {self.dropped - self._reported_dropped} events")
+            self._reported_dropped = self.dropped
+
+    async def _run(self) -> None:
+        await self._replay_if_needed()
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+            self._report_dropped()
+            await self._replay_if_needed()
+
+    async def start(self) -> None:
+        """
+        Start the background writer.
+
+        Its first step is replaying spool files left by earlier processes,
+        without holding up startup.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write out buffered events (spooling whatever can't be written) and stop."""
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+        await asyncio.to_thread(self.spool.close)
+
+    def collect_metrics(self) -> None:
+        event_buffer_size.set(value=len(self.buffer))
+
+
+event_pipeline = EventPipeline(
+    writer=copy_events,
+    spool=EventSpool(Config.EVENT_SPOOL_DIR),
+    max_buffer=Config.EVENT_BUFFER_SIZE,
+    batch_size=Config.EVENT_BATCH_SIZE,
+    flush_interval=Config.EVENT_FLUSH_INTERVAL,
+)
+registry.add_collector(event_pipeline.collect_metrics)
@@ -0,0 +1,222 @@
+import random
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import text, tuple_
+from sqlmodel import Session, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.dependencies.custom_exception import NotFoundError
+from app.core.config import Config
+from app.db.base_model import utcnow
+from app.db.models import Job
+from app.schemas.enums import JobStatus
+
+
+# A job whose lease ran out (its worker died) is only claimed again while it
+# has attempts left, and after the same backoff as a reported failure.
+CLAIM_JOB_SQL = """
+    UPDATE job
+    SET status = 'running',
+        attempts = attempts + 1,
+        locked_until = now() + make_interval(secs => :visibility_timeout),
+        updated_at = now()
+    WHERE uuid = (
+        SELECT uuid FROM job
+        WHERE status IN ('queued', 'running')
+          AND run_at <= now()
+          AND (
+              status = 'queued'
+              OR (attempts < max_attempts
+                  AND locked_until + make_interval(secs => :retry_base_delay * power(2, attempts - 1)) < now())
+          )
+          {kind_filter}
+        ORDER BY priority DESC, run_at
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING uuid
+"""
+CLAIM_ANY_JOB = text(CLAIM_JOB_SQL.format(kind_filter=""))
+CLAIM_JOB_OF_KINDS = text(CLAIM_JOB_SQL.format(kind_filter="AND kind = ANY(:kinds)"))
+
+# Jobs whose final attempt's lease ran out will never be claimed again
+FAIL_EXHAUSTED_JOBS = text("""
+    UPDATE job
+    SET status = 'failed', locked_until = NULL, updated_at = now(),
+        error = 'Lease expired on the final attempt; the worker likely crashed'
+    WHERE status = 'running' AND locked_until < now() AND attempts >= max_attempts
+""")
+
+
+class JobContext:
+    """Handed to a processor so it can report progress on its job."""
+
+    def __init__(
+        self,
+        job_id: UUID,
+        session_factory: Callable[[], Session],
+        attempt: int = 1,
+        max_attempts: int = 1,
+    ):
+        self.job_id = job_id
+        self.session_factory = session_factory
+        self.attempt = attempt
+        self.max_attempts = max_attempts
+
+    @property
+    def is_final_attempt(self) -> bool:
+        """True if the job won't be retried should this attempt fail."""
+        return self.attempt >= self.max_attempts
+
+    def report_progress(self, progress: float) -> None:
+        """Record progress (0-100); also renews the job's visibility lease."""
+        with self.session_factory() as session:
+            session.execute(
+                update(Job)
+                .where(*running_claim(self.job_id, self.attempt))
+                .values(
+                    progress=max(0.0, min(100.0, progress)),
+                    locked_until=utcnow() + timedelta(seconds=Config.JOB_VISIBILITY_TIMEOUT),
+                )
+            )
+            session.commit()
+
+
+def running_claim(job_id: UUID, attempt: int) -> tuple:
+    """
+    Filter matching a job only while it is still held by the claim that made ``attempt``.
+
+    Every claim increments ``attempts``, so it doubles as a fencing token: a
+    worker whose lease ran out and whose job was claimed again can no longer
+    write to it.
+    """
+    return Job.uuid == job_id, Job.status == JobStatus.RUNNING.value, Job.attempts == attempt
+
+
+Processor = Callable[[JobContext, Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+class JobQueue:
+    """Postgres-backed job queue.
+
+    Workers claim the highest-priority due job with ``FOR UPDATE SKIP LOCKED``,
+    so any number of them can poll the table without blocking each other. A
+    claimed job is invisible to other workers until ``locked_until``; if its
+    worker dies, the job is picked up again once the lease runs out. Failed jobs
+    are retried with exponential backoff until ``max_attempts``, and so are jobs
+    whose worker died; outcomes are only recorded while the claim still holds.
+    """
+
+    def __init__(self):
+        self.processors: Dict[str, Processor] = {}
+
+    def register(self, kind: str, processor: Processor) -> None:
+        """Register (or replace, e.g. with a fake in tests) the processor for a job kind."""
+        self.processors[kind] = processor
+
+    async def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        session: AsyncSession,
+        priority: int = 0,
+        max_attempts: int = 5,
+        owner_id: Optional[UUID] = None,
+        commit: bool = True,
+    ) -> Job:
+        """Add a job to the queue."""
+        job = Job(
+            kind=kind,
+            payload=payload,
+            priority=priority,
+            max_attempts=max_attempts,
+            owner_id=owner_id,
+        )
+        session.add(job)
+        if commit:
+            await session.commit()
+        return job
+
+    async def get_job(self, job_id: UUID, owner_id: UUID, session: AsyncSession) -> Job:
+        """Return a job owned by ``owner_id``."""
+        job = await session.get(Job, job_id)
+        if job is None or job.owner_id != owner_id:
+            raise NotFoundError("Job not found")
+        return job
+
+    def claim(self, session: Session, kinds: Optional[List[str]] = None) -> Optional[Job]:
+        """Claim the next due job, or return None if there is none."""
+        session.execute(FAIL_EXHAUSTED_JOBS)
+        job_id = session.execute(
+            CLAIM_JOB_OF_KINDS if kinds else CLAIM_ANY_JOB,
+            {
+                "visibility_timeout": Config.JOB_VISIBILITY_TIMEOUT,
+                "retry_base_delay": Config.JOB_RETRY_BASE_DELAY,
+                "kinds": kinds,
+            },
+        ).scalar()
+        session.commit()
+        return session.get(Job, job_id, populate_existing=True) if job_id else None
+
+    def extend_leases(self, session: Session, claims: List[Tuple[UUID, int]]) -> None:
+        """Push back the visibility timeout of jobs that are still running, given as (job id, attempt)."""
+        if not claims:
+            return
+        session.execute(
+            update(Job)
+            .where(
+                tuple_(Job.uuid, Job.attempts).in_(claims),
+                Job.status == JobStatus.RUNNING.value,
+            )
+            .values(locked_until=utcnow() + timedelta(seconds=Config.JOB_VISIBILITY_TIMEOUT))
+        )
+        session.commit()
+
+    def complete(self, session: Session, job_id: UUID, attempt: int, result: Optional[Dict[str, Any]]) -> bool:
+        """Record a success; return False if the claim was lost and the result discarded."""
+        completed = session.execute(
+            update(Job)
+            .where(*running_claim(job_id, attempt))
+            .values(
+                status=JobStatus.SUCCEEDED.value,
+                progress=100,
+                result=result,
+                error=None,
+                locked_until=None,
+                updated_at=utcnow(),
+            )
+        ).rowcount
+        session.commit()
+        return completed > 0
+
+    def fail(self, session: Session, job_id: UUID, attempt: int, error: str) -> Optional[Job]:
+        """
+        Record a failure; reschedule with backoff unless attempts are exhausted.
+
+        Returns None, recording nothing, if the claim was lost.
+        """
+        job = session.exec(
+            select(Job)
+            .where(*running_claim(job_id, attempt))
+            .with_for_update()
+            .execution_options(populate_existing=True)  # The locked row, not a copy from earlier in the session
+        ).first()
+        if job is None:
+            session.commit()
+            return None
+        job.error = error[:2000]
+        job.locked_until = None
+        if job.attempts < job.max_attempts:
+            delay = Config.JOB_RETRY_BASE_DELAY * 2 ** (job.attempts - 1)
+            job.status = JobStatus.QUEUED.value
+            job.run_at = utcnow() + timedelta(seconds=delay * random.uniform(0.8, 1.2))
+        else:
+            job.status = JobStatus.FAILED.value
+        session.add(job)
+        session.commit()
+        return job
+
+
+job_queue = JobQueue()
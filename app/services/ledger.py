@@ -0,0 +1,168 @@
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import List
+from uuid import uuid4
+
+from sqlalchemy import Uuid, bindparam, func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import Config
+from app.db import get_engine
+from app.db.models import Conversion
+from app.schemas.commission import ConversionCreate, SettlementReport
+from app.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Settles one chunk of conversions in a single statement. Each step is a
+# data-modifying CTE over the whole chunk:
+#   pending  - lock the next unsettled, attributable conversions in the window
+#   entries  - append a creator and a platform ledger line per conversion
+#   marked   - flag the conversions as settled
+#   balances - add each creator's total for the chunk to their running balance,
+#              locking balances in key order so concurrent runs can't deadlock
+# The creator share is rounded to cents and the platform gets the remainder, so
+# the two lines always sum to the commission exactly.
+SETTLE_CHUNK_SQL = text("""
+    WITH pending AS (
+        SELECT c.uuid, c.commission_amount, c.currency, l.creator_id
+        FROM conversion c
+        JOIN affiliate_link l ON l.code = c.link_code
+        WHERE c.settled_at IS NULL
+          AND c.occurred_at >= :window_start
+          AND c.occurred_at < :window_end
+        ORDER BY c.occurred_at, c.uuid
+        LIMIT :chunk_size
+        FOR UPDATE OF c SKIP LOCKED
+    ),
+    entries AS (
+        INSERT INTO commission_entry (uuid, created_at, conversion_id, settlement_id, account, creator_id, amount, currency)
+        SELECT gen_random_uuid(), now(), uuid, :settlement_id, 'creator', creator_id,
+               round(commission_amount * :creator_share, 2), currency
+        FROM pending
+        UNION ALL
+        SELECT gen_random_uuid(), now(), uuid, :settlement_id, 'platform', NULL,
+               commission_amount - round(commission_amount * :creator_share, 2), currency
+        FROM pending
+        ON CONFLICT (conversion_id, account) DO NOTHING
+        RETURNING account, creator_id, amount, currency
+    ),
+    marked AS (
+        UPDATE conversion
+        SET settled_at = now(), settlement_id = :settlement_id, updated_at = now()
+        FROM pending
+        WHERE conversion.uuid = pending.uuid
+        RETURNING conversion.uuid
+    ),
+    balances AS (
+        INSERT INTO creator_balance (uuid, created_at, creator_id, currency, balance, lifetime_earned)
+        SELECT gen_random_uuid(), now(), creator_id, currency, sum(amount), sum(amount)
+        FROM entries
+        WHERE account = 'creator'
+        GROUP BY creator_id, currency
+        ORDER BY creator_id, currency
+        ON CONFLICT (creator_id, currency) DO UPDATE SET
+            balance = creator_balance.balance + EXCLUDED.balance,
+            lifetime_earned = creator_balance.lifetime_earned + EXCLUDED.lifetime_earned,
+            updated_at = now()
+        RETURNING uuid
+    )
+    SELECT
+        (SELECT count(*) FROM marked) AS conversions,
+        (SELECT array_agg(uuid::text) FROM balances) AS balance_ids,
+        totals.currency,
+        totals.creator_amount,
+        totals.platform_amount
+    FROM (SELECT 1) AS one
+    LEFT JOIN (
+        SELECT currency,
+               sum(amount) FILTER (WHERE account = 'creator') AS creator_amount,
+               sum(amount) FILTER (WHERE account = 'platform') AS platform_amount
+        FROM entries
+        GROUP BY currency
+    ) AS totals ON true
+""").bindparams(bindparam("settlement_id", type_=Uuid))
+
+
+class CommissionLedger:
+    """
+    Records conversions and settles them into the commission ledger.
+
+    Settlement splits commissions between creators and the platform
+    (``CREATOR_COMMISSION_SHARE``, 70% by default) in set-based SQL, a chunk of
+    conversions per statement, and applies each chunk's per-creator totals to
+    ``creator_balance`` as one upsert. Chunks are claimed with SKIP LOCKED, so
+    several settlement runs can share a window safely.
+    """
+
+    def __init__(self, creator_share: Decimal = Config.CREATOR_COMMISSION_SHARE):
+        self.creator_share = creator_share
+
+    async def record_conversions(self, conversions: List[ConversionCreate], session: AsyncSession) -> int:
+        """Insert reported conversions, ignoring orders already recorded. Returns the number inserted."""
+        if not conversions:
+            return 0
+        statement = (
+            insert(Conversion)
+            .values([
+                # Stamped by the database clock, which the incremental watermarks compare against
+                {**Conversion(**conversion.model_dump()).model_dump(), "created_at": func.clock_timestamp()}
+                for conversion in conversions
+            ])
+            .on_conflict_do_nothing(constraint="uq_conversion_merchant_order")
+            .returning(Conversion.uuid)
+        )
+        result = await session.execute(statement)
+        inserted = len(result.all())
+        await session.commit()
+        return inserted
+
+    def settle(
+        self,
+        window_start: datetime,
+        window_end: datetime,
+        chunk_size: int = Config.SETTLEMENT_CHUNK_SIZE,
+    ) -> SettlementReport:
+        """Settle every unsettled conversion that occurred in [window_start, window_end)."""
+        report = SettlementReport(settlement_id=uuid4())
+        started = time.perf_counter()
+        params = {
+            "window_start": window_start,
+            "window_end": window_end,
+            "chunk_size": chunk_size,
+            "settlement_id": report.settlement_id,
+            "creator_share": self.creator_share,
+        }
+
+        # A creator's conversions can span chunks; count each balance once
+        balance_ids = set()
+        with Session(get_engine()) as session:
+            while True:
+                rows = session.execute(SETTLE_CHUNK_SQL, params).all()
+                session.commit()
+                if not rows[0].conversions:
+                    break
+                report.conversions += rows[0].conversions
+                balance_ids.update(rows[0].balance_ids or ())
+                for row in rows:
+                    if row.currency is None:
+                        continue
+                    creator_total = report.creator_amounts.get(row.currency, Decimal("0"))
+                    platform_total = report.platform_amounts.get(row.currency, Decimal("0"))
+                    report.creator_amounts[row.currency] = creator_total + (row.creator_amount or 0)
+                    report.platform_amounts[row.currency] = platform_total + (row.platform_amount or 0)
+
+        report.creator_balances_updated = len(balance_ids)
+        report.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            f"Settlement {report.settlement_id}: {report.conversions} conversions in "
+            f"{report.elapsed_seconds:.1f}s, creators {report.creator_amounts}, platform {report.platform_amounts}"
+        )
+        return report
+
+
+commission_ledger = CommissionLedger()
@@ -0,0 +1,175 @@
+import json
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from sqlmodel import Session
+
+from app.core.config import Config
+from app.db import get_engine
+from app.db.models import Review
+from app.schemas.enums import ReviewStatus
+from app.services.jobs import JobContext, job_queue
+from app.services.storage import storage
+from app.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+REVIEW_PROCESS_JOB = "review.process"
+
+# Minimum seconds between progress writes while transcoding
+PROGRESS_INTERVAL = 2.0
+
+
+def probe_duration(source: Path) -> float:
+    """Return the duration of a media file in seconds."""
+    output = subprocess.run(
+        [
+            Config.FFPROBE_BINARY,
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "json",
+            str(source),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(json.loads(output)["format"]["duration"])
+
+
+def make_thumbnail(source: Path, destination: Path, at_seconds: float) -> None:
+    """Grab a single frame as a JPEG."""
+    subprocess.run(
+        [
+            Config.FFMPEG_BINARY,
+            "-y", "-v", "error",
+            "-ss", f"{at_seconds:.2f}",
+            "-i", str(source),
+            "-frames:v", "1",
+            "-vf", "scale=640:-2",
+            str(destination),
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+
+def transcode(
+    source: Path,
+    destination: Path,
+    duration: float,
+    on_progress: Callable[[float], None],
+) -> None:
+    """
+    Transcode to H.264/AAC MP4 for playback, reporting progress (0-100).
+
+    ffmpeg writes ``key=value`` progress lines to stdout; ``out_time_us`` is
+    how far into the output it has got.
+    """
+    # stderr goes to a file: a pipe nobody reads until stdout closes would fill
+    # up and stall ffmpeg mid-transcode, with both sides waiting on each other
+    with tempfile.TemporaryFile(mode="w+") as stderr:
+        process = subprocess.Popen(
+            [
+                Config.FFMPEG_BINARY,
+                "-y", "-v", "error",
+                "-i", str(source),
+                "-c:v", "libx264", "-preset", "veryfast", "-crf", "23",
+                "-c:a", "aac", "-b:a", "128k",
+                "-movflags", "+faststart",
+                "-progress", "pipe:1", "-nostats",
+                str(destination),
+            ],
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            text=True,
+        )
+        try:
+            last_report = 0.0
+            for line in process.stdout:
+                key, _, value = line.strip().partition("=")
+                if key != "out_time_us" or not value.isdigit() or duration <= 0:
+                    continue
+                now = time.monotonic()
+                if now - last_report >= PROGRESS_INTERVAL:
+                    on_progress(min(100.0, int(value) / 1_000_000 / duration * 100))
+                    last_report = now
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            process.stdout.close()
+            process.wait()
+
+        if process.returncode != 0:
+            stderr.seek(0)
+            raise RuntimeError(f"ffmpeg exited with {process.returncode}: {stderr.read()[-500:]}")
+
+
+def set_review_status(review_id: UUID, status: ReviewStatus, **values: Any) -> Optional[Review]:
+    with Session(get_engine()) as session:
+        review = session.get(Review, review_id)
+        if review is None:
+            return None
+        review.status = status.value
+        for name, value in values.items():
+            setattr(review, name, value)
+        session.add(review)
+        session.commit()
+        session.refresh(review)
+        return review
+
+
+def process_review_video(ctx: JobContext, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Probe, thumbnail and transcode an uploaded review video.
+
+    Runs in a worker process. The review is marked FAILED only once the job
+    has no retries left.
+    """
+    review_id = UUID(payload["review_id"])
+    review = set_review_status(review_id, ReviewStatus.PROCESSING)
+    if review is None:
+        logger.warning(f"Review {review_id} no longer exists, skipping processing")
+        return None
+
+    source = storage.local_path(review.storage_key)
+    playback_key = f"{review.storage_key}.mp4"
+    thumbnail_key = f"{review.storage_key}.jpg"
+
+    try:
+        duration = probe_duration(source)
+        ctx.report_progress(5)
+        make_thumbnail(source, storage.local_path(thumbnail_key), at_seconds=min(1.0, duration / 2))
+        ctx.report_progress(10)
+        transcode(
+            source,
+            storage.local_path(playback_key),
+            duration,
+            on_progress=lambda progress: ctx.report_progress(10 + progress * 0.9),
+        )
+    except Exception:
+        if ctx.is_final_attempt:
+            set_review_status(review_id, ReviewStatus.FAILED)
+        raise
+
+    set_review_status(
+        review_id,
+        ReviewStatus.READY,
+        playback_key=playback_key,
+        thumbnail_key=thumbnail_key,
+        duration_seconds=duration,
+    )
+    return {
+        "playback_key": playback_key,
+        "thumbnail_key": thumbnail_key,
+        "duration_seconds": duration,
+    }
+
+
+job_queue.register(REVIEW_PROCESS_JOB, process_review_video)
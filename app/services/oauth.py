@@ -1,6 +1,7 @@
 from typing import Optional
 from fastapi import HTTPException
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db.models.user import User
 from app.schemas.enums import AuthProvider
@@ -60,6 +61,32 @@ class GoogleOauthServices:
         return user
         
 
+    async def create_async(self, email_data: UserOauthEmail, session: AsyncSession) -> User:
+        """
+        Creates a user using information from Google OAuth2 with an async session.
+
+        Args:
+            email_data: user email data
+            session: SQLModel AsyncSession
+
+        Returns:
+            User: the created user.
+        """
+        try:
+            user = User(
+                email=email_data.email,
+                is_verified=True,
+                auth_provider=AuthProvider.GOOGLE
+            )
+            session.add(user)
+            await session.commit()
+            await session.refresh(user)
+            return user
+
+        except Exception as e:
+            await session.rollback()
+            raise HTTPException(status_code=500, detail=f"OAuth user creation failed: {e}")
+
     def extract_email(self, google_response: dict) -> Optional[str]:
         """Safely extracts email from various possible Google OAuth formats."""
         if "email" in google_response:
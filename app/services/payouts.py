@@ -0,0 +1,329 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, List, Optional, Protocol, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import Uuid, bindparam, text
+
+from app.core.config import Config
+from app.db import get_async_engine
+from app.db.session import async_session_factory
+from app.schemas.payout import PayoutReport, PayoutRequest
+from app.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class PayoutDeclinedError(Exception):
+    """The provider refused a payout for good (e.g. closed account); retrying won't help."""
+
+
+class PaymentProvider(Protocol):
+    async def pay(self, request: PayoutRequest) -> str:
+        """
+        Pay out ``request``, returning the provider's reference for the transfer.
+
+        Repeating a request with the same idempotency key must not pay twice;
+        the provider returns the original transfer's reference instead.
+
+        Raises:
+            PayoutDeclinedError: If the payout can never succeed. Any other
+                exception is treated as transient and the payout is retried.
+        """
+        ...
+
+
+class FakePaymentProvider:
+    """In-process provider for tests and benchmarks, with simulated latency and failures."""
+
+    def __init__(self, latency: float = 0.0, decline_rate: float = 0.0, error_rate: float = 0.0):
+        self.latency = latency
+        self.decline_rate = decline_rate
+        self.error_rate = error_rate
+        self.transfers: Dict[str, PayoutRequest] = {}
+        self.calls = 0
+
+    async def pay(self, request: PayoutRequest) -> str:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if request.idempotency_key not in self.transfers:
+            if random.random() < self.error_rate:
+                raise ConnectionError("Simulated provider outage")
+            if random.random() < self.decline_rate:
+                raise PayoutDeclinedError("Simulated decline")
+            self.transfers[request.idempotency_key] = request
+        return f"fake-{request.idempotency_key}"
+
+    @property
+    def paid(self) -> Dict[str, Decimal]:
+        totals: Dict[str, Decimal] = {}
+        for transfer in self.transfers.values():
+            totals[transfer.currency] = totals.get(transfer.currency, Decimal("0")) + transfer.amount
+        return totals
+
+
+PAYOUT_COLUMNS = "uuid, creator_id, currency, amount, idempotency_key"
+
+# Creates the payouts of one keyset chunk of balances in a single statement:
+#   eligible - lock the next balances over the minimum without a payout in flight
+#   debited  - move the whole balance out of creator_balance
+#   created  - into a pending payout, claimed by this run for the lease
+# Balances locked by another runner are skipped; they're that runner's chunk.
+CREATE_PAYOUTS_SQL = text(f"""
+    WITH eligible AS (
+        SELECT b.uuid, b.creator_id, b.currency, b.balance
+        FROM creator_balance b
+        WHERE b.uuid > :after
+          AND b.balance >= :minimum
+          AND NOT EXISTS (
+              SELECT 1 FROM payout p
+              WHERE p.creator_id = b.creator_id AND p.currency = b.currency AND p.status = 'pending'
+          )
+        ORDER BY b.uuid
+        LIMIT :chunk_size
+        FOR UPDATE OF b SKIP LOCKED
+    ),
+    debited AS (
+        UPDATE creator_balance
+        SET balance = creator_balance.balance - eligible.balance, updated_at = now()
+        FROM eligible
+        WHERE creator_balance.uuid = eligible.uuid
+    ),
+    created AS (
+        INSERT INTO payout (uuid, created_at, run_id, creator_id, currency, amount, status,
+                            idempotency_key, attempts, claimed_until)
+        SELECT payout_id, now(), :run_id, creator_id, currency, balance, 'pending',
+               'payout-' || payout_id, 0, now() + make_interval(secs => :lease)
+        FROM (SELECT gen_random_uuid() AS payout_id, * FROM eligible) AS new_payouts
+        RETURNING {PAYOUT_COLUMNS}
+    )
+    SELECT last.uuid AS last_balance, created.*
+    FROM (SELECT uuid FROM eligible ORDER BY uuid DESC LIMIT 1) AS last
+    LEFT JOIN created ON true
+""").bindparams(bindparam("after", type_=Uuid), bindparam("run_id", type_=Uuid))
+
+# Takes over pending payouts whose claim expired: left by a crashed run, or due a retry
+CLAIM_STALE_SQL = text(f"""
+    UPDATE payout
+    SET run_id = :run_id, claimed_until = now() + make_interval(secs => :lease), updated_at = now()
+    WHERE uuid IN (
+        SELECT uuid FROM payout
+        WHERE status = 'pending' AND claimed_until < now()
+        ORDER BY uuid
+        LIMIT :chunk_size
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING {PAYOUT_COLUMNS}
+""").bindparams(bindparam("run_id", type_=Uuid))
+
+MARK_SUCCEEDED_SQL = text("""
+    UPDATE payout
+    SET status = 'succeeded', provider_reference = :reference, attempts = attempts + 1,
+        last_error = NULL, claimed_until = NULL, completed_at = now(), updated_at = now()
+    WHERE uuid = :uuid AND status = 'pending'
+""").bindparams(bindparam("uuid", type_=Uuid))
+
+# A declined payout gives the money back to the balance
+MARK_DECLINED_SQL = text("""
+    WITH declined AS (
+        UPDATE payout
+        SET status = 'failed', attempts = attempts + 1, last_error = :error,
+            claimed_until = NULL, completed_at = now(), updated_at = now()
+        WHERE uuid = :uuid AND status = 'pending'
+        RETURNING creator_id, currency, amount
+    )
+    UPDATE creator_balance
+    SET balance = creator_balance.balance + declined.amount, updated_at = now()
+    FROM declined
+    WHERE creator_balance.creator_id = declined.creator_id AND creator_balance.currency = declined.currency
+""").bindparams(bindparam("uuid", type_=Uuid))
+
+# The provider may or may not have paid; only a retry with the same key can tell
+MARK_RETRY_SQL = text("""
+    UPDATE payout
+    SET attempts = attempts + 1, last_error = :error,
+        claimed_until = now() + make_interval(secs => :retry_delay), updated_at = now()
+    WHERE uuid = :uuid AND status = 'pending'
+""").bindparams(bindparam("uuid", type_=Uuid))
+
+
+@dataclass
+class PendingPayout:
+    uuid: UUID
+    creator_id: UUID
+    currency: str
+    amount: Decimal
+    idempotency_key: str
+
+    def to_request(self) -> PayoutRequest:
+        return PayoutRequest(
+            idempotency_key=self.idempotency_key,
+            creator_id=self.creator_id,
+            amount=self.amount,
+            currency=self.currency,
+        )
+
+
+@dataclass
+class PayoutOutcome:
+    payout: PendingPayout
+    reference: Optional[str] = None
+    error: Optional[Exception] = None
+
+
+async def pay_all(provider: PaymentProvider, payouts: List[PendingPayout], concurrency: int) -> List[PayoutOutcome]:
+    """Submit ``payouts`` to the provider, at most ``concurrency`` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def pay(payout: PendingPayout) -> PayoutOutcome:
+        async with semaphore:
+            try:
+                return PayoutOutcome(payout, reference=await provider.pay(payout.to_request()))
+            except Exception as e:
+                return PayoutOutcome(payout, error=e)
+
+    return await asyncio.gather(*(pay(payout) for payout in payouts))
+
+
+class PayoutRunner:
+    """
+    Pays out creator balances in chunks.
+
+    Balances are walked in keyset order, a chunk per transaction, and each
+    chunk's balances are debited into pending payouts before anything is sent
+    to the provider. So a payout exists in the database, under its idempotency
+    key, before it can be paid, and a crashed run leaves pending payouts that
+    the next run resubmits with the same key instead of paying again. Rows are
+    claimed with SKIP LOCKED (and pending payouts with a lease), so several
+    runners can work in parallel.
+    """
+
+    def __init__(
+        self,
+        provider: PaymentProvider,
+        minimum: Decimal = Config.PAYOUT_MINIMUM,
+        chunk_size: int = Config.PAYOUT_CHUNK_SIZE,
+        concurrency: int = Config.PAYOUT_CONCURRENCY,
+        lease: int = Config.PAYOUT_LEASE_SECONDS,
+        retry_delay: int = Config.PAYOUT_RETRY_DELAY,
+    ):
+        self.provider = provider
+        self.minimum = minimum
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.lease = lease
+        self.retry_delay = retry_delay
+
+    async def _claim_stale(self, run_id: UUID) -> List[PendingPayout]:
+        async with async_session_factory(bind=get_async_engine()) as session:
+            result = await session.execute(
+                CLAIM_STALE_SQL, {"run_id": run_id, "lease": self.lease, "chunk_size": self.chunk_size}
+            )
+            payouts = [PendingPayout(**row._asdict()) for row in result]
+            await session.commit()
+        return payouts
+
+    async def _create_chunk(self, run_id: UUID, after: UUID) -> Tuple[List[PendingPayout], Optional[UUID]]:
+        """Create the next chunk's payouts; returns them and the keyset position (None when done)."""
+        async with async_session_factory(bind=get_async_engine()) as session:
+            result = await session.execute(CREATE_PAYOUTS_SQL, {
+                "after": after,
+                "minimum": self.minimum,
+                "chunk_size": self.chunk_size,
+                "run_id": run_id,
+                "lease": self.lease,
+            })
+            rows = result.all()
+            await session.commit()
+        if not rows:
+            return [], None
+        payouts = [
+            PendingPayout(row.uuid, row.creator_id, row.currency, row.amount, row.idempotency_key)
+            for row in rows
+            if row.uuid is not None
+        ]
+        return payouts, rows[0].last_balance
+
+    async def _submit(self, payouts: List[PendingPayout], report: PayoutReport) -> None:
+        outcomes = await pay_all(self.provider, payouts, self.concurrency)
+
+        succeeded, declined, retrying = [], [], []
+        for outcome in outcomes:
+            payout = outcome.payout
+            if outcome.error is None:
+                succeeded.append({"uuid": payout.uuid, "reference": outcome.reference})
+                report.amounts_paid[payout.currency] = report.amounts_paid.get(payout.currency, Decimal("0")) + payout.amount
+            elif isinstance(outcome.error, PayoutDeclinedError):
+                declined.append({"uuid": payout.uuid, "error": str(outcome.error)})
+            else:
+                logger.warning(f"Payout {payout.uuid} failed, will retry: {outcome.error!r}")
+                retrying.append({"uuid": payout.uuid, "error": repr(outcome.error), "retry_delay": self.retry_delay})
+
+        async with async_session_factory(bind=get_async_engine()) as session:
+            for statement, params in (
+                (MARK_SUCCEEDED_SQL, succeeded),
+                (MARK_DECLINED_SQL, declined),
+                (MARK_RETRY_SQL, retrying),
+            ):
+                if params:
+                    await session.execute(statement, params)
+            await session.commit()
+
+        report.succeeded += len(succeeded)
+        report.declined += len(declined)
+        report.retrying += len(retrying)
+
+    async def run(self) -> PayoutReport:
+        """Resume stale payouts, then pay every eligible balance."""
+        report = PayoutReport(run_id=uuid4())
+        started = time.perf_counter()
+
+        while payouts := await self._claim_stale(report.run_id):
+            await self._submit(payouts, report)
+
+        after = UUID(int=0)
+        while True:
+            payouts, after = await self._create_chunk(report.run_id, after)
+            if after is None:
+                break
+            if payouts:
+                await self._submit(payouts, report)
+
+        report.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            f"Payout run {report.run_id}: {report.succeeded} paid, {report.declined} declined, "
+            f"{report.retrying} to retry in {report.elapsed_seconds:.1f}s, paid {report.amounts_paid}"
+        )
+        return report
+
+
+# The fake provider reports success without moving money
+FAKE_PROVIDER_ENVIRONMENTS = ("dev", "test")
+
+
+def create_provider() -> PaymentProvider:
+    """
+    The payment provider named by ``PAYOUT_PROVIDER``.
+
+    Raises:
+        ValueError: If no provider is configured, the provider is unknown, or
+            the fake provider is configured outside dev/test.
+    """
+    if not Config.PAYOUT_PROVIDER:
+        raise ValueError("PAYOUT_PROVIDER is not set; configure a payment provider to run payouts")
+    if Config.PAYOUT_PROVIDER == "fake":
+        if Config.PYTHON_ENV not in FAKE_PROVIDER_ENVIRONMENTS:
+            raise ValueError(f"The fake payout provider pays nothing and can't be used in {Config.PYTHON_ENV}")
+        logger.warning("Using the fake payout provider: balances are debited but nothing is paid")
+        return FakePaymentProvider()
+    raise ValueError(f"Unknown payout provider: {Config.PAYOUT_PROVIDER}")
+
+
+def create_payout_runner() -> PayoutRunner:
+    """A runner paying through the configured provider; built on demand so a missing provider fails the run, not imports."""
+    return PayoutRunner(provider=create_provider())
@@ -0,0 +1,59 @@
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.models import Review
+from app.db.pagination import paginate
+from app.schemas.enums import ReviewStatus
+from app.services.trending import trending_feed
+
+
+class ReviewService:
+    """Service for reading published reviews."""
+
+    async def get_feed(
+        self,
+        session: AsyncSession,
+        limit: int,
+        cursor: Optional[str] = None,
+        creator_id: Optional[UUID] = None,
+    ) -> Tuple[List[Review], Optional[str]]:
+        """
+        Return a page of ready reviews, newest first, optionally for one creator.
+
+        Served by the ``ix_review_feed`` / ``ix_review_creator_feed`` indexes.
+        """
+        statement = select(Review).where(Review.status == ReviewStatus.READY.value)
+        if creator_id is not None:
+            statement = statement.where(Review.creator_id == creator_id)
+        return await paginate(session, statement, Review, limit=limit, cursor=cursor)
+
+    async def get_trending(
+        self,
+        session: AsyncSession,
+        limit: int,
+        offset: int = 0,
+        category: Optional[str] = None,
+    ) -> List[Review]:
+        """
+        Return a page of the hottest reviews, optionally among those linking to products of ``category``.
+
+        The order comes from the ranking published by the trending ranker; the
+        reviews themselves are fetched by primary key in one query.
+        """
+        review_ids = await trending_feed.get_review_ids(category, offset=offset, limit=limit)
+        if not review_ids:
+            return []
+        reviews = await session.exec(
+            select(Review).where(
+                Review.uuid.in_([UUID(review_id) for review_id in review_ids]),
+                Review.status == ReviewStatus.READY.value,
+            )
+        )
+        by_id = {str(review.uuid): review for review in reviews}
+        return [by_id[review_id] for review_id in review_ids if review_id in by_id]
+
+
+review_service = ReviewService()
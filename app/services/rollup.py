@@ -0,0 +1,279 @@
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import Uuid, bindparam, text
+from sqlmodel import Session, select
+
+from app.core.config import Config
+from app.db import get_async_engine, get_engine
+from app.db.models import EngagementRollupDaily, EngagementRollupHourly, RollupWatermark
+from app.db.session import async_session_factory
+from app.schemas.dashboard import ContentStats, TimeBucketStats
+from app.schemas.enums import Granularity
+from app.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+MAX_ID = 2 ** 63 - 1
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+FAR_FUTURE = datetime(9999, 1, 1, tzinfo=timezone.utc)
+
+HOUR_BUCKET = "date_trunc('hour', {column} AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+CONTENT_TYPE = "CASE WHEN {review} IS NULL THEN 'product' ELSE 'review' END"
+
+# Per-source deltas at hourly granularity, all with the same columns. Views are
+# attributed through the review, clicks/conversions/earnings through the link.
+# {creator_filter} narrows a delta to one creator (for the dashboard tail).
+EVENT_DELTA_SQL = f"""
+    SELECT coalesce(l.creator_id, r.creator_id) AS creator_id,
+           {HOUR_BUCKET.format(column="e.occurred_at")} AS bucket_start,
+           {CONTENT_TYPE.format(review="coalesce(l.review_id, e.review_id)")} AS content_type,
+           coalesce(l.review_id, e.review_id, l.product_id) AS content_id,
+           count(*) FILTER (WHERE e.event_type = 'view') AS views,
+           count(*) FILTER (WHERE e.event_type = 'click') AS clicks,
+           0 AS conversions,
+           0 AS earnings
+    FROM event e
+    LEFT JOIN affiliate_link l ON l.code = e.link_code
+    LEFT JOIN review r ON r.uuid = e.review_id
+    WHERE e.id > :event_lo AND e.id <= :event_hi
+      AND coalesce(l.creator_id, r.creator_id) IS NOT NULL
+      {{creator_filter}}
+    GROUP BY 1, 2, 3, 4
+"""
+
+CONVERSION_DELTA_SQL = f"""
+    SELECT l.creator_id,
+           {HOUR_BUCKET.format(column="c.occurred_at")} AS bucket_start,
+           {CONTENT_TYPE.format(review="l.review_id")} AS content_type,
+           coalesce(l.review_id, l.product_id) AS content_id,
+           0 AS views,
+           0 AS clicks,
+           count(*) AS conversions,
+           0 AS earnings
+    FROM conversion c
+    JOIN affiliate_link l ON l.code = c.link_code
+    WHERE c.created_at > :conversion_lo AND c.created_at <= :conversion_hi
+      {{creator_filter}}
+    GROUP BY 1, 2, 3, 4
+"""
+
+EARNINGS_DELTA_SQL = f"""
+    SELECT ce.creator_id,
+           {HOUR_BUCKET.format(column="c.occurred_at")} AS bucket_start,
+           {CONTENT_TYPE.format(review="l.review_id")} AS content_type,
+           coalesce(l.review_id, l.product_id) AS content_id,
+           0 AS views,
+           0 AS clicks,
+           0 AS conversions,
+           sum(ce.amount) AS earnings
+    FROM commission_entry ce
+    JOIN conversion c ON c.uuid = ce.conversion_id
+    JOIN affiliate_link l ON l.code = c.link_code
+    WHERE ce.account = 'creator' AND ce.currency = :currency
+      AND ce.created_at > :commission_lo AND ce.created_at <= :commission_hi
+      {{creator_filter}}
+    GROUP BY 1, 2, 3, 4
+"""
+
+ROLLUP_COLUMNS = "creator_id, bucket_start, content_type, content_id, views, clicks, conversions, earnings"
+ROLLUP_KEY = "creator_id, bucket_start, content_type, content_id"
+ROLLUP_INCREMENT = ", ".join(f"{column} = t.{column} + EXCLUDED.{column}" for column in ("views", "clicks", "conversions", "earnings"))
+
+# Adds one delta to both rollup tables in a single statement
+APPLY_DELTA_SQL = f"""
+    WITH delta AS ({{delta}}),
+    hourly AS (
+        INSERT INTO engagement_rollup_hourly AS t ({ROLLUP_COLUMNS})
+        SELECT {ROLLUP_COLUMNS} FROM delta
+        ON CONFLICT ({ROLLUP_KEY}) DO UPDATE SET {ROLLUP_INCREMENT}
+        RETURNING 1
+    )
+    INSERT INTO engagement_rollup_daily AS t ({ROLLUP_COLUMNS})
+    SELECT creator_id, date_trunc('day', bucket_start AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+           content_type, content_id, sum(views), sum(clicks), sum(conversions), sum(earnings)
+    FROM delta
+    GROUP BY 1, 2, 3, 4
+    ON CONFLICT ({ROLLUP_KEY}) DO UPDATE SET {ROLLUP_INCREMENT}
+"""
+
+SOURCES = {
+    "event": EVENT_DELTA_SQL,
+    "conversion": CONVERSION_DELTA_SQL,
+    "commission": EARNINGS_DELTA_SQL,
+}
+
+CREATOR_FILTERS = {
+    "event": "AND coalesce(l.creator_id, r.creator_id) = :creator_id",
+    "conversion": "AND l.creator_id = :creator_id",
+    "commission": "AND ce.creator_id = :creator_id",
+}
+
+TAIL_SQL = text(" UNION ALL ".join(
+    f"({sql.format(creator_filter=CREATOR_FILTERS[source])})" for source, sql in SOURCES.items()
+)).bindparams(bindparam("creator_id", type_=Uuid))
+
+
+@dataclass
+class RollupRow:
+    creator_id: UUID
+    bucket_start: datetime
+    content_type: str
+    content_id: UUID
+    views: int
+    clicks: int
+    conversions: int
+    earnings: Decimal
+
+
+class RollupAggregator:
+    """
+    Folds new events, conversions and commissions into the hourly and daily rollup tables.
+
+    Each run consumes only rows past a per-source high-water mark and applies
+    them as increments, in one transaction together with the new marks, so
+    every row is counted exactly once. Events are tracked by id; since ids are
+    assigned before concurrent batches commit, a run only consumes ids seen by
+    the previous run. Conversions and commissions are tracked by ``created_at``
+    minus ``ROLLUP_SAFETY_LAG`` seconds for the same reason.
+    """
+
+    def __init__(self, safety_lag: int = Config.ROLLUP_SAFETY_LAG, currency: str = Config.DEFAULT_CURRENCY):
+        self.safety_lag = safety_lag
+        self.currency = currency
+
+    def _watermarks(self, session: Session) -> Dict[str, RollupWatermark]:
+        marks = {mark.source: mark for mark in session.exec(select(RollupWatermark).with_for_update())}
+        for source in SOURCES:
+            if source not in marks:
+                marks[source] = RollupWatermark(source=source, last_time=EPOCH)
+        return marks
+
+    def run(self) -> Dict[str, int]:
+        """Apply one increment; returns the number of daily rollup rows touched per source."""
+        started = time.perf_counter()
+        applied = {}
+        with Session(get_engine()) as session:
+            # One aggregator at a time; a concurrent run waits here, then sees the new marks
+            session.execute(text("SELECT pg_advisory_xact_lock(hashtext('engagement_rollup'))"))
+            marks = self._watermarks(session)
+            # Database time, like the created_at it is compared with, so host clock skew can't skip rows
+            time_hi = session.execute(
+                text("SELECT now() - make_interval(secs => :lag)"), {"lag": self.safety_lag}
+            ).scalar_one()
+            event_mark = marks["event"]
+            params = {
+                "event_lo": event_mark.last_id,
+                "event_hi": event_mark.next_id,
+                "conversion_lo": marks["conversion"].last_time,
+                "conversion_hi": time_hi,
+                "commission_lo": marks["commission"].last_time,
+                "commission_hi": time_hi,
+                "currency": self.currency,
+            }
+            for source, delta in SOURCES.items():
+                result = session.execute(
+                    text(APPLY_DELTA_SQL.format(delta=delta.format(creator_filter=""))), params
+                )
+                applied[source] = result.rowcount
+
+            event_mark.last_id = event_mark.next_id
+            event_mark.next_id = session.execute(text("SELECT coalesce(max(id), 0) FROM event")).scalar()
+            marks["conversion"].last_time = time_hi
+            marks["commission"].last_time = time_hi
+            session.add_all(marks.values())
+            session.commit()
+
+        logger.info(f"Rolled up engagement in {time.perf_counter() - started:.2f}s: {applied}")
+        return applied
+
+
+class DashboardService:
+    """Creator dashboard stats, read from the rollups plus the not-yet-rolled-up tail.
+
+    The rollups, the marks and the tail are read in one REPEATABLE READ snapshot,
+    so a concurrent aggregator run can't make a row count twice or not at all.
+    The cost depends on the creator's number of buckets and the size of the
+    tail, not on the total volume of raw events.
+    """
+
+    def __init__(self, currency: str = Config.DEFAULT_CURRENCY):
+        self.currency = currency
+
+    async def _rows(
+        self,
+        creator_id: UUID,
+        granularity: Granularity,
+        since: datetime,
+        until: datetime,
+    ) -> List[RollupRow]:
+        table = EngagementRollupHourly if granularity == Granularity.HOUR else EngagementRollupDaily
+        since = self._truncate(since, granularity)
+
+        # A session of its own, as the isolation level must be set before its first query
+        async with async_session_factory(bind=get_async_engine()) as session:
+            await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+            rolled = await session.exec(
+                select(table).where(
+                    table.creator_id == creator_id,
+                    table.bucket_start >= since,
+                    table.bucket_start < until,
+                )
+            )
+            rows = [RollupRow(**row.model_dump()) for row in rolled]
+
+            marks = {mark.source: mark for mark in await session.exec(select(RollupWatermark))}
+            event_mark = marks.get("event")
+            conversion_mark = marks.get("conversion")
+            commission_mark = marks.get("commission")
+            tail = await session.execute(TAIL_SQL, {
+                "creator_id": creator_id,
+                "event_lo": event_mark.last_id if event_mark else 0,
+                "event_hi": MAX_ID,
+                "conversion_lo": conversion_mark.last_time if conversion_mark else EPOCH,
+                "conversion_hi": FAR_FUTURE,
+                "commission_lo": commission_mark.last_time if commission_mark else EPOCH,
+                "commission_hi": FAR_FUTURE,
+                "currency": self.currency,
+            })
+            for row in tail:
+                bucket_start = self._truncate(row.bucket_start, granularity)
+                if since <= bucket_start < until:
+                    rows.append(RollupRow(**{**row._asdict(), "bucket_start": bucket_start}))
+
+        return rows
+
+    @staticmethod
+    def _truncate(value: datetime, granularity: Granularity) -> datetime:
+        value = value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        return value.replace(hour=0) if granularity == Granularity.DAY else value
+
+    async def get_timeseries(
+        self,
+        creator_id: UUID,
+        granularity: Granularity,
+        since: datetime,
+        until: datetime,
+    ) -> List[TimeBucketStats]:
+        """Totals per time bucket across all of a creator's content."""
+        totals: Dict[datetime, TimeBucketStats] = {}
+        for row in await self._rows(creator_id, granularity, since, until):
+            totals.setdefault(row.bucket_start, TimeBucketStats(bucket_start=row.bucket_start)).add(row)
+        return sorted(totals.values(), key=lambda bucket: bucket.bucket_start)
+
+    async def get_content_stats(self, creator_id: UUID, since: datetime, until: datetime) -> List[ContentStats]:
+        """Totals per review/product over a period, highest earning first."""
+        totals: Dict[Tuple[str, UUID], ContentStats] = {}
+        for row in await self._rows(creator_id, Granularity.DAY, since, until):
+            key = (row.content_type, row.content_id)
+            totals.setdefault(key, ContentStats(content_type=row.content_type, content_id=row.content_id)).add(row)
+        return sorted(totals.values(), key=lambda stats: (stats.earnings, stats.clicks, stats.views), reverse=True)
+
+
+rollup_aggregator = RollupAggregator()
+dashboard_service = DashboardService()
@@ -0,0 +1,287 @@
+import bisect
+import heapq
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Protocol, Tuple
+from uuid import UUID
+
+from sqlalchemy import Uuid, bindparam, text
+from sqlalchemy.sql.elements import TextClause
+
+from app.api.dependencies.custom_exception import BadRequestError
+from app.core.config import Config
+from app.db import get_async_engine
+from app.db.base_model import utcnow
+from app.db.pagination import decode_cursor_values, encode_cursor_values
+from app.db.session import async_session_factory
+from app.schemas.enums import SearchKind
+from app.schemas.search import SearchHit
+
+
+TERM_PATTERN = re.compile(r"[^\W_]+")
+MAX_TERMS = 8
+
+
+class SearchAfter(NamedTuple):
+    """Sort key of the last hit of the previous page."""
+    score: float
+    uuid: UUID
+
+
+def tokenize(value: str) -> List[str]:
+    return TERM_PATTERN.findall(value.lower())
+
+
+def parse_query(query: str) -> List[str]:
+    """Split a search box query into lowercase terms, each to be matched as a word prefix."""
+    return tokenize(query)[:MAX_TERMS]
+
+
+def recency_factor(age_seconds: float, half_life_seconds: float) -> float:
+    """1 for brand new content, 1/2 at one half-life, 1/3 at two, ..."""
+    return 1.0 / (1.0 + max(age_seconds, 0.0) / half_life_seconds)
+
+
+class SearchBackend(Protocol):
+    async def search(
+        self,
+        kind: SearchKind,
+        terms: List[str],
+        as_of: datetime,
+        limit: int,
+        after: Optional[SearchAfter] = None,
+    ) -> List[SearchHit]:
+        """
+        Up to ``limit`` hits matching every term as a prefix, best first.
+
+        Scores are text relevance times ``recency_factor`` of the age at
+        ``as_of``; content created after ``as_of`` is left out, so paging with
+        the same ``as_of`` is stable. With ``after``, only hits sorting
+        strictly after it are returned.
+        """
+        ...
+
+
+# Relevance is ts_rank over the weighted, generated search_vector column (GIN
+# indexed), scaled down by age. Ties are broken by uuid so the order is total.
+SEARCH_SQL = """
+    SELECT uuid, title, description, created_at, score
+    FROM (
+        SELECT t.uuid, t.title, t.description, t.created_at,
+               CAST(ts_rank(t.search_vector, query) AS double precision)
+                   / (1 + CAST(extract(epoch FROM CAST(:as_of AS timestamptz) - t.created_at) AS double precision)
+                          / :half_life) AS score
+        FROM {table} t, to_tsquery('english', :query) AS query
+        WHERE t.search_vector @@ query AND t.created_at <= :as_of {filter}
+    ) AS ranked
+    {after}
+    ORDER BY score DESC, uuid DESC
+    LIMIT :limit
+"""
+
+SEARCH_AFTER_SQL = "WHERE (score, uuid) < (CAST(:after_score AS double precision), :after_uuid)"
+
+SEARCH_TARGETS: Dict[SearchKind, Tuple[str, str]] = {
+    SearchKind.REVIEW: ("review", "AND t.status = 'ready'"),
+    SearchKind.PRODUCT: ("product", ""),
+}
+
+
+def build_search_statement(table: str, filter: str = "", after: bool = False) -> TextClause:
+    statement = text(SEARCH_SQL.format(table=table, filter=filter, after=SEARCH_AFTER_SQL if after else ""))
+    if after:
+        statement = statement.bindparams(bindparam("after_uuid", type_=Uuid))
+    return statement
+
+
+def search_params(terms: List[str], as_of: datetime, limit: int, after: Optional[SearchAfter], half_life: float) -> dict:
+    params = {
+        "query": " & ".join(f"{term}:*" for term in terms),
+        "as_of": as_of,
+        "half_life": half_life,
+        "limit": limit,
+    }
+    if after is not None:
+        params.update(after_score=after.score, after_uuid=after.uuid)
+    return params
+
+
+class PostgresSearchBackend:
+    """Full-text search with Postgres tsvector/tsquery."""
+
+    def __init__(self, half_life_days: float):
+        self.half_life = half_life_days * 86400
+        self.statements = {
+            (kind, after): build_search_statement(table, filter, after)
+            for kind, (table, filter) in SEARCH_TARGETS.items()
+            for after in (False, True)
+        }
+
+    async def search(
+        self,
+        kind: SearchKind,
+        terms: List[str],
+        as_of: datetime,
+        limit: int,
+        after: Optional[SearchAfter] = None,
+    ) -> List[SearchHit]:
+        async with async_session_factory(bind=get_async_engine()) as session:
+            result = await session.execute(
+                self.statements[(kind, after is not None)],
+                search_params(terms, as_of, limit, after, self.half_life),
+            )
+            return [SearchHit.model_validate(row._asdict()) for row in result]
+
+
+@dataclass
+class IndexedDocument:
+    uuid: UUID
+    title: str
+    description: Optional[str]
+    created_at: datetime
+
+
+class InvertedIndex:
+    """In-process inverted index: term -> {document: weight}, with sorted terms for prefix lookups.
+
+    Relevance approximates ``ts_rank``: per query term, the best weight among
+    the document's terms it prefixes, summed over query terms. There is no
+    stemming, so matching is purely by prefix of the lowercased words.
+    """
+
+    # ts_rank's default weights for labels A-D
+    WEIGHTS = {"A": 1.0, "B": 0.4, "C": 0.2, "D": 0.1}
+
+    def __init__(self):
+        self.documents: Dict[UUID, IndexedDocument] = {}
+        self.postings: Dict[str, Dict[UUID, float]] = defaultdict(dict)
+        self._sorted_terms: Optional[List[str]] = None
+
+    def add(self, document: IndexedDocument, weighted_text: Dict[str, Optional[str]]) -> None:
+        """Index ``document`` with texts keyed by weight label, e.g. ``{"A": title, "B": description}``."""
+        self.documents[document.uuid] = document
+        for label, value in weighted_text.items():
+            for term in tokenize(value or ""):
+                postings = self.postings[term]
+                postings[document.uuid] = max(postings.get(document.uuid, 0.0), self.WEIGHTS[label])
+        self._sorted_terms = None
+
+    def _expand(self, prefix: str) -> List[str]:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.postings)
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        end = bisect.bisect_left(self._sorted_terms, prefix + "\U0010ffff")
+        return self._sorted_terms[start:end]
+
+    def match(self, terms: List[str]) -> Dict[UUID, float]:
+        """Text relevance of the documents matching every term as a prefix."""
+        scores: Optional[Dict[UUID, float]] = None
+        for prefix in terms:
+            term_scores: Dict[UUID, float] = {}
+            for term in self._expand(prefix):
+                for uuid, weight in self.postings[term].items():
+                    if weight > term_scores.get(uuid, 0.0):
+                        term_scores[uuid] = weight
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {uuid: score + term_scores[uuid] for uuid, score in scores.items() if uuid in term_scores}
+            if not scores:
+                break
+        return scores or {}
+
+
+class MemorySearchBackend:
+    """Search over in-process inverted indexes; a stand-in for Postgres in tests."""
+
+    def __init__(self, half_life_days: float):
+        self.half_life = half_life_days * 86400
+        self.indexes = {kind: InvertedIndex() for kind in SearchKind}
+
+    async def search(
+        self,
+        kind: SearchKind,
+        terms: List[str],
+        as_of: datetime,
+        limit: int,
+        after: Optional[SearchAfter] = None,
+    ) -> List[SearchHit]:
+        index = self.indexes[kind]
+        ranked = []
+        for uuid, relevance in index.match(terms).items():
+            created_at = index.documents[uuid].created_at
+            if created_at > as_of:
+                continue
+            key = (relevance * recency_factor((as_of - created_at).total_seconds(), self.half_life), uuid)
+            if after is None or key < after:
+                ranked.append(key)
+
+        hits = []
+        for score, uuid in heapq.nlargest(limit, ranked):
+            document = index.documents[uuid]
+            hits.append(SearchHit(
+                uuid=uuid,
+                title=document.title,
+                description=document.description,
+                created_at=document.created_at,
+                score=score,
+            ))
+        return hits
+
+
+class SearchService:
+    """Search over published reviews and products, paginated by cursor."""
+
+    def __init__(self, backend: SearchBackend):
+        self.backend = backend
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, SearchAfter]:
+        try:
+            as_of, score, uuid = decode_cursor_values(cursor)
+            return datetime.fromisoformat(as_of), SearchAfter(float(score), UUID(uuid))
+        except (TypeError, ValueError):
+            raise BadRequestError("Invalid cursor")
+
+    async def search(
+        self,
+        kind: SearchKind,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[SearchHit], Optional[str]]:
+        """
+        One page of results for ``query``, most relevant (allowing for age) first.
+
+        Every word of the query must match, the last one typically as the user
+        is still typing it, so each is matched as a prefix.
+
+        Returns:
+            The hits and the cursor for the next page (None on the last page).
+
+        Raises:
+            BadRequestError: If the query has no words or the cursor is malformed.
+        """
+        terms = parse_query(query)
+        if not terms:
+            raise BadRequestError("Search query must contain a word")
+
+        # The cursor pins the time ages are measured at, so scores don't drift between pages
+        as_of, after = self._decode_cursor(cursor) if cursor else (utcnow(), None)
+        hits = await self.backend.search(kind, terms, as_of, limit + 1, after)
+        if len(hits) > limit:
+            hits = hits[:limit]
+            last = hits[-1]
+            return hits, encode_cursor_values([as_of.isoformat(), last.score, str(last.uuid)])
+        return hits, None
+
+
+def create_backend() -> SearchBackend:
+    if Config.SEARCH_BACKEND == "memory":
+        return MemorySearchBackend(Config.SEARCH_RECENCY_HALF_LIFE_DAYS)
+    return PostgresSearchBackend(Config.SEARCH_RECENCY_HALF_LIFE_DAYS)
+
+
+search_service = SearchService(backend=create_backend())
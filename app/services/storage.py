@@ -0,0 +1,70 @@
+from pathlib import Path
+from typing import AsyncIterator, Protocol
+
+import anyio
+
+from app.core.config import Config
+
+
+class StorageBackend(Protocol):
+    """Where uploaded media is stored."""
+
+    async def write_stream(self, key: str, offset: int, chunks: AsyncIterator[bytes], limit: int) -> int:
+        """Write ``chunks`` to ``key`` starting at ``offset``, at most ``limit`` bytes.
+
+        Returns the number of bytes written.
+        """
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Delete ``key``; a no-op if it doesn't exist."""
+        ...
+
+    def local_path(self, key: str) -> Path:
+        """Path of the object on local disk (for processing jobs)."""
+        ...
+
+
+class LocalStorageBackend:
+    """Stores objects as files under a root directory.
+
+    Chunks are written straight to disk as they arrive, so memory use per upload
+    is bounded by the size of a single network chunk.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def local_path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if self.root.resolve() not in path.parents:
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    async def write_stream(self, key: str, offset: int, chunks: AsyncIterator[bytes], limit: int) -> int:
+        path = self.local_path(key)
+        await anyio.to_thread.run_sync(lambda: path.parent.mkdir(parents=True, exist_ok=True))
+        await anyio.to_thread.run_sync(path.touch)
+
+        written = 0
+        async with await anyio.open_file(path, "r+b") as f:
+            await f.seek(offset)
+            try:
+                async for chunk in chunks:
+                    if not chunk:
+                        continue
+                    chunk = chunk[: limit - written]
+                    await f.write(chunk)
+                    written += len(chunk)
+                    if written >= limit:
+                        break
+            finally:
+                await f.flush()
+        return written
+
+    async def delete(self, key: str) -> None:
+        path = self.local_path(key)
+        await anyio.to_thread.run_sync(lambda: path.unlink(missing_ok=True))
+
+
+storage = LocalStorageBackend(root=Config.UPLOAD_DIR)
@@ -0,0 +1,235 @@
+import io
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import Config
+from app.db import get_engine
+from app.db.base_model import utcnow
+from app.utils.logger import get_logger
+from app.utils.redis_client import InstrumentedAsyncRedis, InstrumentedRedis
+
+
+logger = get_logger(__name__)
+
+# How much each kind of engagement counts towards a review's heat
+VIEW_WEIGHT = 1.0
+CLICK_WEIGHT = 5.0
+CONVERSION_WEIGHT = 25.0
+
+# Bounds of the quality multiplier (smoothed click-through rate over the average)
+MIN_QUALITY = 0.25
+MAX_QUALITY = 4.0
+
+# Rankable reviews, numbered so the other queries can return array indexes
+CREATE_REVIEWS_SQL = """
+    CREATE TEMP TABLE trending_review ON COMMIT DROP AS
+    SELECT uuid, row_number() OVER (ORDER BY uuid) - 1 AS idx
+    FROM review
+    WHERE status = 'ready'
+"""
+
+COPY_COUNTERS_SQL = """
+    COPY (
+        SELECT r.idx, extract(epoch FROM %(now)s - h.bucket_start) / 3600, h.views, h.clicks, h.conversions
+        FROM engagement_rollup_hourly h
+        JOIN trending_review r ON r.uuid = h.content_id
+        WHERE h.content_type = 'review' AND h.bucket_start >= %(since)s
+    ) TO STDOUT WITH (FORMAT csv)
+"""
+
+CATEGORIES_SQL = """
+    SELECT DISTINCT r.idx, p.category
+    FROM affiliate_link l
+    JOIN product p ON p.uuid = l.product_id
+    JOIN trending_review r ON r.uuid = l.review_id
+    WHERE l.is_active AND p.category IS NOT NULL
+"""
+
+
+@dataclass
+class EngagementArrays:
+    """Recent hourly engagement of every rankable review, as parallel arrays.
+
+    Reviews are numbered 0..n-1 (``review_ids[i]`` is review ``i``). There is
+    one entry per (review, hour) in the bucket arrays and one per (review,
+    category) in the membership arrays.
+    """
+    review_ids: List[str]
+    bucket_review: np.ndarray
+    bucket_age_hours: np.ndarray
+    views: np.ndarray
+    clicks: np.ndarray
+    conversions: np.ndarray
+    categories: List[str]
+    member_review: np.ndarray
+    member_category: np.ndarray
+
+
+def compute_scores(data: EngagementArrays, half_life_hours: float, prior_views: float) -> np.ndarray:
+    """
+    Score every review in one vectorized pass.
+
+    Heat is the weighted engagement of each hourly bucket, halved every
+    ``half_life_hours`` of bucket age, summed per review. It is scaled by a
+    quality multiplier: the review's click-through rate, smoothed towards the
+    overall rate with ``prior_views`` of pseudo-evidence, relative to that rate.
+    """
+    n = len(data.review_ids)
+    decay = np.exp2(-data.bucket_age_hours / half_life_hours)
+    engagement = VIEW_WEIGHT * data.views + CLICK_WEIGHT * data.clicks + CONVERSION_WEIGHT * data.conversions
+    heat = np.bincount(data.bucket_review, weights=engagement * decay, minlength=n)
+
+    total_views = data.views.sum()
+    prior_ctr = data.clicks.sum() / total_views if total_views else 0.0
+    if prior_ctr > 0:
+        views = np.bincount(data.bucket_review, weights=data.views, minlength=n)
+        clicks = np.bincount(data.bucket_review, weights=data.clicks, minlength=n)
+        smoothed_ctr = (clicks + prior_views * prior_ctr) / (views + prior_views)
+        quality = np.clip(smoothed_ctr / prior_ctr, MIN_QUALITY, MAX_QUALITY)
+    else:
+        quality = np.ones(n)
+    return np.log1p(heat) * np.sqrt(quality)
+
+
+def top_k(scores: np.ndarray, k: int, candidates: Optional[np.ndarray] = None) -> np.ndarray:
+    """Indexes of the (unordered) ``k`` best-scoring candidates with a positive score."""
+    candidates = np.flatnonzero(scores > 0) if candidates is None else candidates[scores[candidates] > 0]
+    if len(candidates) > k:
+        candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+    return candidates
+
+
+def rank_by_category(data: EngagementArrays, scores: np.ndarray, k: int) -> Dict[Optional[str], np.ndarray]:
+    """Top ``k`` review indexes overall (under None) and per category of the products they link to."""
+    rankings = {None: top_k(scores, k)}
+    if len(data.member_review):
+        order = np.argsort(data.member_category, kind="stable")
+        members, member_categories = data.member_review[order], data.member_category[order]
+        boundaries = np.flatnonzero(np.diff(member_categories)) + 1
+        for start, group in zip(np.concatenate(([0], boundaries)), np.split(members, boundaries)):
+            rankings[data.categories[member_categories[start]]] = top_k(scores, k, group)
+    return rankings
+
+
+def trending_key(category: Optional[str]) -> str:
+    return f"trending:reviews:category:{category}" if category is not None else "trending:reviews:all"
+
+
+class TrendingRanker:
+    """
+    Periodically recomputes the trending reviews, overall and per product category.
+
+    Recent counters come from the hourly engagement rollups, so a recompute
+    reads a bounded window whatever the total traffic, and every review is
+    scored in a handful of NumPy operations instead of per row. Each ranking
+    is published as a Redis sorted set, built under a temporary key and
+    renamed into place so readers never see a partial list. Keys expire after
+    a few intervals, so categories that stop trending disappear.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        window_hours: int = Config.TRENDING_WINDOW_HOURS,
+        half_life_hours: float = Config.TRENDING_HALF_LIFE_HOURS,
+        prior_views: float = Config.TRENDING_PRIOR_VIEWS,
+        k: int = Config.TRENDING_TOP_K,
+        ttl: int = Config.TRENDING_INTERVAL * 3,
+    ):
+        self.redis_client = redis_client
+        self.window_hours = window_hours
+        self.half_life_hours = half_life_hours
+        self.prior_views = prior_views
+        self.k = k
+        self.ttl = ttl
+
+    def load(self, now: datetime) -> EngagementArrays:
+        """Read the counters of the window ending at ``now`` from Postgres."""
+        with get_engine().begin() as connection:
+            cursor = connection.connection.cursor()
+            cursor.execute(CREATE_REVIEWS_SQL)
+            cursor.execute("SELECT uuid FROM trending_review ORDER BY idx")
+            review_ids = [str(row[0]) for row in cursor.fetchall()]
+
+            buffer = io.StringIO()
+            since = now - timedelta(hours=self.window_hours)
+            cursor.copy_expert(cursor.mogrify(COPY_COUNTERS_SQL, {"now": now, "since": since}).decode(), buffer)
+            buffer.seek(0)
+            counters = np.loadtxt(buffer, delimiter=",", ndmin=2) if buffer.getvalue() else np.empty((0, 5))
+
+            cursor.execute(CATEGORIES_SQL)
+            memberships = cursor.fetchall()
+
+        categories, member_category = np.unique([category for _, category in memberships], return_inverse=True)
+        return EngagementArrays(
+            review_ids=review_ids,
+            bucket_review=counters[:, 0].astype(np.int64),
+            bucket_age_hours=counters[:, 1],
+            views=counters[:, 2],
+            clicks=counters[:, 3],
+            conversions=counters[:, 4],
+            categories=categories.tolist(),
+            member_review=np.array([idx for idx, _ in memberships], dtype=np.int64),
+            member_category=member_category.astype(np.int64),
+        )
+
+    def rank(self, data: EngagementArrays) -> Dict[Optional[str], List[Tuple[str, float]]]:
+        """Score every review and pick the top ``k`` per category, as (review id, score) pairs."""
+        scores = compute_scores(data, self.half_life_hours, self.prior_views)
+        return {
+            category: [(data.review_ids[i], float(scores[i])) for i in indexes]
+            for category, indexes in rank_by_category(data, scores, self.k).items()
+        }
+
+    def publish(self, rankings: Dict[Optional[str], List[Tuple[str, float]]]) -> None:
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for category, ranking in rankings.items():
+            key = trending_key(category)
+            staging = f"{key}:next"
+            pipeline.delete(staging)
+            if not ranking:
+                pipeline.delete(key)
+                continue
+            pipeline.zadd(staging, dict(ranking))
+            pipeline.expire(staging, self.ttl)
+            pipeline.rename(staging, key)
+        pipeline.execute()
+
+    def run(self) -> None:
+        """Recompute and publish every ranking."""
+        started = time.perf_counter()
+        data = self.load(utcnow())
+        loaded = time.perf_counter()
+        rankings = self.rank(data)
+        ranked = time.perf_counter()
+        self.publish(rankings)
+        logger.info(
+            f"Ranked {len(data.review_ids)} reviews ({len(data.views)} hourly buckets) into "
+            f"{len(rankings)} lists: load {loaded - started:.2f}s, score {ranked - loaded:.2f}s, "
+            f"publish {time.perf_counter() - ranked:.2f}s"
+        )
+
+
+class TrendingFeed:
+    """Reads the published rankings; each page is one ZREVRANGE."""
+
+    def __init__(self, redis_client: aioredis.Redis):
+        self.redis_client = redis_client
+
+    async def get_review_ids(self, category: Optional[str], offset: int, limit: int) -> List[str]:
+        """Ids of trending reviews, hottest first; empty if the ranking isn't available."""
+        try:
+            return await self.redis_client.zrevrange(trending_key(category), offset, offset + limit - 1)
+        except aioredis.RedisError as e:
+            logger.warning(f"Trending ranking read failed: {e}")
+            return []
+
+
+trending_ranker = TrendingRanker(InstrumentedRedis.from_url(Config.REDIS_URL, decode_responses=True))
+trending_feed = TrendingFeed(InstrumentedAsyncRedis.from_url(Config.REDIS_URL, decode_responses=True))
@@ -0,0 +1,229 @@
+import secrets
+from typing import AsyncIterator
+from uuid import UUID
+
+import redis.asyncio as aioredis
+
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.requests import ClientDisconnect, Request
+
+from app.api.dependencies.custom_exception import (
+    BadRequestError,
+    ConflictError,
+    NotFoundError,
+    UnsupportedMediaTypeError,
+)
+from app.core.config import Config
+from app.db.models import Product, Review
+from app.schemas.enums import ReviewStatus
+from app.schemas.upload import UploadCreate
+from app.services.jobs import job_queue
+from app.services.media import REVIEW_PROCESS_JOB
+from app.services.storage import StorageBackend, storage
+from app.utils.logger import get_logger
+from app.utils.redis_client import InstrumentedAsyncRedis
+
+
+logger = get_logger(__name__)
+
+# Chunk bodies: raw bytes as in tus, or a form with a single file part
+OCTET_STREAM = "application/offset+octet-stream"
+MULTIPART_FORM = "multipart/form-data"
+
+# KEYS[1] = lock key; ARGV[1] = the holder's token. Only the holder may release
+# the lock: after the TTL ran out it may belong to another request.
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+async def raw_body_chunks(request: Request) -> AsyncIterator[bytes]:
+    """Yield the request body as it arrives, stopping quietly if the client disconnects."""
+    try:
+        async for chunk in request.stream():
+            yield chunk
+    except ClientDisconnect:
+        return
+
+
+async def multipart_file_chunks(request: Request) -> AsyncIterator[bytes]:
+    """Yield the contents of the first part of a multipart body as it arrives.
+
+    Uses python-multipart's push parser so the part is never buffered whole.
+
+    Raises:
+        BadRequestError: If the body is malformed, or ends before the first
+            part's closing boundary.
+    """
+    _, params = parse_options_header(request.headers.get("content-type"))
+    boundary = params.get(b"boundary")
+    if not boundary:
+        raise BadRequestError("Missing multipart boundary")
+
+    pending: list[bytes] = []
+    state = {"parts": 0, "complete": False}
+
+    def on_part_begin():
+        state["parts"] += 1
+
+    def on_part_data(data: bytes, start: int, end: int):
+        if state["parts"] == 1:
+            pending.append(data[start:end])
+
+    def on_part_end():
+        state["complete"] = True
+
+    parser = MultipartParser(
+        boundary,
+        callbacks={"on_part_begin": on_part_begin, "on_part_data": on_part_data, "on_part_end": on_part_end},
+    )
+    async for chunk in raw_body_chunks(request):
+        try:
+            parser.write(chunk)
+        except MultipartParseError:
+            raise BadRequestError("Malformed multipart body")
+        for piece in pending:
+            yield piece
+        pending.clear()
+        if state["complete"]:
+            return
+    # Whatever arrived of the part may be missing its tail
+    raise BadRequestError("Multipart body ended before the end of its file part")
+
+
+class UploadService:
+    """Resumable, chunked video uploads.
+
+    Clients create an upload, then send the file in one or more PATCH requests,
+    each starting at the offset the server has recorded. If a connection drops,
+    the bytes that made it to storage are kept and the client resumes from the
+    offset returned by HEAD.
+    """
+
+    def __init__(self, storage: StorageBackend, redis_client: aioredis.Redis):
+        self.storage = storage
+        self.redis_client = redis_client
+        self.release_lock_script = redis_client.register_script(RELEASE_LOCK_SCRIPT)
+
+    async def create_upload(self, creator_id: UUID, data: UploadCreate, session: AsyncSession) -> Review:
+        """Create a review whose video will be uploaded in chunks."""
+        if data.upload_length > Config.MAX_UPLOAD_SIZE:
+            raise BadRequestError(
+                "Upload too large",
+                errors={"max_upload_size": Config.MAX_UPLOAD_SIZE},
+            )
+        if data.product_id is not None and await session.get(Product, data.product_id) is None:
+            raise NotFoundError("Product not found")
+
+        review = Review(
+            creator_id=creator_id,
+            title=data.title,
+            description=data.description,
+            product_id=data.product_id,
+            content_type=data.content_type,
+            upload_length=data.upload_length,
+            storage_key="",
+        )
+        review.storage_key = f"videos/{creator_id}/{review.uuid}"
+        session.add(review)
+        await session.commit()
+        return review
+
+    async def get_upload(self, upload_id: UUID, creator_id: UUID, session: AsyncSession) -> Review:
+        """Return an upload owned by ``creator_id``."""
+        review = await session.get(Review, upload_id)
+        if review is None or review.creator_id != creator_id:
+            raise NotFoundError("Upload not found")
+        return review
+
+    async def write_chunk(
+        self,
+        upload_id: UUID,
+        creator_id: UUID,
+        offset: int,
+        request: Request,
+        session: AsyncSession,
+    ) -> Review:
+        """
+        Append the request body to an upload at ``offset``.
+
+        A short Redis lock keeps two requests from writing the same upload at
+        once; the offset is checked under it. The DB connection is released
+        while the body streams to storage, and the new offset is only stored if
+        the row still has the one the chunk started at (the lock may have
+        expired meanwhile). Once the last byte lands, a processing job is queued
+        in the same commit.
+
+        Raises:
+            UnsupportedMediaTypeError: If the body is neither
+                application/offset+octet-stream nor multipart/form-data.
+            ConflictError: If ``offset`` doesn't match the stored offset, the upload
+                is already complete, or another chunk is being written.
+        """
+        media_type = parse_options_header(request.headers.get("content-type"))[0].decode("latin-1").lower()
+        if media_type not in (OCTET_STREAM, MULTIPART_FORM):
+            raise UnsupportedMediaTypeError(f"Chunks must be sent as {OCTET_STREAM} or {MULTIPART_FORM}")
+
+        lock_key = f"upload_lock:{upload_id}"
+        token = secrets.token_hex(16)
+        if not await self.redis_client.set(lock_key, token, nx=True, ex=Config.UPLOAD_LOCK_TTL):
+            raise ConflictError("Another chunk is being uploaded")
+
+        try:
+            review = await self.get_upload(upload_id, creator_id, session)
+            await session.commit()  # Release the connection while streaming
+            self._check_offset(review, offset)
+
+            if media_type == MULTIPART_FORM:
+                chunks = multipart_file_chunks(request)
+            else:
+                chunks = raw_body_chunks(request)
+
+            written = await self.storage.write_stream(
+                review.storage_key,
+                offset=offset,
+                chunks=chunks,
+                limit=review.upload_length - offset,
+            )
+
+            review = await session.get(Review, upload_id, with_for_update=True, populate_existing=True)
+            self._check_offset(review, offset)
+            review.upload_offset = offset + written
+            if review.is_upload_complete:
+                review.status = ReviewStatus.UPLOADED.value
+                job = await job_queue.enqueue(
+                    REVIEW_PROCESS_JOB,
+                    {"review_id": str(review.uuid)},
+                    session=session,
+                    owner_id=creator_id,
+                    commit=False,
+                )
+                review.processing_job_id = job.uuid
+            session.add(review)
+            await session.commit()
+        finally:
+            await self.release_lock_script(keys=[lock_key], args=[token])
+
+        logger.info(f"Upload {upload_id} at {review.upload_offset}/{review.upload_length} bytes")
+        return review
+
+    @staticmethod
+    def _check_offset(review: Review, offset: int) -> None:
+        if review.status != ReviewStatus.UPLOADING.value:
+            raise ConflictError("Upload already completed")
+        if offset != review.upload_offset:
+            raise ConflictError(
+                "Upload offset mismatch",
+                errors={"upload_offset": review.upload_offset},
+            )
+
+
+upload_service = UploadService(
+    storage=storage,
+    redis_client=InstrumentedAsyncRedis.from_url(Config.REDIS_URL, decode_responses=True),
+)
@@ -1,22 +1,28 @@
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
-from fastapi import Depends
-from psycopg2 import IntegrityError
+from fastapi import Depends, Request
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.dependencies.custom_exception import (
+    ForbiddenError,
     InvalidCredentialsError,
     InvalidTokenError,
     UserAlreadyExistsError,
 )
 from app.db.models import User
 from app.core.security import security
+from app.core.principal_cache import principal_cache
 
 from app.db.session import SessionDep
 
 from app.schemas.enums import TokenType
-from app.schemas.user import UserCreate, UserLogin
+from app.schemas.token import TokenDetails
+from app.schemas.user import Principal, UserCreate, UserLogin
 from app.api.dependencies import oauth2_schema
+from app.utils.logger import bind_log_context
 
 
 class UserService:
@@ -30,6 +36,26 @@ class UserService:
         return session.get(User, user_id)
 
 
+    def get_users_by_ids(self, user_ids: List[UUID], session: Session) -> List[User]:
+        """
+        Retrieve several users with their profiles, in the order of ``user_ids``.
+
+        Users are fetched with one IN query and their profiles with one more
+        (selectinload), however many ids are asked for. Unknown and deleted
+        users are left out, and repeated ids are returned once.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return []
+        statement = (
+            select(User)
+            .where(User.uuid.in_(user_ids), User.is_deleted.is_not(True))
+            .options(selectinload(User.profile))
+        )
+        by_id = {user.uuid: user for user in session.exec(statement)}
+        return [by_id[user_id] for user_id in user_ids if user_id in by_id]
+
+
     def get_user_by_email(self, email: str, session: Session) -> Optional[User]:
         """Retrieve a user by their email address."""
         statement = select(User).where(User.email == email)
@@ -37,6 +63,18 @@ class UserService:
         return result.first()
 
 
+    async def get_user_by_id_async(self, user_id: UUID, session: AsyncSession) -> Optional[User]:
+        """Retrieve a user by their UUID using an async session."""
+        return await session.get(User, user_id)
+
+
+    async def get_user_by_email_async(self, email: str, session: AsyncSession) -> Optional[User]:
+        """Retrieve a user by their email address using an async session."""
+        statement = select(User).where(User.email == email)
+        result = await session.exec(statement)
+        return result.first()
+
+
     def create_user(self, user_data: UserCreate, session: Session) -> User:
         """Create a new user in the database, ensuring no duplicates."""
         existing_user = self.get_user_by_email(user_data.email, session)
@@ -59,6 +97,28 @@ class UserService:
                 f"User with email {user_data.email} already exists."
             )
 
+    async def create_user_async(self, user_data: UserCreate, session: AsyncSession) -> User:
+        """Create a new user, hashing the password off the event loop."""
+        existing_user = await self.get_user_by_email_async(user_data.email, session)
+        if existing_user:
+            raise UserAlreadyExistsError(
+                f"User with email {user_data.email} already exists."
+            )
+
+        user = User.model_validate(user_data)
+        user.password = await self.security.hash_password_async(user.password)
+
+        try:
+            session.add(user)
+            await session.commit()
+            await session.refresh(user)
+            return user
+        except IntegrityError:
+            await session.rollback()
+            raise UserAlreadyExistsError(
+                f"User with email {user_data.email} already exists."
+            )
+
     def authenticate_user(self, user_data: UserLogin, session: Session) -> User:
         """
         Authenticate a user based on email and password.
@@ -73,29 +133,90 @@ class UserService:
 
         return user
 
-    def get_current_user(self, session: SessionDep, token: str = Depends(oauth2_schema)) -> User:
+    async def authenticate_user_async(self, user_data: UserLogin, session: AsyncSession) -> User:
+        """
+        Authenticate a user, verifying the password off the event loop.
+        If the stored hash uses an outdated bcrypt cost it is transparently rehashed.
+        """
+        user = await self.get_user_by_email_async(user_data.email, session)
+        if not user or not user.password:
+            raise InvalidCredentialsError("Invalid email or password.")
+
+        valid, new_hash = await self.security.verify_and_update_password_async(
+            user_data.password, user.password
+        )
+        if not valid:
+            raise InvalidCredentialsError("Invalid email or password.")
+
+        if new_hash:
+            user.password = new_hash
+            session.add(user)
+            await session.commit()
+
+        return user
+
+    def get_current_user(
+        self, request: Request, session: SessionDep, token: str = Depends(oauth2_schema)
+    ) -> Principal:
         
         """
         Retrieves the currently authenticated user from a JWT token.
 
+        The principal is served from the principal cache when possible and
+        memoized on ``request.state`` so it is resolved at most once per request.
+
         Args:
+            request (Request): The current request.
             token (str): The access token from Authorization header.
-            session (Session): DB session.
+            session (Session): DB session, only used on a cache miss.
 
         Returns:
-            User: Authenticated user.
+            Principal: Authenticated user.
 
         Raises:
             InvalidTokenError: If token is invalid or user is not found.
         """
-        payload = self.security.decode_token(token, token_type=TokenType.ACCESS)
+        current_user = getattr(request.state, "current_user", None)
+        if current_user is not None:
+            return current_user
+
+        payload = self.security.decode_token(
+            TokenDetails(token=token, token_type=TokenType.ACCESS)
+        )
         user_id = payload.get("sub")
         if not user_id:
             raise InvalidTokenError("Invalid token payload.")
-        user = self.get_user_by_id(UUID(user_id), session)
-        if not user:
-            raise InvalidTokenError("User not found for the provided token.")
-        return user
+
+        principal = principal_cache.get(user_id)
+        if principal is None:
+            user = self.get_user_by_id(UUID(user_id), session)
+            if not user:
+                raise InvalidTokenError("User not found for the provided token.")
+            principal = Principal.model_validate(user)
+            principal_cache.set(principal)
+
+        request.state.current_user = principal
+        bind_log_context(user_id=str(principal.uuid))
+        return principal
+
+    def get_current_superadmin(
+        self, request: Request, session: SessionDep, token: str = Depends(oauth2_schema)
+    ) -> Principal:
+        """
+        Like ``get_current_user``, but only lets superadmins through.
+
+        Raises:
+            InvalidTokenError: If token is invalid or user is not found.
+            ForbiddenError: If the user is not a superadmin.
+        """
+        current_user = self.get_current_user(request, session, token)
+        if not current_user.is_superadmin:
+            raise ForbiddenError("Superadmin access required.")
+        return current_user
+
+    def invalidate_principal(self, user_id: UUID) -> None:
+        """Drop a user's cached principal, e.g. after changing it outside the ORM."""
+        principal_cache.invalidate(user_id)
 
 
 user_service = UserService()
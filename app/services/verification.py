@@ -0,0 +1,122 @@
+import time
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.config import Config
+from app.db import get_engine
+from app.db.models import RollupWatermark
+from app.services.rollup import EPOCH
+from app.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+WATERMARK_SOURCE = "verified_purchase"
+SWEEP_SOURCE = "verified_purchase_sweep"
+
+# A review is verified once its creator bought the reviewed product through one
+# of our links. Each run joins the window's new conversions against unverified
+# reviews, and the window's new reviews against all conversions, as two set
+# joins, and marks every match in the same statement. Both halves are index
+# driven (ix_conversion_created_at / ix_review_unverified_product and
+# ix_review_created_at / ix_conversion_buyer_product), so a run costs the
+# size of the delta, not of the tables.
+MATCH_SQL = text("""
+    WITH matched AS (
+        SELECT r.uuid
+        FROM conversion c
+        JOIN review r ON r.creator_id = c.buyer_id AND r.product_id = c.product_id
+        WHERE c.created_at > :window_start AND c.created_at <= :window_end
+          AND NOT r.is_verified AND r.product_id IS NOT NULL
+        UNION
+        SELECT r.uuid
+        FROM review r
+        JOIN conversion c ON c.buyer_id = r.creator_id AND c.product_id = r.product_id
+        WHERE r.created_at > :window_start AND r.created_at <= :window_end
+          AND NOT r.is_verified AND r.product_id IS NOT NULL
+          AND c.buyer_id IS NOT NULL AND c.product_id IS NOT NULL
+    )
+    UPDATE review
+    SET is_verified = true, verified_at = now(), updated_at = now()
+    FROM matched
+    WHERE review.uuid = matched.uuid AND NOT review.is_verified
+""")
+
+# The windows compare created_at, stamped when a row was inserted, against
+# the database clock; a row committed more than the lag after it was stamped
+# falls behind the mark. The sweep re-checks every unverified review that
+# names a product, so such rows are verified late instead of never. It only
+# reads ix_review_unverified_product and ix_conversion_buyer_product.
+SWEEP_SQL = text("""
+    UPDATE review
+    SET is_verified = true, verified_at = now(), updated_at = now()
+    WHERE NOT review.is_verified AND review.product_id IS NOT NULL
+      AND EXISTS (
+          SELECT 1 FROM conversion c
+          WHERE c.buyer_id = review.creator_id AND c.product_id = review.product_id
+      )
+""")
+
+
+class PurchaseMatcher:
+    """
+    Marks reviews as verified purchases by matching them with affiliate conversions.
+
+    Runs are incremental: a high-water mark on ``created_at`` (shared by
+    conversions and reviews, held back by ``PURCHASE_MATCH_LAG`` seconds of
+    database time so rows still being committed aren't skipped) bounds each run
+    to what arrived since the last one. Every ``PURCHASE_MATCH_SWEEP_INTERVAL``
+    seconds a run also sweeps all unverified reviews, catching rows the mark
+    passed before they were visible. Marking is idempotent, so overlapping or
+    repeated runs are harmless, and the marks advance in the same transaction
+    as the updates.
+    """
+
+    def __init__(
+        self,
+        lag: int = Config.PURCHASE_MATCH_LAG,
+        sweep_interval: int = Config.PURCHASE_MATCH_SWEEP_INTERVAL,
+    ):
+        self.lag = lag
+        self.sweep_interval = sweep_interval
+
+    def _mark(self, session: Session, source: str) -> RollupWatermark:
+        return session.get(RollupWatermark, source) or RollupWatermark(source=source, last_time=EPOCH)
+
+    def run(self) -> int:
+        """Match everything that arrived since the last run; returns the number of reviews verified."""
+        started = time.perf_counter()
+        with Session(get_engine()) as session:
+            # One matcher at a time; a concurrent run waits here, then sees the new mark
+            session.execute(text("SELECT pg_advisory_xact_lock(hashtext(:source))"), {"source": WATERMARK_SOURCE})
+            now = session.execute(text("SELECT now()")).scalar_one()
+            verified = 0
+
+            sweep_mark = self._mark(session, SWEEP_SOURCE)
+            if (now - sweep_mark.last_time).total_seconds() >= self.sweep_interval:
+                swept = session.execute(SWEEP_SQL).rowcount
+                if swept:
+                    logger.warning(f"Purchase sweep verified {swept} reviews the incremental runs missed")
+                verified += swept
+                sweep_mark.last_time = now
+                session.add(sweep_mark)
+
+            mark = self._mark(session, WATERMARK_SOURCE)
+            window_end = session.execute(
+                text("SELECT now() - make_interval(secs => :lag)"), {"lag": self.lag}
+            ).scalar_one()
+            if window_end > mark.last_time:
+                verified += session.execute(
+                    MATCH_SQL, {"window_start": mark.last_time, "window_end": window_end}
+                ).rowcount
+                mark.last_time = window_end
+                session.add(mark)
+            session.commit()
+
+        if verified:
+            logger.info(f"Verified {verified} purchase reviews in {time.perf_counter() - started:.3f}s")
+        return verified
+
+
+purchase_matcher = PurchaseMatcher()
@@ -0,0 +1,153 @@
+"""
+Shared test setup.
+
+Tests that need Postgres use the ``db`` fixture. It migrates the database
+named by the DB_* settings to the latest revision and empties every table
+before each test, so it only runs against a database whose name ends in
+``_test``; tests using it are skipped when no such database is reachable.
+The ``redis_db`` and ``creator_cache`` fixtures empty the Redis database
+named by REDIS_URL, so point that at a throwaway database too.
+
+Test-only dependencies are in requirements-dev.txt.
+"""
+
+import os
+import tempfile
+
+# Settings for the test run; anything already set in the environment wins
+for name, value in {
+    "PYTHON_ENV": "test",
+    "APP_NAME": "VidKarma",
+    "APP_DESCRIPTION": "VidKarma test run",
+    "APP_VERSION": "test",
+    "APP_SECRET_KEY": "test-secret",
+    "DB_NAME": "vidkarma_test",
+    "DB_USER": "postgres",
+    "DB_PASSWORD": "",
+    "DB_HOST": "127.0.0.1",
+    "DB_PORT": "5432",
+    "DB_TYPE": "postgresql",
+    "ACCESS_SECRET_KEY": "test-access-secret",
+    "REFRESH_SECRET_KEY": "test-refresh-secret",
+    "ALGORITHM": "HS256",
+    "GOOGLE_CLIENT_ID": "test",
+    "GOOGLE_CLIENT_SECRET": "test",
+    "GOOGLE_REDIRECT_URI": "http://localhost:8000/api/v1/oauth/google/callback",
+    "MAIL_FROM_NAME": "VidKarma",
+    "MAIL_USERNAME": "test",
+    "MAIL_PASSWORD": "test",
+    "MAIL_FROM": "test@example.com",
+    "MAIL_PORT": "465",
+    "MAIL_SERVER": "localhost",
+    "REDIS_URL": "redis://localhost:6379/15",
+    "RATE_LIMIT_BACKEND": "memory",
+    "SEARCH_BACKEND": "memory",
+    "LOG_DIR": tempfile.mkdtemp(prefix="vidkarma-test-logs-"),
+}.items():
+    os.environ.setdefault(name, value)
+
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterator
+from uuid import uuid4
+
+import pytest
+import redis
+from alembic import command
+from alembic.config import Config as AlembicConfig
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, SQLModel
+
+from app.core.config import Config
+from app.core.principal_cache import principal_cache
+from app.db import get_async_engine, get_engine
+from app.db.models import User
+from app.services.creator import CreatorPageCache, creator_page_cache
+from app.utils.redis_client import InstrumentedAsyncRedis
+
+
+def async_redis_client(**options) -> InstrumentedAsyncRedis:
+    return InstrumentedAsyncRedis.from_url(Config.REDIS_URL, **options)
+
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def migrated_database() -> None:
+    if not Config.DB_NAME.endswith("_test"):
+        pytest.skip(f"DB_NAME={Config.DB_NAME} is not a test database (name must end in _test)")
+    try:
+        with get_engine().connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except OperationalError as e:
+        pytest.skip(f"Test database unavailable: {e.orig}")
+    command.upgrade(AlembicConfig(str(ALEMBIC_INI)), "head")
+
+
+@pytest.fixture
+def db(migrated_database) -> None:
+    """An empty, migrated test database."""
+    tables = ", ".join(f'"{table.name}"' for table in SQLModel.metadata.sorted_tables)
+    with get_engine().begin() as connection:
+        connection.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+
+
+@pytest.fixture
+async def async_db(db, monkeypatch) -> AsyncIterator[None]:
+    """``db`` for async tests; pooled asyncpg and async Redis connections belong to the test's event loop."""
+    # User updates on the loop invalidate principals through the async client. A fresh
+    # client per test, as a pool's lock is bound to the loop it is first contended on.
+    monkeypatch.setattr(principal_cache, "async_redis_client", async_redis_client(decode_responses=True))
+    yield
+    await get_async_engine().dispose()
+    await principal_cache.close()
+
+
+@pytest.fixture
+def redis_db() -> Iterator[redis.Redis]:
+    """A client of the empty Redis test database; tests using it are skipped when Redis is unreachable."""
+    client = redis.Redis.from_url(Config.REDIS_URL, decode_responses=True)
+    try:
+        client.flushdb()
+    except redis.ConnectionError as e:
+        pytest.skip(f"Test Redis unavailable: {e}")
+    yield client
+    client.close()
+
+
+@pytest.fixture
+async def creator_cache(async_db, monkeypatch) -> AsyncIterator[CreatorPageCache]:
+    """The app's creator page cache, empty; its async Redis pool belongs to the test's event loop."""
+    try:
+        creator_page_cache.sync_redis_client.flushdb()
+    except redis.RedisError:
+        pass  # The cache fails open without Redis
+    creator_page_cache.local.clear()
+    monkeypatch.setattr(creator_page_cache, "redis_client", async_redis_client())
+    yield creator_page_cache
+    await creator_page_cache.close()
+    creator_page_cache.local.clear()
+
+
+@pytest.fixture
+def session(db) -> Iterator[Session]:
+    with Session(get_engine(), expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def user_factory(db) -> Callable[[], User]:
+    def create_user() -> User:
+        with Session(get_engine(), expire_on_commit=False) as session:
+            user = User(email=f"{uuid4().hex}@example.com")
+            session.add(user)
+            session.commit()
+            return user
+
+    return create_user
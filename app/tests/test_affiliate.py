@@ -0,0 +1,169 @@
+import asyncio
+from decimal import Decimal
+from typing import AsyncIterator, List
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, func, select
+
+from app.core.config import Config
+from app.core.security import security
+from app.db import get_async_engine
+from app.db.models import AffiliateLink, Product
+from app.db.session import async_session_factory
+from app.schemas.affiliate import AffiliateLinkCreate
+from app.services.affiliate import MISSING, AffiliateService, LinkCache
+from app.utils.redis_client import InstrumentedAsyncRedis
+
+
+pytestmark = pytest.mark.anyio
+
+CODE = "Abc12345"
+
+
+class RecordingCache:
+    """Stands in for the link cache; remembers which codes were invalidated."""
+
+    def __init__(self):
+        self.invalidated: List[str] = []
+
+    async def invalidate(self, code: str) -> None:
+        self.invalidated.append(code)
+
+
+def add_product(session: Session) -> Product:
+    product = Product(merchant="acme", sku=uuid4().hex, title="Widget", price=Decimal("10"), url="https://example.com/w")
+    session.add(product)
+    session.commit()
+    return product
+
+
+async def test_a_colliding_code_is_retried(async_db, session, user_factory, monkeypatch):
+    creator, other = user_factory(), user_factory()
+    product = add_product(session)
+    session.add(AffiliateLink(code="taken123", creator_id=other.uuid, product_id=product.uuid, target_url=product.url))
+    session.commit()
+    codes = iter(["taken123", "fresh123"])
+    monkeypatch.setattr(security, "generate_short_code", lambda length: next(codes))
+    cache = RecordingCache()
+
+    async with async_session_factory(bind=get_async_engine()) as async_session:
+        link = await AffiliateService(cache).create_link(
+            creator.uuid, AffiliateLinkCreate(product_id=product.uuid), async_session
+        )
+
+    assert link.code == "fresh123"
+    assert link.target_url == "https://example.com/w"
+    assert cache.invalidated == ["fresh123"]
+    assert session.exec(select(func.count()).select_from(AffiliateLink)).one() == 2
+
+
+async def test_other_integrity_errors_are_not_retried(async_db, session, monkeypatch):
+    product = add_product(session)
+    calls = []
+    monkeypatch.setattr(security, "generate_short_code", lambda length: calls.append(length) or uuid4().hex[:8])
+
+    async with async_session_factory(bind=get_async_engine()) as async_session:
+        with pytest.raises(IntegrityError):
+            # No such user, so the creator foreign key fails
+            await AffiliateService(RecordingCache()).create_link(
+                uuid4(), AffiliateLinkCreate(product_id=product.uuid), async_session
+            )
+
+    assert len(calls) == 1
+
+
+class CountingLinkCache(LinkCache):
+    """A link cache that counts its database lookups."""
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.loads = 0
+
+    async def _load(self, code: str) -> str:
+        self.loads += 1
+        return await super()._load(code)
+
+
+@pytest.fixture
+async def link_cache(async_db, redis_db) -> AsyncIterator[CountingLinkCache]:
+    cache = CountingLinkCache(
+        redis_client=InstrumentedAsyncRedis.from_url(Config.REDIS_URL, decode_responses=True),
+        ttl=300,
+        negative_ttl=30,
+        local_ttl=60,
+        local_max_size=100,
+    )
+    yield cache
+    await cache.redis_client.aclose()
+
+
+async def create_link(service: AffiliateService, session: Session, user_factory, monkeypatch, code: str = CODE):
+    product = add_product(session)
+    monkeypatch.setattr(security, "generate_short_code", lambda length: code)
+    async with async_session_factory(bind=get_async_engine()) as async_session:
+        return await service.create_link(user_factory().uuid, AffiliateLinkCreate(product_id=product.uuid), async_session)
+
+
+async def test_lookups_fall_back_from_local_to_redis_to_the_database(link_cache, redis_db, session, user_factory, monkeypatch):
+    await create_link(AffiliateService(link_cache), session, user_factory, monkeypatch)
+
+    assert await link_cache.resolve(CODE) == "https://example.com/w"
+    assert link_cache.loads == 1
+    assert redis_db.get(LinkCache.KEY_PREFIX + CODE) == "https://example.com/w"
+
+    assert await link_cache.resolve(CODE) == "https://example.com/w"  # Local tier
+    link_cache.local.clear()
+    assert await link_cache.resolve(CODE) == "https://example.com/w"  # Redis tier
+    assert link_cache.loads == 1
+
+    link_cache.local.clear()
+    redis_db.flushdb()
+    assert await link_cache.resolve(CODE) == "https://example.com/w"
+    assert link_cache.loads == 2
+
+
+async def test_unknown_codes_are_cached_for_the_negative_ttl(link_cache, redis_db):
+    assert await link_cache.resolve(CODE) is None
+    assert await link_cache.resolve(CODE) is None
+    link_cache.local.clear()
+    assert await link_cache.resolve(CODE) is None
+
+    assert link_cache.loads == 1
+    assert redis_db.get(LinkCache.KEY_PREFIX + CODE) == MISSING
+    assert 0 < redis_db.ttl(LinkCache.KEY_PREFIX + CODE) <= link_cache.negative_ttl
+
+
+async def test_concurrent_misses_share_one_lookup(link_cache, monkeypatch):
+    release = asyncio.Event()
+
+    async def slow_load(code: str) -> str:
+        link_cache.loads += 1
+        await release.wait()
+        return "https://example.com/w"
+
+    monkeypatch.setattr(link_cache, "_load", slow_load)
+    lookups = [asyncio.create_task(link_cache.resolve(CODE)) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    release.set()
+
+    assert await asyncio.gather(*lookups) == ["https://example.com/w"] * 5
+    assert link_cache.loads == 1
+    assert link_cache._inflight == {}
+
+
+async def test_creating_a_link_clears_its_negative_entry(link_cache, session, user_factory, monkeypatch):
+    service = AffiliateService(link_cache)
+    assert await service.resolve(CODE) is None
+
+    link = await create_link(service, session, user_factory, monkeypatch)
+
+    assert link.code == CODE
+    assert await service.resolve(CODE) == "https://example.com/w"
+
+
+@pytest.mark.parametrize("code", ["abc", "a" * 17, "abc-1234", "abc_1234", "abc 1234", "ab%2F1234", ""])
+async def test_codes_that_cannot_exist_are_not_looked_up(link_cache, code):
+    assert await AffiliateService(link_cache).resolve(code) is None
+    assert link_cache.loads == 0
@@ -0,0 +1,105 @@
+import io
+from decimal import Decimal
+from typing import List
+
+import pytest
+from sqlmodel import select
+from starlette.requests import Request
+
+from app.api.dependencies.custom_exception import PayloadTooLargeError
+from app.api.v1.routes.admin import import_products
+from app.core.config import Config
+from app.db.models import Product
+from app.services.catalog import CatalogImporter
+from app.services.storage import storage
+
+
+HEADER = b"sku,title,price,url\n"
+
+
+def feed(*lines: bytes) -> io.BytesIO:
+    return io.BytesIO(b"".join(lines))
+
+
+def products(session) -> dict:
+    session.expire_all()
+    return {product.sku: product for product in session.exec(select(Product).where(Product.merchant == "acme"))}
+
+
+def test_feed_is_upserted_by_sku(session):
+    importer = CatalogImporter(batch_size=2)
+    first = feed(
+        b"\xef\xbb\xbf" + HEADER,  # A leading BOM is not part of the first column name
+        b"a,Widget,1.50,https://example.com/a\n",
+        b"b,Gadget,2.00,https://example.com/b\n",
+        b"c,Gizmo,3.00,https://example.com/c\n",
+    )
+
+    report = importer.import_stream(first, "acme", "csv")
+    assert (report.rows_read, report.rows_inserted, report.rows_updated, report.rows_invalid) == (3, 3, 0, 0)
+
+    second = feed(
+        HEADER,
+        b"a,Widget,1.50,https://example.com/a\n",
+        b"b,Gadget,2.50,https://example.com/b\n",
+        b"d,Doohickey,4.00,https://example.com/d\n",
+    )
+    report = importer.import_stream(second, "acme", "csv")
+    assert (report.rows_inserted, report.rows_updated) == (1, 1)
+
+    second.seek(0)
+    report = importer.import_stream(second, "acme", "csv")
+    assert (report.rows_inserted, report.rows_updated) == (0, 0)
+
+    catalog = products(session)
+    assert sorted(catalog) == ["a", "b", "c", "d"]
+    assert catalog["b"].price == Decimal("2.50")
+
+
+def test_invalid_rows_are_reported_and_the_rest_imported(session):
+    lines: List[bytes] = [
+        b'{"sku": "a", "title": "Widget", "price": "1.50", "url": "https://example.com/a"}\n',
+        b"not json\n",
+        b'{"sku": "b", "title": "Gadget", "price": "-1", "url": "https://example.com/b"}\n',
+        b'{"sku": "c", "title": "Caf\xe9", "price": "3.00", "url": "https://example.com/c"}\n',  # Latin-1
+        b'{"sku": "d", "title": "Doohickey", "price": "4.00", "url": "https://example.com/d"}\n',
+    ]
+
+    report = CatalogImporter(batch_size=2).import_stream(feed(*lines), "acme", "jsonl")
+
+    assert (report.rows_read, report.rows_inserted, report.rows_invalid) == (5, 2, 3)
+    errors = {error["line"]: error["errors"] for error in report.errors}
+    assert sorted(errors) == [2, 3, 4]
+    assert errors[4] == ["row: not valid UTF-8"]
+    assert sorted(products(session)) == ["a", "d"]
+
+
+def test_undecodable_csv_row_is_reported(session):
+    lines = [
+        HEADER,
+        b"a,Caf\xe9,1.50,https://example.com/a\n",
+        b'b,"Two\nlines",2.00,https://example.com/b\n',
+        b"c,Gizmo,3.00,https://example.com/c\n",
+    ]
+
+    report = CatalogImporter().import_stream(feed(*lines), "acme", "csv")
+
+    assert (report.rows_read, report.rows_inserted, report.rows_invalid) == (3, 2, 1)
+    assert report.errors == [{"line": 2, "errors": ["row: not valid UTF-8"]}]
+    assert sorted(products(session)) == ["b", "c"]
+
+
+@pytest.mark.anyio
+async def test_feed_over_the_size_limit_is_rejected(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "MAX_UPLOAD_SIZE", 10)
+    monkeypatch.setattr(storage, "root", tmp_path)
+    body = [b"0123456789", b"0"]
+
+    async def receive():
+        return {"type": "http.request", "body": body.pop(0), "more_body": bool(body)}
+
+    request = Request({"type": "http", "method": "POST", "headers": [(b"content-type", b"text/csv")]}, receive)
+    with pytest.raises(PayloadTooLargeError):
+        await import_products(request, db=None, merchant="acme", format="csv", current_user=None)
+
+    assert list(tmp_path.rglob("*.csv")) == []
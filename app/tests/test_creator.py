@@ -0,0 +1,67 @@
+from uuid import UUID
+
+import pytest
+from sqlmodel import Session
+
+from app.db import get_async_engine, get_engine
+from app.db.models import User, UserProfile
+from app.db.session import async_session_factory
+
+
+pytestmark = pytest.mark.anyio
+
+
+def add_creator(user_factory, username: str) -> User:
+    user = user_factory()
+    with Session(get_engine()) as session:
+        session.add(UserProfile(user_id=user.uuid, username=username))
+        session.commit()
+    return user
+
+
+def update_user(user_id: UUID, **fields) -> None:
+    with Session(get_engine()) as session:
+        user = session.get(User, user_id)
+        for name, value in fields.items():
+            setattr(user, name, value)
+        session.add(user)
+        session.commit()
+
+
+async def test_deleted_and_inactive_creators_are_not_public(creator_cache, user_factory):
+    add_creator(user_factory, "public")
+    update_user(add_creator(user_factory, "deleted").uuid, is_deleted=True)
+    update_user(add_creator(user_factory, "inactive").uuid, is_active=False)
+
+    assert await creator_cache.get("public") is not None
+    assert await creator_cache.get("deleted") is None
+    assert await creator_cache.get("inactive") is None
+
+
+@pytest.mark.parametrize("change", [{"is_deleted": True}, {"is_active": False}])
+async def test_deleting_or_deactivating_the_user_evicts_the_page(creator_cache, user_factory, change):
+    creator = add_creator(user_factory, "creator")
+    assert await creator_cache.get("creator") is not None
+
+    update_user(creator.uuid, **change)
+    assert await creator_cache.get("creator") is None
+
+    update_user(creator.uuid, is_deleted=False, is_active=True)
+    assert await creator_cache.get("creator") is not None
+
+
+async def test_async_session_writes_invalidate_without_the_sync_client(creator_cache, user_factory, monkeypatch):
+    creator = add_creator(user_factory, "creator")
+    assert await creator_cache.get("creator") is not None
+
+    def blocking_delete(*keys):
+        raise AssertionError("Sync Redis call on the event loop")
+
+    monkeypatch.setattr(creator_cache.sync_redis_client, "delete", blocking_delete)
+    async with async_session_factory(bind=get_async_engine()) as session:
+        user = await session.get(User, creator.uuid)
+        user.is_active = False
+        session.add(user)
+        await session.commit()
+
+    assert await creator_cache.get("creator") is None
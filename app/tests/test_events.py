@@ -0,0 +1,70 @@
+from typing import List
+
+import anyio
+import pytest
+
+from app.db.base_model import utcnow
+from app.schemas.enums import EventType
+from app.services.events import EventPipeline, EventRecord, EventSpool
+
+
+pytestmark = pytest.mark.anyio
+
+
+class FlakyWriter:
+    """Stands in for the database; fails every write while ``down``."""
+
+    def __init__(self):
+        self.down = False
+        self.written: List[EventRecord] = []
+
+    async def __call__(self, records: List[EventRecord]) -> None:
+        if self.down:
+            raise ConnectionError("Simulated outage")
+        self.written += records
+
+
+def make_pipeline(writer: FlakyWriter, spool_dir, max_buffer: int = 100) -> EventPipeline:
+    return EventPipeline(writer, EventSpool(str(spool_dir)), max_buffer=max_buffer, batch_size=10, flush_interval=0.01)
+
+
+def click(code: str) -> EventRecord:
+    return EventRecord(utcnow(), EventType.CLICK.value, link_code=code)
+
+
+async def test_outage_is_spooled_and_replayed_without_new_traffic(tmp_path):
+    writer = FlakyWriter()
+    pipeline = make_pipeline(writer, tmp_path)
+    await pipeline.start()
+    try:
+        writer.down = True
+        for i in range(25):
+            pipeline.record(click(f"code{i}"))
+        with anyio.fail_after(5):
+            while pipeline.buffer or not list(tmp_path.glob("events-*.jsonl")):
+                await anyio.sleep(0.01)
+
+        # The database comes back; nothing else is recorded
+        writer.down = False
+        with anyio.fail_after(5):
+            while len(writer.written) < 25:
+                await anyio.sleep(0.01)
+    finally:
+        await pipeline.stop()
+
+    assert sorted(record.link_code for record in writer.written) == sorted(f"code{i}" for i in range(25))
+    assert list(tmp_path.glob("events-*.jsonl")) == []
+
+
+async def test_full_buffer_drops_and_counts(tmp_path):
+    writer = FlakyWriter()
+    pipeline = make_pipeline(writer, tmp_path, max_buffer=5)
+
+    for i in range(8):
+        pipeline.record(click(f"code{i}"))
+    assert len(pipeline.buffer) == 5
+    assert pipeline.dropped == 3
+    assert not tmp_path.exists() or list(tmp_path.iterdir()) == []
+
+    await pipeline.flush()
+    assert [record.link_code for record in writer.written] == [f"code{i}" for i in range(5)]
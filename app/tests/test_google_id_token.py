@@ -0,0 +1,101 @@
+import json
+import time
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from app.api.dependencies.custom_exception import OauthError, ServiceUnavailableError
+from app.core.google_id_token import GoogleIdTokenVerifier, GoogleKeyStore
+
+
+pytestmark = pytest.mark.anyio
+
+CLIENT_ID = "client-id.apps.googleusercontent.com"
+
+
+@pytest.fixture(scope="module")
+def private_key() -> str:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+
+
+@pytest.fixture
+def jwks_file(tmp_path, private_key):
+    public = jwk.construct(private_key, "RS256").public_key().to_dict()
+    path = tmp_path / "jwks.json"
+    path.write_text(json.dumps({"keys": [{**public, "kid": "key-1", "alg": "RS256", "use": "sig"}]}))
+    return path
+
+
+class UnreachableClient:
+    """Stands in for the HTTP client while Google is down."""
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        raise httpx.ConnectError("Simulated outage")
+
+
+def id_token(private_key: str, kid: str = "key-1", **claims) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "1234",
+        "email": "creator@example.com",
+        "iat": now,
+        "exp": now + 600,
+        **claims,
+    }
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+def verifier(key_store: GoogleKeyStore) -> GoogleIdTokenVerifier:
+    return GoogleIdTokenVerifier(key_store, client_id=CLIENT_ID)
+
+
+async def test_valid_token_is_verified(jwks_file, private_key):
+    key_store = GoogleKeyStore(client=None, discovery_url="unused", jwks_url=jwks_file.as_uri())
+
+    claims = await verifier(key_store).verify(id_token(private_key))
+
+    assert claims["email"] == "creator@example.com"
+
+
+async def test_unknown_kid_is_rejected(jwks_file, private_key):
+    key_store = GoogleKeyStore(client=None, discovery_url="unused", jwks_url=jwks_file.as_uri())
+
+    with pytest.raises(OauthError) as raised:
+        await verifier(key_store).verify(id_token(private_key, kid="rotated-away"))
+    assert raised.value.errors == {"error": "Unknown signing key"}
+
+
+async def test_token_for_another_audience_is_rejected(jwks_file, private_key):
+    key_store = GoogleKeyStore(client=None, discovery_url="unused", jwks_url=jwks_file.as_uri())
+
+    with pytest.raises(OauthError):
+        await verifier(key_store).verify(id_token(private_key, aud="someone-else"))
+
+
+async def test_cached_keys_are_served_while_refresh_fails(jwks_file, private_key):
+    key_store = GoogleKeyStore(client=UnreachableClient(), discovery_url="unused", jwks_url=jwks_file.as_uri())
+    await key_store.refresh()
+    # Expired, and the next fetch goes to an unreachable server
+    key_store._keys_expires_at = 0.0
+    key_store.jwks_url = "https://www.googleapis.com/oauth2/v3/certs"
+
+    claims = await verifier(key_store).verify(id_token(private_key))
+    assert claims["sub"] == "1234"
+
+    with pytest.raises(ServiceUnavailableError):
+        await verifier(key_store).verify(id_token(private_key, kid="rotated-in"))
+
+
+async def test_refresh_failure_without_cached_keys_is_unavailable(private_key):
+    key_store = GoogleKeyStore(client=UnreachableClient(), discovery_url="https://accounts.google.com/.well-known")
+
+    with pytest.raises(ServiceUnavailableError):
+        await verifier(key_store).verify(id_token(private_key))
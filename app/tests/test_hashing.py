@@ -0,0 +1,67 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.api.dependencies.custom_exception import ServiceUnavailableError
+from app.core.hashing import PasswordHasher
+
+
+pytestmark = pytest.mark.anyio
+
+
+def thread_pool_hasher(rounds: int = 4, max_pending: int = 8) -> PasswordHasher:
+    """A hasher at bcrypt's lowest cost, running in threads so tests needn't fork."""
+    hasher = PasswordHasher(rounds=rounds, max_workers=2, max_pending=max_pending)
+    hasher._executor = ThreadPoolExecutor(max_workers=hasher.max_workers)
+    return hasher
+
+
+async def test_hash_and_verify():
+    hasher = thread_pool_hasher()
+    try:
+        hashed = await hasher.hash("correct horse")
+
+        assert hashed.startswith("$2b$04$")
+        assert await hasher.verify_and_update("correct horse", hashed) == (True, None)
+        assert await hasher.verify_and_update("wrong horse", hashed) == (False, None)
+        assert hasher.verify_sync("correct horse", hashed)
+    finally:
+        hasher.shutdown()
+
+
+async def test_hashes_made_at_another_cost_are_replaced():
+    old, new = thread_pool_hasher(rounds=4), thread_pool_hasher(rounds=5)
+    try:
+        hashed = await old.hash("correct horse")
+
+        valid, new_hash = await new.verify_and_update("correct horse", hashed)
+        assert valid and new_hash.startswith("$2b$05$")
+        assert await new.verify_and_update("correct horse", new_hash) == (True, None)
+        # A wrong password is never rehashed
+        assert await new.verify_and_update("wrong horse", hashed) == (False, None)
+    finally:
+        old.shutdown()
+        new.shutdown()
+
+
+async def test_full_queue_is_rejected_with_503():
+    hasher = thread_pool_hasher(max_pending=2)
+    release = threading.Event()
+    try:
+        blocked = [asyncio.create_task(hasher._submit("hash", release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        assert hasher.pending == 2
+
+        with pytest.raises(ServiceUnavailableError) as error:
+            await hasher.hash("correct horse")
+        assert error.value.errors == {"error": "Password hashing queue is full"}
+
+        release.set()
+        await asyncio.gather(*blocked)
+        assert hasher.pending == 0
+        assert (await hasher.hash("correct horse")).startswith("$2b$04$")
+    finally:
+        release.set()
+        hasher.shutdown()
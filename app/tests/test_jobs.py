@@ -0,0 +1,190 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import pytest
+from sqlmodel import Session
+
+from app.core.config import Config
+from app.db import get_engine
+from app.db.base_model import utcnow
+from app.db.models import Job
+from app.schemas.enums import JobStatus
+from app.services.jobs import JobContext, JobQueue, job_queue
+from app.worker import Worker
+
+
+# Like the worker, every queue call gets a session of its own
+
+def add_job(**fields) -> Job:
+    with Session(get_engine(), expire_on_commit=False) as session:
+        job = Job(kind="test", **fields)
+        session.add(job)
+        session.commit()
+        return job
+
+
+def get_job(job_id: UUID) -> Job:
+    with Session(get_engine()) as session:
+        return session.get(Job, job_id)
+
+
+def claim(queue: JobQueue, kinds=None) -> Optional[Job]:
+    with Session(get_engine(), expire_on_commit=False) as session:
+        return queue.claim(session, kinds)
+
+
+def update_job(job_id: UUID, **fields) -> None:
+    with Session(get_engine()) as session:
+        job = session.get(Job, job_id)
+        for name, value in fields.items():
+            setattr(job, name, value)
+        session.add(job)
+        session.commit()
+
+
+def test_claim_takes_highest_priority_and_hides_the_job(db):
+    queue = JobQueue()
+    low = add_job(priority=0)
+    high = add_job(priority=10)
+
+    claimed = claim(queue)
+    assert claimed.uuid == high.uuid
+    assert claimed.status == JobStatus.RUNNING.value
+    assert claimed.attempts == 1
+    assert claimed.locked_until > utcnow()
+
+    assert claim(queue).uuid == low.uuid
+    assert claim(queue) is None
+
+
+def test_claim_filters_by_kind(db):
+    queue = JobQueue()
+    add_job()
+
+    assert claim(queue, kinds=["other"]) is None
+    assert claim(queue, kinds=["test"]) is not None
+
+
+def test_failure_is_retried_with_backoff_until_max_attempts(session):
+    queue = JobQueue()
+    add_job(max_attempts=2)
+
+    job = claim(queue)
+    failed = queue.fail(session, job.uuid, job.attempts, "boom")
+    assert failed.status == JobStatus.QUEUED.value
+    assert failed.run_at > utcnow() + timedelta(seconds=Config.JOB_RETRY_BASE_DELAY * 0.7)
+    assert claim(queue) is None  # Not due yet
+
+    update_job(job.uuid, run_at=utcnow())
+    job = claim(queue)
+    assert job.attempts == 2
+    assert queue.fail(session, job.uuid, job.attempts, "boom again").status == JobStatus.FAILED.value
+    assert claim(queue) is None
+
+
+def test_expired_lease_is_reclaimed_after_backoff(db):
+    queue = JobQueue()
+    add_job()
+    job = claim(queue)
+
+    update_job(job.uuid, locked_until=utcnow() - timedelta(seconds=1))
+    assert claim(queue) is None  # Still within the retry backoff
+
+    update_job(job.uuid, locked_until=utcnow() - timedelta(seconds=Config.JOB_RETRY_BASE_DELAY + 1))
+    reclaimed = claim(queue)
+    assert reclaimed.uuid == job.uuid
+    assert reclaimed.attempts == 2
+
+
+def test_stale_worker_cannot_overwrite_the_new_claim(session):
+    queue = JobQueue()
+    add_job()
+    stale = claim(queue)
+    update_job(stale.uuid, locked_until=utcnow() - timedelta(seconds=Config.JOB_RETRY_BASE_DELAY + 1))
+    current = claim(queue)
+    assert current.attempts == stale.attempts + 1
+
+    assert not queue.complete(session, stale.uuid, stale.attempts, {"from": "stale"})
+    assert queue.fail(session, stale.uuid, stale.attempts, "stale failure") is None
+    queue.extend_leases(session, [(stale.uuid, stale.attempts)])
+    assert get_job(current.uuid).locked_until == current.locked_until
+
+    assert queue.complete(session, current.uuid, current.attempts, {"from": "current"})
+    job = get_job(current.uuid)
+    assert job.status == JobStatus.SUCCEEDED.value
+    assert job.result == {"from": "current"}
+    assert job.error is None
+
+
+def test_expired_final_attempt_is_marked_failed(db):
+    queue = JobQueue()
+    add_job(max_attempts=1)
+    job = claim(queue)
+    update_job(job.uuid, locked_until=utcnow() - timedelta(hours=1))
+
+    assert claim(queue) is None
+    job = get_job(job.uuid)
+    assert job.status == JobStatus.FAILED.value
+    assert job.locked_until is None
+    assert "final attempt" in job.error
+
+
+@pytest.fixture
+def fake_processor():
+    """Registers a fake processor for "test" jobs; returns the progress it saw stored, per call."""
+    seen: List[float] = []
+
+    def process(ctx: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+        ctx.report_progress(40)
+        seen.append(get_job(ctx.job_id).progress)
+        if payload.get("fail"):
+            raise ValueError("boom")
+        return {"doubled": payload["n"] * 2}
+
+    job_queue.register("test", process)
+    yield seen
+    del job_queue.processors["test"]
+
+
+def run_worker_until_settled(job_ids: List[UUID], timeout: float = 10) -> None:
+    """Run a worker with a thread pool, so the fake processor is used, until no job is queued or running."""
+    worker = Worker(processes=2, poll_interval=0.01, executor_factory=ThreadPoolExecutor)
+    thread = threading.Thread(target=worker.run)
+    thread.start()
+    try:
+        deadline = time.monotonic() + timeout
+        while any(get_job(job_id).status in (JobStatus.QUEUED.value, JobStatus.RUNNING.value) for job_id in job_ids):
+            assert time.monotonic() < deadline, "jobs did not settle"
+            time.sleep(0.01)
+    finally:
+        worker.stop()
+        thread.join()
+
+
+def test_worker_runs_a_registered_processor(db, fake_processor):
+    jobs = [add_job(payload={"n": n}) for n in range(3)]
+
+    run_worker_until_settled([job.uuid for job in jobs])
+
+    assert fake_processor == [40, 40, 40]
+    for n, job in enumerate(jobs):
+        job = get_job(job.uuid)
+        assert job.status == JobStatus.SUCCEEDED.value
+        assert job.result == {"doubled": n * 2}
+        assert job.progress == 100
+        assert job.locked_until is None
+
+
+def test_worker_records_processor_failures(db, fake_processor):
+    job = add_job(payload={"fail": True}, max_attempts=1)
+
+    run_worker_until_settled([job.uuid])
+
+    job = get_job(job.uuid)
+    assert job.status == JobStatus.FAILED.value
+    assert job.error == "ValueError: boom"
+    assert job.attempts == 1
@@ -0,0 +1,103 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlmodel import Session, func, select
+
+from app.db.base_model import utcnow
+from app.db.models import AffiliateLink, CommissionEntry, Conversion, CreatorBalance, Product
+from app.services.ledger import CommissionLedger
+
+
+COMMISSIONS = [Decimal("0.01"), Decimal("0.33"), Decimal("10.05"), Decimal("7.77"), Decimal("123.45")]
+
+
+def add_conversions(session: Session, creator_id, commissions) -> None:
+    product = Product(merchant="acme", sku=uuid4().hex, title="Widget", price=Decimal("10"), url="https://example.com")
+    session.add(product)
+    session.flush()  # No relationships to order the inserts by
+    link = AffiliateLink(
+        code=uuid4().hex[:8], creator_id=creator_id, product_id=product.uuid, target_url="https://example.com"
+    )
+    session.add(link)
+    for i, commission in enumerate(commissions):
+        session.add(Conversion(
+            merchant="acme",
+            order_id=f"order-{uuid4().hex}",
+            link_code=link.code,
+            sale_amount=commission * 10,
+            commission_amount=commission,
+            occurred_at=utcnow() - timedelta(minutes=i + 1),
+        ))
+    session.commit()
+
+
+def test_split_adds_up_to_the_full_commission(session, user_factory):
+    creator = user_factory()
+    add_conversions(session, creator.uuid, COMMISSIONS)
+
+    report = CommissionLedger(creator_share=Decimal("0.70")).settle(utcnow() - timedelta(days=1), utcnow(), chunk_size=2)
+
+    total = sum(COMMISSIONS)
+    assert report.conversions == len(COMMISSIONS)
+    assert report.creator_amounts["USD"] + report.platform_amounts["USD"] == total
+
+    # Per conversion, the creator and platform lines add up to the commission, to the cent
+    entries = session.exec(
+        select(CommissionEntry.conversion_id, func.sum(CommissionEntry.amount), func.count())
+        .group_by(CommissionEntry.conversion_id)
+    ).all()
+    commissions = dict(session.exec(select(Conversion.uuid, Conversion.commission_amount)).all())
+    assert len(entries) == len(COMMISSIONS)
+    for conversion_id, amount, lines in entries:
+        assert lines == 2
+        assert amount == commissions[conversion_id]
+
+    balance = session.exec(select(CreatorBalance).where(CreatorBalance.creator_id == creator.uuid)).one()
+    assert balance.balance == report.creator_amounts["USD"]
+    assert balance.lifetime_earned == report.creator_amounts["USD"]
+
+
+def test_balances_spanning_chunks_are_counted_once(session, user_factory):
+    for creator in (user_factory(), user_factory()):
+        add_conversions(session, creator.uuid, COMMISSIONS)
+
+    report = CommissionLedger(creator_share=Decimal("0.70")).settle(utcnow() - timedelta(days=1), utcnow(), chunk_size=3)
+
+    assert report.conversions == 2 * len(COMMISSIONS)
+    assert report.creator_balances_updated == 2
+
+
+def test_settling_again_changes_nothing(session, user_factory):
+    creator = user_factory()
+    add_conversions(session, creator.uuid, COMMISSIONS)
+    ledger = CommissionLedger(creator_share=Decimal("0.70"))
+    window = (utcnow() - timedelta(days=1), utcnow())
+
+    first = ledger.settle(*window)
+    second = ledger.settle(*window)
+
+    assert first.conversions == len(COMMISSIONS)
+    assert second.conversions == 0
+    balance = session.exec(select(CreatorBalance).where(CreatorBalance.creator_id == creator.uuid)).one()
+    assert balance.balance == first.creator_amounts["USD"]
+    assert session.exec(select(func.count()).select_from(CommissionEntry)).one() == 2 * len(COMMISSIONS)
+
+
+def test_concurrent_settlements_share_a_window(session, user_factory):
+    creators = [user_factory() for _ in range(6)]
+    for creator in creators:
+        add_conversions(session, creator.uuid, COMMISSIONS)  # Same times for every creator, so chunks mix them
+    ledger = CommissionLedger(creator_share=Decimal("0.70"))
+    window = (utcnow() - timedelta(days=1), utcnow())
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        reports = list(pool.map(lambda _: ledger.settle(*window, chunk_size=4), range(2)))
+
+    assert sum(report.conversions for report in reports) == len(creators) * len(COMMISSIONS)
+    creator_total = sum(report.creator_amounts.get("USD", Decimal("0")) for report in reports)
+    balances = session.exec(select(CreatorBalance)).all()
+    assert len(balances) == len(creators)
+    assert sum(balance.balance for balance in balances) == creator_total
+    assert session.exec(select(func.count()).select_from(CommissionEntry)).one() == 2 * len(creators) * len(COMMISSIONS)
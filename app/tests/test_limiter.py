@@ -0,0 +1,169 @@
+from typing import List, Tuple
+
+import pytest
+
+from app.api.dependencies.custom_exception import RateLimitExceededError
+from app.api.v1.routes import auth
+from app.core.config import Config
+from app.utils import limiter as limiter_module
+from app.utils.limiter import (
+    MemorySlidingWindowBackend,
+    RateLimiter,
+    RedisSlidingWindowBackend,
+    TokenBucket,
+    parse_rate,
+)
+from app.utils.redis_client import InstrumentedAsyncRedis
+
+
+pytestmark = pytest.mark.anyio
+
+
+class Clock:
+    """Replaces the limiter module's clock, leaving the event loop's alone."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class CountingBackend:
+    """Allows every hit, counting them."""
+
+    def __init__(self):
+        self.hits: List[str] = []
+
+    async def hit(self, key: str, limit: int, window: int) -> Tuple[bool, float]:
+        self.hits.append(key)
+        return True, 0.0
+
+
+class BrokenBackend:
+    """A backend whose store is down."""
+
+    async def hit(self, key: str, limit: int, window: int) -> Tuple[bool, float]:
+        raise ConnectionError("Backend unreachable")
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(limiter_module, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "redis"])
+async def backend(request):
+    """Each sliding-window backend; the Redis one runs the Lua script against the test database."""
+    if request.param == "memory":
+        yield MemorySlidingWindowBackend()
+        return
+    request.getfixturevalue("redis_db")
+    client = InstrumentedAsyncRedis.from_url(Config.REDIS_URL)
+    yield RedisSlidingWindowBackend(client)
+    await client.aclose()
+
+
+def retry_after(error: pytest.ExceptionInfo) -> int:
+    return error.value.errors["retry_after"]
+
+
+@pytest.mark.parametrize("rate, expected", [
+    ("5/second", (5, 1)),
+    ("20/minute", (20, 60)),
+    ("100/hour", (100, 3600)),
+    ("3/days", (3, 86400)),
+])
+def test_parse_rate(rate, expected):
+    assert parse_rate(rate) == expected
+
+
+async def test_sliding_window_admits_limit_hits_per_window(clock, backend):
+    for _ in range(3):
+        assert await backend.hit("key", limit=3, window=60) == (True, 0.0)
+        clock.advance(10)
+    # The oldest hit leaves the window 30s from now
+    assert await backend.hit("key", limit=3, window=60) == (False, 30.0)
+    assert await backend.hit("other", limit=3, window=60) == (True, 0.0)
+
+    clock.advance(30)
+    assert await backend.hit("key", limit=3, window=60) == (True, 0.0)
+    # Rejected hits aren't counted, so the next slot opens when the second hit expires
+    assert await backend.hit("key", limit=3, window=60) == (False, 10.0)
+
+
+async def test_token_bucket_refills_at_the_rate(clock):
+    bucket = TokenBucket(capacity=2, window=60)
+
+    assert [bucket.take(), bucket.take(), bucket.take()] == [True, True, False]
+    clock.advance(29)
+    assert not bucket.take()
+    clock.advance(1)
+    assert bucket.take()
+    clock.advance(3600)
+    assert [bucket.take(), bucket.take(), bucket.take()] == [True, True, False]
+
+
+async def test_local_bucket_rejects_before_the_backend(clock):
+    backend = CountingBackend()
+    limiter = RateLimiter(backend)
+
+    for _ in range(5):
+        await limiter.check("scope", "client", "5/minute")
+    with pytest.raises(RateLimitExceededError) as error:
+        await limiter.check("scope", "client", "5/minute")
+
+    assert retry_after(error) == 12
+    assert backend.hits == ["scope:client"] * 5
+    await limiter.check("scope", "another client", "5/minute")
+
+
+async def test_backend_rejection_reports_when_to_retry(clock):
+    limiter = RateLimiter(MemorySlidingWindowBackend())
+    # Another worker has used up the shared window
+    await limiter.backend.hit("scope:client", limit=2, window=60)
+    clock.advance(15)
+    await limiter.backend.hit("scope:client", limit=2, window=60)
+
+    with pytest.raises(RateLimitExceededError) as error:
+        await limiter.check("scope", "client", "2/minute")
+    assert retry_after(error) == 45
+
+
+async def test_backend_errors_fail_open(clock):
+    limiter = RateLimiter(BrokenBackend())
+
+    for _ in range(3):
+        await limiter.check("scope", "client", "3/minute")
+    # The local bucket still applies
+    with pytest.raises(RateLimitExceededError):
+        await limiter.check("scope", "client", "3/minute")
+
+
+async def test_login_attempts_are_limited_per_client_and_per_account(clock, monkeypatch):
+    monkeypatch.setattr(auth, "limiter", RateLimiter(MemorySlidingWindowBackend()))
+
+    for _ in range(20):
+        await auth.limit_login_attempts("owner@example.com", "10.0.0.1")
+    with pytest.raises(RateLimitExceededError):
+        await auth.limit_login_attempts("owner@example.com", "10.0.0.1")
+    # Another client, or another account from the same client, is unaffected
+    await auth.limit_login_attempts("owner@example.com", "10.0.0.2")
+    await auth.limit_login_attempts("other@example.com", "10.0.0.1")
+
+    # Rotating clients runs into the per-account limit of 100 an hour
+    for ip in range(3, 82):
+        await auth.limit_login_attempts("owner@example.com", f"10.0.0.{ip}")
+    with pytest.raises(RateLimitExceededError):
+        await auth.limit_login_attempts("owner@example.com", "10.0.1.1")
+
+    clock.advance(3600)
+    await auth.limit_login_attempts("owner@example.com", "10.0.0.1")
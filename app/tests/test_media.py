@@ -0,0 +1,47 @@
+import sys
+import textwrap
+from typing import List
+
+import pytest
+
+from app.core.config import Config
+from app.services import media
+from app.services.media import transcode
+
+
+# Stands in for ffmpeg: floods stderr well past a pipe's buffer, then reports progress on stdout
+FAKE_FFMPEG = textwrap.dedent("""\
+    import os, sys
+    sys.stderr.write("warning: odd frame\\n" * 20_000)
+    sys.stderr.flush()
+    for out_time_us in (1_000_000, 2_000_000, 4_000_000):
+        print(f"frame=1\\nout_time_us={out_time_us}\\nprogress=continue", flush=True)
+    sys.stderr.write("last words\\n")
+    sys.exit(int(os.environ.get("FAKE_FFMPEG_EXIT", "0")))
+""")
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    script = tmp_path / "ffmpeg"
+    script.write_text(f"#!{sys.executable}\n{FAKE_FFMPEG}")
+    script.chmod(0o755)
+    monkeypatch.setattr(Config, "FFMPEG_BINARY", str(script))
+    monkeypatch.setattr(media, "PROGRESS_INTERVAL", 0)
+    return script
+
+
+def test_transcode_reports_progress_while_ffmpeg_floods_stderr(tmp_path, fake_ffmpeg):
+    progress: List[float] = []
+
+    transcode(tmp_path / "in.webm", tmp_path / "out.mp4", duration=4, on_progress=progress.append)
+
+    assert progress == [25.0, 50.0, 100.0]
+
+
+def test_transcode_failure_carries_the_end_of_stderr(tmp_path, fake_ffmpeg, monkeypatch):
+    monkeypatch.setenv("FAKE_FFMPEG_EXIT", "1")
+
+    with pytest.raises(RuntimeError, match="(?s)ffmpeg exited with 1: .*last words") as error:
+        transcode(tmp_path / "in.webm", tmp_path / "out.mp4", duration=4, on_progress=lambda percent: None)
+    assert len(str(error.value)) < 600
@@ -0,0 +1,65 @@
+from app.utils.metrics import MetricsRegistry
+
+
+def test_counter_and_gauge_render():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests served", ("method",))
+    in_flight = registry.gauge("in_flight", "Requests in flight")
+    requests.inc("GET")
+    requests.inc("GET", amount=2)
+    requests.inc("POST")
+    in_flight.inc()
+    in_flight.inc()
+    in_flight.dec()
+
+    assert registry.render() == (
+        "# HELP requests_total Requests served\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{method="GET"} 3.0\n'
+        'requests_total{method="POST"} 1.0\n'
+        "# HELP in_flight Requests in flight\n"
+        "# TYPE in_flight gauge\n"
+        "in_flight 1.0\n"
+    )
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe("/a", value=value)
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_seconds_bucket{route="/a",le="0.1"} 2.0',
+        'latency_seconds_bucket{route="/a",le="1.0"} 3.0',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 4.0',
+        'latency_seconds_sum{route="/a"} 3.65',
+        'latency_seconds_count{route="/a"} 4.0',
+    ]
+
+
+def test_label_values_and_help_are_escaped():
+    registry = MetricsRegistry()
+    counter = registry.counter("odd_total", "Line one\nback\\slash", ("path",))
+    counter.inc('a"b\\c\nd')
+
+    assert registry.render().splitlines() == [
+        "# HELP odd_total Line one\\nback\\\\slash",
+        "# TYPE odd_total counter",
+        'odd_total{path="a\\"b\\\\c\\nd"} 1.0',
+    ]
+
+
+def test_collectors_run_before_each_render():
+    registry = MetricsRegistry()
+    gauge = registry.gauge("renders", "Renders so far")
+    renders = []
+
+    def collect():
+        renders.append(None)
+        gauge.set(value=len(renders))
+
+    registry.add_collector(collect)
+
+    registry.render()
+    assert registry.render().splitlines()[-1] == "renders 2"
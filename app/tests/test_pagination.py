@@ -0,0 +1,78 @@
+import base64
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session, select
+
+from app.api.dependencies.custom_exception import BadRequestError
+from app.db import get_async_engine
+from app.db.base_model import utcnow
+from app.db.models import Review
+from app.db.pagination import decode_cursor, encode_cursor, encode_cursor_values, paginate
+from app.db.session import async_session_factory
+
+
+def b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def test_cursor_round_trips():
+    review = Review(creator_id=uuid4(), title="Review", content_type="video/mp4", storage_key="key", upload_length=1)
+
+    assert decode_cursor(encode_cursor(review)) == (review.created_at, review.uuid)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    "é",
+    b64(b"not json"),
+    b64(b"\xff\xfe"),
+    b64(b'{"created_at": "2024-01-01"}'),
+    encode_cursor_values([]),
+    encode_cursor_values(["2024-01-01T00:00:00+00:00"]),
+    encode_cursor_values(["2024-01-01T00:00:00+00:00", str(uuid4()), "extra"]),
+    encode_cursor_values([1, 2]),
+    encode_cursor_values(["yesterday", str(uuid4())]),
+    encode_cursor_values(["2024-01-01T00:00:00+00:00", "not a uuid"]),
+    encode_cursor_values(["2024-01-01T00:00:00", str(uuid4())]),  # No offset to compare with timestamptz
+])
+def test_malformed_cursor_is_a_bad_request(cursor):
+    with pytest.raises(BadRequestError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.anyio
+async def test_pages_split_rows_with_equal_created_at(async_db, session: Session, user_factory):
+    creator = user_factory()
+    created_at = utcnow()
+    # Seven rows share a timestamp, so most page boundaries fall inside the tie
+    ages = [timedelta(0)] * 7 + [timedelta(seconds=1), timedelta(seconds=2)]
+    for age in ages:
+        session.add(Review(
+            creator_id=creator.uuid,
+            title="Review",
+            content_type="video/mp4",
+            storage_key="key",
+            upload_length=1,
+            created_at=created_at - age,
+        ))
+    session.commit()
+    expected = [
+        review.uuid for review in session.exec(
+            select(Review).order_by(Review.created_at.desc(), Review.uuid.desc())
+        )
+    ]
+
+    seen, cursor = [], None
+    async with async_session_factory(bind=get_async_engine()) as async_session:
+        while True:
+            rows, cursor = await paginate(
+                async_session, select(Review).where(Review.creator_id == creator.uuid), Review, limit=2, cursor=cursor
+            )
+            assert len(rows) <= 2
+            seen += [row.uuid for row in rows]
+            if cursor is None:
+                break
+
+    assert seen == expected
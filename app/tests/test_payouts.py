@@ -0,0 +1,113 @@
+from decimal import Decimal
+from typing import Dict, List
+from uuid import UUID
+
+import pytest
+from sqlmodel import Session, func, select, update
+
+from app.db import get_engine
+from app.db.models import CreatorBalance, Payout
+from app.schemas.enums import PayoutStatus
+from app.schemas.payout import PayoutReport
+from app.services.payouts import FakePaymentProvider, PayoutRunner, PendingPayout, pay_all
+
+
+pytestmark = pytest.mark.anyio
+
+BALANCES = [Decimal("25.00"), Decimal("40.10"), Decimal("99.99")]
+
+
+class CrashAfterPaying(PayoutRunner):
+    """Dies after the provider paid a chunk, before the outcome is recorded."""
+
+    async def _submit(self, payouts: List[PendingPayout], report: PayoutReport) -> None:
+        await pay_all(self.provider, payouts, self.concurrency)
+        raise RuntimeError("Simulated crash")
+
+
+def add_balances(session: Session, user_factory, balances: List[Decimal]) -> Dict[UUID, Decimal]:
+    amounts = {}
+    for balance in balances:
+        creator = user_factory()
+        session.add(CreatorBalance(creator_id=creator.uuid, currency="USD", balance=balance, lifetime_earned=balance))
+        amounts[creator.uuid] = balance
+    session.commit()
+    return amounts
+
+
+def expire_claims() -> None:
+    with Session(get_engine()) as session:
+        session.exec(update(Payout).where(Payout.status == PayoutStatus.PENDING.value).values(claimed_until=func.now()))
+        session.commit()
+
+
+def payouts() -> List[Payout]:
+    with Session(get_engine()) as session:
+        return list(session.exec(select(Payout)).all())
+
+
+def balances() -> Dict[UUID, Decimal]:
+    with Session(get_engine()) as session:
+        return dict(session.exec(select(CreatorBalance.creator_id, CreatorBalance.balance)).all())
+
+
+async def test_resumed_run_does_not_pay_twice(async_db, session, user_factory):
+    amounts = add_balances(session, user_factory, BALANCES)
+    provider = FakePaymentProvider()
+
+    with pytest.raises(RuntimeError):
+        await CrashAfterPaying(provider, minimum=Decimal("10"), chunk_size=2).run()
+    assert len(provider.transfers) == 2
+    assert all(payout.status == PayoutStatus.PENDING.value for payout in payouts())
+
+    runner = PayoutRunner(provider, minimum=Decimal("10"), chunk_size=2)
+    # The crashed run's claims are still live, so only the untouched balance is paid
+    report = await runner.run()
+    assert report.succeeded == 1
+    assert len(provider.transfers) == 3
+
+    expire_claims()
+    report = await runner.run()
+    assert report.succeeded == 2
+    assert provider.calls == 5  # The two resumed payouts were submitted again, under the same keys
+
+    # ...but each creator was paid exactly once, and debited exactly once
+    paid = {transfer.creator_id: transfer.amount for transfer in provider.transfers.values()}
+    assert paid == amounts
+    assert provider.paid == {"USD": sum(BALANCES)}
+    assert all(payout.status == PayoutStatus.SUCCEEDED.value for payout in payouts())
+    assert set(balances().values()) == {Decimal("0")}
+
+    assert (await runner.run()).succeeded == 0
+
+
+async def test_declined_payout_is_credited_back(async_db, session, user_factory):
+    amounts = add_balances(session, user_factory, BALANCES[:1])
+    provider = FakePaymentProvider(decline_rate=1.0)
+
+    report = await PayoutRunner(provider, minimum=Decimal("10")).run()
+
+    assert report.declined == 1
+    assert provider.transfers == {}
+    [payout] = payouts()
+    assert payout.status == PayoutStatus.FAILED.value
+    assert payout.last_error == "Simulated decline"
+    assert balances() == amounts
+
+
+async def test_failed_payout_is_retried_under_the_same_key(async_db, session, user_factory):
+    amounts = add_balances(session, user_factory, BALANCES[:1])
+    provider = FakePaymentProvider(error_rate=1.0)
+    runner = PayoutRunner(provider, minimum=Decimal("10"))
+
+    assert (await runner.run()).retrying == 1
+    [payout] = payouts()
+    assert payout.status == PayoutStatus.PENDING.value
+    assert payout.attempts == 1
+    assert set(balances().values()) == {Decimal("0")}  # Debited while in flight
+
+    provider.error_rate = 0.0
+    expire_claims()
+    assert (await runner.run()).succeeded == 1
+    assert list(provider.transfers) == [payout.idempotency_key]
+    assert provider.paid == {"USD": sum(amounts.values())}
@@ -0,0 +1,83 @@
+import pytest
+from sqlmodel import Session
+
+from app.core.principal_cache import principal_cache
+from app.db import get_async_engine, get_engine
+from app.db.models import User
+from app.db.session import async_session_factory
+from app.schemas.user import Principal
+
+
+@pytest.fixture
+def cache(redis_db):
+    principal_cache.local.clear()
+    yield principal_cache
+    principal_cache.local.clear()
+
+
+def cached(user: User) -> Principal:
+    principal = Principal.model_validate(user)
+    principal_cache.set(principal)
+    return principal
+
+
+def test_hit_from_either_tier(cache, user_factory, redis_db):
+    principal = cached(user_factory())
+
+    assert cache.get(principal.uuid) == principal
+    cache.local.clear()
+    assert cache.get(principal.uuid) == principal  # From Redis
+    assert cache.get(str(principal.uuid)) == principal  # From the local tier again
+    assert redis_db.ttl(f"principal:{principal.uuid}") > 0
+
+
+def test_updating_the_user_invalidates_it(cache, user_factory, redis_db):
+    user = user_factory()
+    cached(user)
+
+    with Session(get_engine()) as session:
+        row = session.get(User, user.uuid)
+        row.is_active = False
+        session.add(row)
+        session.commit()
+
+    assert cache.get(user.uuid) is None
+    assert not redis_db.exists(f"principal:{user.uuid}")
+
+
+def test_principal_cached_before_the_commit_is_invalidated_after_it(cache, user_factory):
+    user = user_factory()
+
+    with Session(get_engine()) as session:
+        row = session.get(User, user.uuid)
+        row.is_superadmin = True
+        session.add(row)
+        session.flush()
+        # A concurrent request reads the committed, old row and caches it
+        stale = cached(user)
+        assert cache.get(user.uuid) == stale
+        session.commit()
+
+    assert cache.get(user.uuid) is None
+
+
+@pytest.mark.anyio
+async def test_async_session_writes_invalidate_without_the_sync_client(
+    async_db, cache, user_factory, redis_db, monkeypatch
+):
+    user = user_factory()
+    cached(user)
+
+    def blocking_delete(*keys):
+        raise AssertionError("Sync Redis call on the event loop")
+
+    monkeypatch.setattr(cache.redis_client, "delete", blocking_delete)
+    async with async_session_factory(bind=get_async_engine()) as session:
+        row = await session.get(User, user.uuid)
+        row.is_verified = True
+        session.add(row)
+        await session.commit()
+    await cache.close()  # Waits for the scheduled deletes
+
+    assert cache.local.get(str(user.uuid)) is None
+    assert not redis_db.exists(f"principal:{user.uuid}")
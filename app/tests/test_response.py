@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+import orjson
+import pytest
+
+from app.api.dependencies.response import error_response, success_response
+from app.db.models import User
+from app.schemas.user import UserSummary
+
+
+USER_ID = UUID("00000000-0000-4000-8000-000000000001")
+CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def test_schemas_and_containers_render_in_the_envelope():
+    summary = UserSummary(uuid=USER_ID, created_at=CREATED_AT)
+
+    response = success_response(status_code=200, data={"users": [summary], "next": None})
+
+    assert orjson.loads(response.body) == {
+        "status": "success",
+        "status_code": 200,
+        "message": "Request successful",
+        "data": {
+            "users": [{"uuid": str(USER_ID), "created_at": "2024-01-01T00:00:00Z", "profile": None}],
+            "next": None,
+        },
+    }
+
+
+@pytest.mark.parametrize("data", [
+    User(uuid=USER_ID, email="creator@example.com", password="$2b$12$hash"),
+    [User(uuid=USER_ID, email="creator@example.com", password="$2b$12$hash")],
+])
+def test_table_models_are_refused(data):
+    with pytest.raises(TypeError, match="User is a table model"):
+        success_response(status_code=200, data=data)
+
+
+def test_error_strings_holding_json_are_decoded():
+    assert orjson.loads(error_response(400, errors='{"field": "required"}').body)["errors"] == {"field": "required"}
+    assert orjson.loads(error_response(400, errors="Bad input").body)["errors"] == {"detail": "Bad input"}
@@ -0,0 +1,127 @@
+import time
+from uuid import uuid4
+
+import pytest
+from jose import jwt
+
+from app.core.config import Config
+from app.core.revocation import RefreshTokenRevocationStore
+from app.core.security import security
+from app.schemas.enums import TokenType
+from app.schemas.token import Token, TokenCreate
+from app.utils.bloom import BloomFilter
+
+
+@pytest.fixture
+def store(redis_db) -> RefreshTokenRevocationStore:
+    return RefreshTokenRevocationStore(redis_db, capacity=1000, rebuild_interval=3600)
+
+
+@pytest.fixture
+def tokens(redis_db, monkeypatch):
+    """The app's token service, revoking through the test Redis database."""
+    monkeypatch.setattr(security, "redis_client", redis_db)
+    monkeypatch.setattr(security, "revocation_store", RefreshTokenRevocationStore(redis_db, capacity=1000, rebuild_interval=3600))
+    return security
+
+
+def refresh_token(user_id: str = "user-1") -> Token:
+    return Token(token=security.create_token(TokenCreate(user_id=user_id, token_type=TokenType.REFRESH)))
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    members = [uuid4().hex for _ in range(1000)]
+    for member in members:
+        bloom.add(member)
+
+    assert all(member in bloom for member in members)
+    false_positives = sum(uuid4().hex in bloom for _ in range(10_000))
+    assert false_positives < 300  # Expect about 100
+    assert bloom.count == 1000
+
+
+def test_revoking_a_token_revokes_its_siblings(tokens):
+    original = refresh_token()
+    _, sibling = tokens.refresh_access_token(original)
+    _, unrelated = tokens.refresh_access_token(refresh_token())
+    sibling = Token(token=sibling)
+
+    assert tokens.is_refresh_token_active(sibling)
+    tokens.revoke_refresh_token(original)
+
+    assert not tokens.is_refresh_token_active(original)
+    assert not tokens.is_refresh_token_active(sibling)
+    assert tokens.is_refresh_token_active(Token(token=unrelated))
+
+
+def test_revocation_outlives_every_token_of_the_family(tokens, redis_db):
+    token = refresh_token()
+    family_id = tokens.verify_refresh_token(token).family_id
+
+    tokens.revoke_refresh_token(token)
+
+    lifetime = Config.REFRESH_TOKEN_EXPIRE_MINUTES * 60
+    assert lifetime - 5 <= redis_db.ttl(RefreshTokenRevocationStore.KEY_PREFIX + family_id) <= lifetime
+
+
+def test_expired_revocations_are_not_stored(store, redis_db):
+    store.revoke("family", expires_at=int(time.time()) - 1)
+
+    assert redis_db.keys("*") == []
+    assert not store.is_revoked("family")
+
+
+def test_legacy_tokens_fall_back_to_the_blacklist(tokens, redis_db):
+    # Issued before token families, so it has no "fid" claim
+    expires_at = int(time.time()) + 600
+    legacy = Token(token=jwt.encode(
+        {"sub": "user-1", "type": TokenType.REFRESH.value, "exp": expires_at},
+        Config.REFRESH_SECRET_KEY,
+        algorithm=Config.ALGORITHM,
+    ))
+    assert tokens.is_refresh_token_active(legacy)
+
+    tokens.revoke_refresh_token(legacy)
+
+    assert not tokens.is_refresh_token_active(legacy)
+    assert redis_db.keys(RefreshTokenRevocationStore.KEY_PREFIX + "*") == []
+    assert 0 < redis_db.ttl(f"blacklisted_token:{legacy.token}") <= 600
+
+
+def test_rebuild_loads_revocations_and_drops_expired_ones(store, redis_db):
+    expires_at = int(time.time()) + 600
+    store.revoke("revoked", expires_at)
+    store.revoke("expiring", expires_at)
+    # A new worker's filter starts empty and is filled from Redis
+    worker = RefreshTokenRevocationStore(redis_db, capacity=1000, rebuild_interval=3600)
+    worker.rebuild()
+    worker._synced = True
+
+    assert worker.is_revoked("revoked") and worker.is_revoked("expiring")
+    assert not worker.is_revoked("never revoked")
+
+    redis_db.delete(RefreshTokenRevocationStore.KEY_PREFIX + "expiring")
+    worker.rebuild()
+    assert worker._bloom.count == 1
+    assert worker.is_revoked("revoked")
+    assert not worker.is_revoked("expiring")
+
+
+def test_synced_worker_learns_of_revocations_over_pub_sub(store, redis_db):
+    worker = RefreshTokenRevocationStore(redis_db, capacity=1000, rebuild_interval=3600)
+    worker.start()
+    try:
+        deadline = time.monotonic() + 5
+        while not worker._synced and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert worker._synced
+
+        store.revoke("family", int(time.time()) + 600)
+        while "family" not in worker._bloom and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert worker.is_revoked("family")
+    finally:
+        worker.stop()
+    assert not worker._synced
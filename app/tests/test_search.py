@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+import pytest
+from sqlmodel import Session
+
+from app.api.dependencies.custom_exception import BadRequestError
+from app.core.config import Config
+from app.db import get_engine
+from app.db.base_model import utcnow
+from app.db.models import Product
+from app.schemas.enums import SearchKind
+from app.services.search import (
+    IndexedDocument,
+    MemorySearchBackend,
+    PostgresSearchBackend,
+    SearchService,
+    parse_query,
+)
+
+
+pytestmark = pytest.mark.anyio
+
+# name: (title, description, age in days)
+PRODUCTS = {
+    "new widget": ("Blue widget", "Bright and sturdy", 1),
+    "widget accessory": ("Gadget", "A widget accessory", 1),
+    "old widget": ("Blue widget", "Bright and sturdy", 300),
+    "red widget": ("Red widget", "Bright and sturdy", 2),
+    "lamp": ("Desk lamp", "Warm light", 1),
+}
+
+
+class Catalog:
+    """A search service over PRODUCTS, with a way to add more."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.service = SearchService(backend)
+        self.names: Dict[UUID, str] = {}
+        for name, (title, description, age) in PRODUCTS.items():
+            self.add(name, title, description, utcnow() - timedelta(days=age))
+
+    def add(self, name: str, title: str, description: str, created_at: datetime) -> None:
+        if isinstance(self.backend, MemorySearchBackend):
+            uuid = uuid4()
+            document = IndexedDocument(uuid, title, description, created_at)
+            self.backend.indexes[SearchKind.PRODUCT].add(document, {"A": title, "C": description})
+        else:
+            with Session(get_engine()) as session:
+                product = Product(
+                    merchant="acme",
+                    sku=name,
+                    title=title,
+                    description=description,
+                    price=Decimal("10"),
+                    url="https://example.com",
+                    created_at=created_at,
+                )
+                session.add(product)
+                session.commit()
+                uuid = product.uuid
+        self.names[uuid] = name
+
+    async def search(self, query: str, limit: int = 10, cursor: Optional[str] = None) -> Tuple[List[str], Optional[str]]:
+        hits, next_cursor = await self.service.search(SearchKind.PRODUCT, query, limit=limit, cursor=cursor)
+        return [self.names[hit.uuid] for hit in hits], next_cursor
+
+
+@pytest.fixture(params=["memory", "postgres"])
+def catalog(request) -> Catalog:
+    if request.param == "memory":
+        return Catalog(MemorySearchBackend(Config.SEARCH_RECENCY_HALF_LIFE_DAYS))
+    request.getfixturevalue("async_db")
+    return Catalog(PostgresSearchBackend(Config.SEARCH_RECENCY_HALF_LIFE_DAYS))
+
+
+async def names(catalog: Catalog, query: str) -> List[str]:
+    return (await catalog.search(query))[0]
+
+
+def test_parse_query_splits_words():
+    assert parse_query("  Blue-Widget, 2x! ") == ["blue", "widget", "2x"]
+    assert parse_query("__ !!") == []
+
+
+async def test_terms_match_as_prefixes(catalog):
+    assert set(await names(catalog, "wid")) == {"new widget", "widget accessory", "old widget", "red widget"}
+    assert set(await names(catalog, "blu wid")) == {"new widget", "old widget"}
+    assert await names(catalog, "lamp widget") == []
+    assert await names(catalog, "nothing") == []
+
+
+async def test_ranking_favours_title_matches_and_newer_content(catalog):
+    ranked = await names(catalog, "widget")
+    assert ranked[:2] == ["new widget", "red widget"]
+    assert ranked.index("old widget") > ranked.index("new widget")
+    assert ranked.index("widget accessory") > ranked.index("red widget")
+
+
+async def test_query_without_words_is_rejected(catalog):
+    with pytest.raises(BadRequestError):
+        await catalog.search("!!!")
+
+
+async def test_cursor_pages_are_stable(catalog):
+    expected = await names(catalog, "widget")
+
+    paged, cursor = await catalog.search("widget", limit=1)
+    # Content created after the first page doesn't shift the later ones
+    catalog.add("fresh widget", "Fresh widget", "Brand new", utcnow())
+    while cursor is not None:
+        page, cursor = await catalog.search("widget", limit=1, cursor=cursor)
+        paged += page
+
+    assert paged == expected
+    assert (await names(catalog, "widget"))[0] == "fresh widget"
+
+
+async def test_malformed_cursor_is_rejected(catalog):
+    with pytest.raises(BadRequestError):
+        await catalog.search("widget", cursor="not-a-cursor")
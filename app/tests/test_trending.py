@@ -0,0 +1,104 @@
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from app.services.trending import (
+    MAX_QUALITY,
+    MIN_QUALITY,
+    EngagementArrays,
+    TrendingRanker,
+    compute_scores,
+    rank_by_category,
+    trending_key,
+)
+
+
+def engagement(
+    buckets: Sequence[tuple],
+    reviews: int,
+    memberships: Dict[str, List[int]] = None,
+) -> EngagementArrays:
+    """Arrays from (review, age in hours, views, clicks, conversions) buckets and category -> reviews."""
+    counters = np.array(buckets, dtype=float).reshape(-1, 5)
+    memberships = memberships or {}
+    categories = sorted(memberships)
+    pairs = [(review, index) for index, category in enumerate(categories) for review in memberships[category]]
+    return EngagementArrays(
+        review_ids=[f"review-{i}" for i in range(reviews)],
+        bucket_review=counters[:, 0].astype(np.int64),
+        bucket_age_hours=counters[:, 1],
+        views=counters[:, 2],
+        clicks=counters[:, 3],
+        conversions=counters[:, 4],
+        categories=categories,
+        member_review=np.array([review for review, _ in pairs], dtype=np.int64),
+        member_category=np.array([index for _, index in pairs], dtype=np.int64),
+    )
+
+
+def test_heat_halves_every_half_life():
+    # No clicks anywhere, so every quality multiplier is 1 and the score is log1p(heat)
+    data = engagement([(0, 0, 10, 0, 0), (1, 6, 10, 0, 0), (2, 12, 10, 0, 0), (3, 0, 0, 0, 0)], reviews=5)
+
+    scores = compute_scores(data, half_life_hours=6, prior_views=0)
+
+    assert np.allclose(np.expm1(scores), [10, 5, 2.5, 0, 0])
+    assert list(np.argsort(-scores)[:3]) == [0, 1, 2]
+
+
+def test_weighted_engagement_sums_across_buckets():
+    data = engagement([(0, 0, 1, 0, 0), (0, 0, 0, 0, 1), (1, 0, 0, 0, 0)], reviews=2)
+
+    heat = np.expm1(compute_scores(data, half_life_hours=6, prior_views=1e12))  # Quality ~1 with a huge prior
+
+    assert np.allclose(heat, [26, 0])
+
+
+def test_quality_multiplier_is_clipped():
+    # Review 0 is clicked on every view, review 1 never; review 2 is close to the overall rate
+    data = engagement([(0, 0, 100, 100, 0), (1, 0, 100, 0, 0), (2, 0, 1000, 100, 0)], reviews=3)
+
+    scores = compute_scores(data, half_life_hours=6, prior_views=0)
+
+    heat = np.array([100 + 5 * 100, 100, 1000 + 5 * 100])
+    assert np.isclose(scores[0], np.log1p(heat[0]) * np.sqrt(MAX_QUALITY))
+    assert np.isclose(scores[1], np.log1p(heat[1]) * np.sqrt(MIN_QUALITY))
+    assert np.sqrt(MIN_QUALITY) < scores[2] / np.log1p(heat[2]) < np.sqrt(MAX_QUALITY)
+
+
+def test_top_k_per_category():
+    data = engagement([], reviews=6, memberships={"audio": [0, 1, 2, 3], "garden": [4], "toys": [5]})
+    scores = np.array([3.0, 2.0, 2.0, 2.0, 1.0, 0.0])
+
+    rankings = rank_by_category(data, scores, k=2)
+
+    assert set(rankings) == {None, "audio", "garden", "toys"}
+    # Of the three tied for second, exactly one makes the cut
+    for category in (None, "audio"):
+        ranking = set(rankings[category])
+        assert len(ranking) == 2 and 0 in ranking and ranking - {0} <= {1, 2, 3}
+    assert list(rankings["garden"]) == [4]
+    # Nothing with a zero score is trending
+    assert len(rankings["toys"]) == 0
+
+
+def test_no_memberships_only_ranks_overall():
+    data = engagement([(0, 0, 5, 0, 0)], reviews=2)
+
+    rankings = rank_by_category(data, compute_scores(data, half_life_hours=6, prior_views=0), k=10)
+
+    assert list(rankings) == [None]
+    assert list(rankings[None]) == [0]
+
+
+def test_publish_replaces_rankings_and_deletes_empty_ones(redis_db):
+    ranker = TrendingRanker(redis_db, ttl=60)
+    ranker.publish({None: [("a", 2.0), ("b", 1.0)], "audio": [("a", 2.0)], "toys": [("c", 1.0)]})
+
+    ranker.publish({None: [("c", 3.0), ("a", 1.0)], "audio": [("a", 2.0)], "toys": []})
+
+    assert redis_db.zrevrange(trending_key(None), 0, -1) == ["c", "a"]
+    assert redis_db.zrevrange(trending_key("audio"), 0, -1) == ["a"]
+    assert not redis_db.exists(trending_key("toys"))
+    assert 0 < redis_db.ttl(trending_key(None)) <= 60
+    assert redis_db.keys("*:next") == []
@@ -0,0 +1,69 @@
+from typing import List
+from uuid import uuid4
+
+import pytest
+import redis.asyncio as aioredis
+from starlette.requests import Request
+
+from app.api.dependencies.custom_exception import BadRequestError, UnsupportedMediaTypeError
+from app.services.upload import UploadService, multipart_file_chunks
+
+
+pytestmark = pytest.mark.anyio
+
+
+BOUNDARY = "chunkboundary"
+
+
+def chunk_request(content_type: str, body: List[bytes] = ()) -> Request:
+    messages = [{"type": "http.request", "body": piece, "more_body": True} for piece in body]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive():
+        return messages.pop(0)
+
+    scope = {"type": "http", "method": "PATCH", "headers": [(b"content-type", content_type.encode())]}
+    return Request(scope, receive)
+
+
+def multipart_request(*body: bytes) -> Request:
+    return chunk_request(f"multipart/form-data; boundary={BOUNDARY}", list(body))
+
+
+def file_part(data: bytes) -> bytes:
+    return (
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="video.mp4"\r\n'
+        "Content-Type: video/mp4\r\n\r\n"
+    ).encode() + data
+
+
+async def read_chunks(request: Request) -> bytes:
+    return b"".join([piece async for piece in multipart_file_chunks(request)])
+
+
+@pytest.mark.parametrize("content_type", ["", "text/plain", "application/octet-stream"])
+async def test_chunk_with_other_content_type_is_rejected(content_type):
+    # Rejected before the lock or the database are touched; nothing needs to be running
+    service = UploadService(storage=None, redis_client=aioredis.Redis())
+
+    with pytest.raises(UnsupportedMediaTypeError):
+        await service.write_chunk(uuid4(), uuid4(), 0, chunk_request(content_type), session=None)
+
+
+async def test_multipart_chunk_yields_the_file_part():
+    body = file_part(b"0123456789" * 100) + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+    # Split mid-part and mid-boundary
+    assert await read_chunks(multipart_request(body[:150], body[150:-10], body[-10:])) == b"0123456789" * 100
+
+
+async def test_malformed_multipart_chunk_is_rejected():
+    with pytest.raises(BadRequestError):
+        await read_chunks(multipart_request(b"--not-the-boundary\r\n\r\nvideo"))
+
+
+@pytest.mark.parametrize("body", [b"", f"--{BOUNDARY}\r\n".encode(), file_part(b"half a video")])
+async def test_multipart_chunk_ending_before_its_closing_boundary_is_rejected(body):
+    with pytest.raises(BadRequestError):
+        await read_chunks(multipart_request(body))
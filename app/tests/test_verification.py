@@ -0,0 +1,157 @@
+from datetime import timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlmodel import Session
+
+from app.db.base_model import utcnow
+from app.db.models import Conversion, Product, Review, RollupWatermark
+from app.services.verification import SWEEP_SOURCE, WATERMARK_SOURCE, PurchaseMatcher
+
+
+class Purchases:
+    """A creator, a product they may review, and ways to record reviews and purchases of it."""
+
+    def __init__(self, session: Session, creator_id):
+        self.session = session
+        self.creator_id = creator_id
+        self.product = Product(merchant="acme", sku=uuid4().hex, title="Widget", price=Decimal("10"), url="https://example.com")
+        session.add(self.product)
+        session.commit()
+
+    def add_review(self, **fields) -> Review:
+        review = Review(**{
+            "creator_id": self.creator_id,
+            "product_id": self.product.uuid,
+            "title": "Review",
+            "content_type": "video/mp4",
+            "storage_key": "key",
+            "upload_length": 1,
+            **fields,
+        })
+        self.session.add(review)
+        self.session.commit()
+        return review
+
+    def add_purchase(self, **fields) -> Conversion:
+        conversion = Conversion(**{
+            "merchant": "acme",
+            "order_id": uuid4().hex,
+            "link_code": "code",
+            "product_id": self.product.uuid,
+            "buyer_id": self.creator_id,
+            "sale_amount": Decimal("10"),
+            "commission_amount": Decimal("1"),
+            "occurred_at": utcnow(),
+            **fields,
+        })
+        self.session.add(conversion)
+        self.session.commit()
+        return conversion
+
+    def is_verified(self, review: Review) -> bool:
+        self.session.refresh(review)
+        return review.is_verified
+
+    def mark(self, source: str = WATERMARK_SOURCE) -> RollupWatermark:
+        mark = self.session.get(RollupWatermark, source)
+        self.session.refresh(mark)
+        return mark
+
+
+def test_purchase_before_the_review_verifies_it(db, session, user_factory):
+    purchases = Purchases(session, user_factory().uuid)
+    matcher = PurchaseMatcher(lag=0, sweep_interval=3600)
+
+    purchases.add_purchase()
+    assert matcher.run() == 0
+
+    review = purchases.add_review()
+    assert matcher.run() == 1
+    assert purchases.is_verified(review)
+    assert review.verified_at is not None
+
+
+def test_review_before_the_purchase_is_verified_once_it_is_bought(db, session, user_factory):
+    purchases = Purchases(session, user_factory().uuid)
+    matcher = PurchaseMatcher(lag=0, sweep_interval=3600)
+
+    review = purchases.add_review()
+    assert matcher.run() == 0
+    assert not purchases.is_verified(review)
+
+    purchases.add_purchase()
+    assert matcher.run() == 1
+    assert purchases.is_verified(review)
+
+
+def test_reviews_of_other_products_or_by_other_buyers_stay_unverified(db, session, user_factory):
+    purchases = Purchases(session, user_factory().uuid)
+    other_product = Purchases(session, purchases.creator_id).product
+    matcher = PurchaseMatcher(lag=0, sweep_interval=3600)
+
+    purchases.add_purchase(buyer_id=user_factory().uuid)
+    purchases.add_purchase(product_id=other_product.uuid)
+    review = purchases.add_review()
+
+    assert matcher.run() == 0
+    assert not purchases.is_verified(review)
+
+
+def test_repeated_runs_verify_a_review_once(db, session, user_factory):
+    purchases = Purchases(session, user_factory().uuid)
+    matcher = PurchaseMatcher(lag=0, sweep_interval=0)  # Sweep on every run too
+    review = purchases.add_review()
+    purchases.add_purchase()
+    purchases.add_purchase()
+
+    assert matcher.run() == 1
+    assert purchases.is_verified(review)
+    verified_at = review.verified_at
+
+    assert [matcher.run() for _ in range(3)] == [0, 0, 0]
+    assert purchases.is_verified(review)
+    assert review.verified_at == verified_at
+
+
+def test_watermark_trails_the_database_clock_by_the_lag(db, session, user_factory):
+    purchases = Purchases(session, user_factory().uuid)
+    matcher = PurchaseMatcher(lag=60, sweep_interval=3600)
+
+    before = utcnow()
+    matcher.run()
+    first = purchases.mark().last_time
+    assert before - timedelta(seconds=61) < first <= utcnow() - timedelta(seconds=60)
+
+    # Within the lag, so not seen until a run whose window reaches it
+    review = purchases.add_review(created_at=utcnow() - timedelta(seconds=30))
+    purchases.add_purchase(created_at=utcnow() - timedelta(hours=1))
+    assert matcher.run() == 0
+    assert purchases.mark().last_time > first
+
+    matcher.lag = 0
+    assert matcher.run() == 1
+    assert purchases.is_verified(review)
+
+
+def test_sweep_verifies_rows_committed_behind_the_mark(db, session, user_factory):
+    purchases = Purchases(session, user_factory().uuid)
+    matcher = PurchaseMatcher(lag=0, sweep_interval=3600)
+    matcher.run()
+
+    # Stamped before the mark, as if its transaction committed long after it began
+    purchases.add_purchase(created_at=utcnow() - timedelta(minutes=5))
+    review = purchases.add_review(created_at=utcnow() - timedelta(minutes=5))
+    assert matcher.run() == 0
+    assert not purchases.is_verified(review)
+
+    # Move the sweep's mark back so the next run is due a sweep
+    sweep_mark = purchases.mark(SWEEP_SOURCE)
+    sweep_mark.last_time -= timedelta(hours=2)
+    moved_to = sweep_mark.last_time
+    session.add(sweep_mark)
+    session.commit()
+
+    assert matcher.run() == 1
+    assert purchases.is_verified(review)
+    assert purchases.mark(SWEEP_SOURCE).last_time > moved_to + timedelta(hours=1)
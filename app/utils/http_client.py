@@ -0,0 +1,158 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Optional
+
+import httpx
+
+from app.core.config import Config
+from app.utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class RetryBudget:
+    """Caps retries to a fraction of recent requests so retries can't amplify an outage."""
+
+    def __init__(self, ratio: float, min_retries_per_second: float, window: float = 10.0):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._requests and self._requests[0] < cutoff:
+            self._requests.popleft()
+        while self._retries and self._retries[0] < cutoff:
+            self._retries.popleft()
+
+    def record_request(self) -> None:
+        self._requests.append(time.monotonic())
+
+    def can_retry(self) -> bool:
+        now = time.monotonic()
+        self._trim(now)
+        allowed = len(self._requests) * self.ratio + self.min_retries_per_second * self.window
+        if len(self._retries) < allowed:
+            self._retries.append(now)
+            return True
+        return False
+
+
+class HTTPClient:
+    """Shared async HTTP client with pooled keep-alive connections, timeouts and budgeted retries."""
+
+    def __init__(
+        self,
+        timeout: float,
+        max_retries: int,
+        max_connections: int,
+        max_keepalive_connections: int,
+        retry_budget: RetryBudget,
+    ):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.retry_budget = retry_budget
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def start(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        """Open the underlying connection pool.
+
+        Args:
+            transport: Optional transport override (e.g. ``httpx.MockTransport``) for tests.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                transport=transport,
+            )
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            raise RuntimeError("HTTP client is not started.")
+        return self._client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures within the retry budget.
+
+        Connection failures are retried for every method since the request never
+        reached the server; 5xx responses and read timeouts only for idempotent methods.
+        """
+        await self.start()
+        method = method.upper()
+        max_retries = self.max_retries if retries is None else retries
+        idempotent = method in IDEMPOTENT_METHODS
+        self.retry_budget.record_request()
+
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.request(
+                    method, url, timeout=timeout or self.timeout, **kwargs
+                )
+                if not (idempotent and response.status_code in RETRYABLE_STATUS_CODES):
+                    return response
+                error: Optional[Exception] = None
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                error = e
+            except httpx.TimeoutException as e:
+                if not idempotent:
+                    raise
+                error = e
+
+            if attempt >= max_retries or not self.retry_budget.can_retry():
+                if error is not None:
+                    raise error
+                return response
+
+            attempt += 1
+            delay = min(0.1 * 2 ** attempt, 1.0) * random.uniform(0.5, 1.0)
+            logger.warning(f"Retrying {method} {url} (attempt {attempt}) after {error or response.status_code}")
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+
+http_client = HTTPClient(
+    timeout=Config.HTTP_CLIENT_TIMEOUT,
+    max_retries=Config.HTTP_CLIENT_MAX_RETRIES,
+    max_connections=Config.HTTP_CLIENT_MAX_CONNECTIONS,
+    max_keepalive_connections=Config.HTTP_CLIENT_MAX_KEEPALIVE,
+    retry_budget=RetryBudget(ratio=0.2, min_retries_per_second=1),
+)
+
+
+def get_http_client() -> HTTPClient:
+    """Dependency returning the shared HTTP client; override it in tests to use a stub server."""
+    return http_client
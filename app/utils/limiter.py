@@ -1,5 +1,171 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import asyncio
+import time
+import uuid
+from collections import deque
+from typing import Callable, Dict, Optional, Protocol, Tuple
 
+import redis.asyncio as aioredis
+from fastapi import Request
 
-limiter = Limiter(key_func=get_remote_address)
\ No newline at end of file
+from app.api.dependencies.custom_exception import RateLimitExceededError
+from app.core.config import Config
+from app.utils.cache import TTLCache
+from app.utils.logger import get_logger
+from app.utils.redis_client import InstrumentedAsyncRedis
+
+
+logger = get_logger(__name__)
+
+UNITS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """Parse a rate such as ``"5/minute"`` into (limit, window_seconds)."""
+    limit, unit = rate.split("/")
+    return int(limit), UNITS[unit.strip().rstrip("s")]
+
+
+def ip_key(request: Request) -> str:
+    """Rate-limit key for the client IP address."""
+    return request.client.host if request.client else "unknown"
+
+
+class RateLimitBackend(Protocol):
+    async def hit(self, key: str, limit: int, window: int) -> Tuple[bool, float]:
+        """Record a hit; return (allowed, retry_after_seconds)."""
+        ...
+
+
+# KEYS[1] = bucket key; ARGV = now_ms, window_ms, limit, member
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+local count = redis.call('ZCARD', key)
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, window)
+    return {1, 0}
+end
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return {0, tonumber(oldest[2]) + window - now}
+"""
+
+
+class RedisSlidingWindowBackend:
+    """Sliding-window log shared by every worker, checked and updated in one Lua call."""
+
+    def __init__(self, redis_client: aioredis.Redis):
+        self.redis_client = redis_client
+        self.script = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
+
+    async def hit(self, key: str, limit: int, window: int) -> Tuple[bool, float]:
+        now_ms = int(time.time() * 1000)
+        allowed, retry_after_ms = await self.script(
+            keys=[f"ratelimit:{key}"],
+            args=[now_ms, window * 1000, limit, f"{now_ms}-{uuid.uuid4().hex[:8]}"],
+        )
+        return bool(allowed), int(retry_after_ms) / 1000
+
+
+class MemorySlidingWindowBackend:
+    """Per-process sliding-window log; a stand-in for Redis in tests and local runs."""
+
+    def __init__(self):
+        self._hits: Dict[str, deque] = {}
+        self._lock = asyncio.Lock()
+
+    async def hit(self, key: str, limit: int, window: int) -> Tuple[bool, float]:
+        async with self._lock:
+            now = time.monotonic()
+            hits = self._hits.setdefault(key, deque())
+            while hits and hits[0] <= now - window:
+                hits.popleft()
+            if len(hits) < limit:
+                hits.append(now)
+                return True, 0.0
+            return False, hits[0] + window - now
+
+
+class TokenBucket:
+    """Per-worker token bucket; empty only when this worker alone exceeds the rate."""
+
+    __slots__ = ("capacity", "rate", "tokens", "updated_at")
+
+    def __init__(self, capacity: int, window: int):
+        self.capacity = capacity
+        self.rate = capacity / window
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class RateLimiter:
+    """Sliding-window rate limiter with a local token-bucket pre-check.
+
+    The local bucket rejects floods from a single worker's point of view
+    without a Redis round trip; everything else is decided by the shared backend.
+    If the backend is unreachable, requests are allowed through.
+    """
+
+    def __init__(self, backend: RateLimitBackend, local_buckets: int = 100_000):
+        self.backend = backend
+        self._buckets = TTLCache[TokenBucket](max_size=local_buckets, ttl=UNITS["day"])
+
+    async def check(self, scope: str, identity: str, rate: str) -> None:
+        """
+        Count a hit for ``identity`` (an IP, account email, ...) within ``scope``.
+
+        Raises:
+            RateLimitExceededError: If the rate has been exceeded.
+        """
+        limit, window = parse_rate(rate)
+        key = f"{scope}:{identity}"
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(limit, window)
+            self._buckets.set(key, bucket, ttl=window)
+        if not bucket.take():
+            self._reject(window / limit)
+
+        try:
+            allowed, retry_after = await self.backend.hit(key, limit, window)
+        except Exception as e:
+            logger.warning(f"Rate limit backend unavailable, allowing request: {e}")
+            return
+        if not allowed:
+            self._reject(retry_after)
+
+    def _reject(self, retry_after: float) -> None:
+        raise RateLimitExceededError(
+            "Too many requests, please try again later.",
+            errors={"retry_after": max(1, round(retry_after))},
+        )
+
+    def limit(self, rate: str, key_func: Callable[[Request], str] = ip_key, scope: Optional[str] = None):
+        """Build a route dependency enforcing ``rate`` per ``key_func(request)``."""
+
+        async def dependency(request: Request) -> None:
+            await self.check(scope or request.url.path, key_func(request), rate)
+
+        return dependency
+
+
+def create_backend() -> RateLimitBackend:
+    if Config.RATE_LIMIT_BACKEND == "memory":
+        return MemorySlidingWindowBackend()
+    return RedisSlidingWindowBackend(InstrumentedAsyncRedis.from_url(Config.REDIS_URL))
+
+
+limiter = RateLimiter(backend=create_backend())
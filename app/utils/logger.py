@@ -1,7 +1,13 @@
+import atexit
 import os
+import queue
+import sys
 import logging
-from logging.handlers import RotatingFileHandler
+import threading
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 try:
     import orjson
@@ -10,16 +16,31 @@ except ImportError:
     USE_JSON = False
 
 
-LOG_DIR = Path("logs")
+LOG_DIR = Path(os.getenv("LOG_DIR", "logs"))
 LOG_FILE = LOG_DIR / "app.log"
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 MAX_LOG_SIZE = 10 * 1024 * 1024
 BACKUP_COUNT = 5
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10_000))
+LOG_BATCH_SIZE = 256
+LOG_FLUSH_INTERVAL = 0.5
 
 
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Request-scoped context set by RequestContextMiddleware. It holds a mutable dict so
+# values bound from threadpool code (e.g. sync dependencies) are seen by the request.
+log_context_var: ContextVar[Optional[Dict[str, Any]]] = ContextVar("log_context", default=None)
+
+
+def bind_log_context(**values: Any) -> None:
+    """Add values (e.g. user_id) to the current request's log context."""
+    context = log_context_var.get()
+    if context is not None:
+        context.update(values)
+
+
 class JSONLogFormatter(logging.Formatter):
     def format(self, record):
         log_record = {
@@ -28,6 +49,10 @@ class JSONLogFormatter(logging.Formatter):
             "logger": record.name,
             "message": record.getMessage(),
         }
+        if getattr(record, "request_id", None):
+            log_record["request_id"] = record.request_id
+        if getattr(record, "user_id", None):
+            log_record["user_id"] = record.user_id
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
         return orjson.dumps(log_record).decode()
@@ -38,22 +63,141 @@ standard_formatter = logging.Formatter(
     datefmt="%Y-%m-%d %H:%M:%S"
 )
 
-file_handler = RotatingFileHandler(
-    LOG_FILE, maxBytes=MAX_LOG_SIZE, backupCount=BACKUP_COUNT, encoding="utf-8"
-)
-file_handler.setFormatter(JSONLogFormatter() if USE_JSON else standard_formatter)
-file_handler.setLevel(LOG_LEVEL)
 
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(standard_formatter)
-console_handler.setLevel(LOG_LEVEL)
+class ContextQueueHandler(QueueHandler):
+    """Enqueues records without formatting them; drops and counts records when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only attach context here; formatting happens on the writer thread
+        context = log_context_var.get()
+        if context:
+            record.__dict__.update(context)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """Writes queued log records from a background thread, in batches.
+
+    Request threads only append records to a bounded queue. The writer thread
+    formats them (JSON via orjson for the file, plain text for the console),
+    writes each batch with one call per stream and handles file rotation.
+    """
+
+    _STOP = object()
+
+    def __init__(self, maxsize: int, batch_size: int, flush_interval: float):
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.handler = ContextQueueHandler(self.queue)
+        self.handler.setLevel(LOG_LEVEL)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.file_handler = RotatingFileHandler(
+            LOG_FILE, maxBytes=MAX_LOG_SIZE, backupCount=BACKUP_COUNT, encoding="utf-8"
+        )
+        self.file_formatter = JSONLogFormatter() if USE_JSON else standard_formatter
+        self.console_stream = sys.stderr
+        self._reported_dropped = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def dropped(self) -> int:
+        """Number of records dropped because the queue was full."""
+        return self.handler.dropped
+
+    def _next_batch(self) -> List:
+        try:
+            batch = [self.queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, records: List[logging.LogRecord]) -> None:
+        if self.dropped > self._reported_dropped:
+            records.append(logging.makeLogRecord({
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Log queue full, dropped {self.dropped - self._reported_dropped} records",
+            }))
+            self._reported_dropped = self.dropped
+        if not records:
+            return
+
+        file_lines = []
+        console_lines = []
+        for record in records:
+            try:
+                file_lines.append(self.file_formatter.format(record))
+                console_lines.append(standard_formatter.format(record))
+            except Exception:
+                self.handler.handleError(record)
+
+        if self.file_handler.stream is None:
+            # Closed by logging.shutdown() or a logging.config call; reopen like FileHandler.emit
+            self.file_handler.stream = self.file_handler._open()
+        stream = self.file_handler.stream
+        stream.write("\n".join(file_lines) + "\n")
+        stream.flush()
+        if stream.tell() >= MAX_LOG_SIZE:
+            self.file_handler.doRollover()
+
+        self.console_stream.write("\n".join(console_lines) + "\n")
+        self.console_stream.flush()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            stop = any(record is self._STOP for record in batch)
+            self._write([record for record in batch if record is not self._STOP])
+            if stop:
+                return
+
+    def start(self) -> None:
+        """Start the writer thread; a no-op if it is running, so it can be restarted after ``stop``."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Flush pending records and stop the writer thread; records logged meanwhile wait in the queue."""
+        if self._thread is not None:
+            self.queue.put(self._STOP)
+            self._thread.join(timeout=5)
+            self._thread = None
+            self.file_handler.flush()
+
+    def close(self) -> None:
+        """Stop for good, closing the log file."""
+        self.stop()
+        self.file_handler.close()
+
+
+log_pipeline = LogPipeline(
+    maxsize=LOG_QUEUE_SIZE, batch_size=LOG_BATCH_SIZE, flush_interval=LOG_FLUSH_INTERVAL
+)
+log_pipeline.start()
+atexit.register(log_pipeline.close)
 
 
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(LOG_LEVEL)
     if not logger.handlers:
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        logger.addHandler(log_pipeline.handler)
         logger.propagate = False
     return logger
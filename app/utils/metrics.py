@@ -0,0 +1,194 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        documentation = self.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+        return [f"# HELP {self.name} {documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, value in list(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {value}")
+        return lines
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def set(self, *labels: str, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, *labels: str, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(labels)
+            if counts is None:
+                counts = self._values[labels] = [0.0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(*labels, value=time.perf_counter() - start)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, counts in list(self._values.items()):
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {counts[-1]}")
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Per-process metrics registry rendered in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self._metrics: List[Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges right before each scrape."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            collector()
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# HTTP
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served"
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route", "status")
+)
+
+# Database pool
+db_pool_checkout_wait_seconds = registry.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled DB connection", ("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+db_pool_connections = registry.gauge(
+    "db_pool_connections", "Pooled DB connections by state", ("pool", "state")
+)
+db_pool_saturation = registry.gauge(
+    "db_pool_saturation", "Checked-out connections as a fraction of pool capacity", ("pool",)
+)
+
+# Redis
+redis_command_duration_seconds = registry.histogram(
+    "redis_command_duration_seconds", "Redis command latency", ("command",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0),
+)
+
+# Password hashing
+password_hash_duration_seconds = registry.histogram(
+    "password_hash_duration_seconds", "Password hash/verify latency including queueing", ("operation",),
+)
+password_hash_pending = registry.gauge(
+    "password_hash_pending", "Password hashing jobs queued or running"
+)
+password_hash_rejected_total = registry.counter(
+    "password_hash_rejected_total", "Password hashing jobs rejected because the queue was full"
+)
+
+# Event ingestion
+event_flush_duration_seconds = registry.histogram(
+    "event_flush_duration_seconds", "Time to write one batch of events, including failures",
+)
+event_buffer_size = registry.gauge(
+    "event_buffer_size", "Events buffered in memory awaiting a flush"
+)
+events_written_total = registry.counter(
+    "events_written_total", "Events written, by destination (db or spool)", ("destination",)
+)
+events_dropped_total = registry.counter(
+    "events_dropped_total", "Events dropped because the in-memory buffer was full"
+)
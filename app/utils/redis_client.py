@@ -0,0 +1,65 @@
+import asyncio
+import time
+from typing import Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from app.utils.logger import get_logger
+from app.utils.metrics import redis_command_duration_seconds
+
+
+logger = get_logger(__name__)
+
+
+class InstrumentedRedis(redis.Redis):
+    """Redis client that records per-command latency."""
+
+    def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            return super().execute_command(*args, **options)
+        finally:
+            redis_command_duration_seconds.observe(
+                str(args[0]).upper(), value=time.perf_counter() - start
+            )
+
+
+class InstrumentedAsyncRedis(aioredis.Redis):
+    """asyncio Redis client that records per-command latency."""
+
+    async def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            redis_command_duration_seconds.observe(
+                str(args[0]).upper(), value=time.perf_counter() - start
+            )
+
+
+def delete_keys(sync_client: redis.Redis, async_client: aioredis.Redis, *keys: str) -> Optional[asyncio.Task]:
+    """
+    Delete cache ``keys`` without blocking an event loop; failures are logged, not raised.
+
+    Cache invalidation runs in ORM hooks, which run on the event loop when the
+    write goes through an AsyncSession. There the delete is scheduled on the
+    async client and its task returned; elsewhere (sync routes in the
+    threadpool, scripts, the worker) it goes through the sync client.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        try:
+            sync_client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"Cache invalidation of {keys[0]} failed: {e}")
+        return None
+    return loop.create_task(_delete_keys_async(async_client, keys))
+
+
+async def _delete_keys_async(async_client: aioredis.Redis, keys) -> None:
+    try:
+        await async_client.delete(*keys)
+    except aioredis.RedisError as e:
+        logger.warning(f"Cache invalidation of {keys[0]} failed: {e}")
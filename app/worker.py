@@ -0,0 +1,189 @@
+"""
+Background job worker.
+
+Run alongside the API with ``python -m app.worker``. The main process claims
+jobs from Postgres and hands them to a pool of worker processes, one per core
+by default, so CPU-heavy media processing never competes with the API.
+"""
+
+import multiprocessing
+import os
+import signal
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlmodel import Session
+
+from app.core.config import Config
+from app.db import get_engine
+from app.services.jobs import JobContext, JobQueue, job_queue
+from app.utils.logger import get_logger, log_pipeline
+
+# Imported for their job processor registrations
+import app.services.catalog  # noqa: F401
+import app.services.media  # noqa: F401
+
+
+logger = get_logger(__name__)
+
+
+def new_session() -> Session:
+    return Session(get_engine())
+
+
+def run_job(
+    job_id: UUID,
+    kind: str,
+    payload: Dict[str, Any],
+    attempt: int,
+    max_attempts: int,
+) -> Optional[Dict[str, Any]]:
+    """Run a single job; executed inside a pool process."""
+    processor = job_queue.processors.get(kind)
+    if processor is None:
+        raise LookupError(f"No processor registered for job kind {kind!r}")
+    ctx = JobContext(job_id, new_session, attempt=attempt, max_attempts=max_attempts)
+    return processor(ctx, payload)
+
+
+def ignore_interrupts() -> None:
+    # Ctrl-C reaches the whole process group; let the parent drain jobs instead
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def create_process_pool(processes: int) -> ProcessPoolExecutor:
+    # Spawned children start clean instead of inheriting the parent's
+    # connection pools and background threads.
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=ignore_interrupts,
+    )
+
+
+class Worker:
+    """
+    Claims jobs and runs them on a pool of processes.
+
+    A job is only claimed when a process is free to run it, so jobs wait in
+    the table (where other workers can take them) rather than in a local queue.
+    Leases of running jobs are renewed in the background of the poll loop.
+
+    ``executor_factory`` can be swapped for a thread pool in tests, so that
+    processors registered in the test process (fakes) are used.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue = job_queue,
+        processes: int = Config.JOB_WORKER_PROCESSES or os.cpu_count() or 1,
+        kinds: Optional[List[str]] = None,
+        poll_interval: float = Config.JOB_POLL_INTERVAL,
+        executor_factory: Callable[[int], Executor] = create_process_pool,
+        session_factory: Callable[[], Session] = new_session,
+    ):
+        self.queue = queue
+        self.processes = processes
+        self.kinds = kinds
+        self.poll_interval = poll_interval
+        self.executor_factory = executor_factory
+        self.session_factory = session_factory
+        self.lease_interval = Config.JOB_VISIBILITY_TIMEOUT / 3
+        # Running jobs as (job id, attempt); the attempt fences writes to the job
+        self.running: Dict[Future, Tuple[UUID, int]] = {}
+        self.stopping = False
+
+    def stop(self, *_) -> None:
+        """Stop claiming new jobs; running jobs are allowed to finish."""
+        if not self.stopping:
+            logger.info("Worker stopping, waiting for running jobs to finish...")
+        self.stopping = True
+
+    def claim_jobs(self, executor: Executor) -> None:
+        while not self.stopping and len(self.running) < self.processes:
+            with self.session_factory() as session:
+                job = self.queue.claim(session, self.kinds)
+            if job is None:
+                return
+            future = executor.submit(run_job, job.uuid, job.kind, job.payload, job.attempts, job.max_attempts)
+            self.running[future] = (job.uuid, job.attempts)
+            logger.info(f"Started job {job.uuid} ({job.kind}), attempt {job.attempts}/{job.max_attempts}")
+
+    def finish_job(self, future: Future) -> bool:
+        """Record the outcome of a job; return False if the pool broke and must be replaced."""
+        job_id, attempt = self.running.pop(future)
+        with self.session_factory() as session:
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                # A pool process died (e.g. OOM-killed); the job goes back on the queue
+                self.queue.fail(session, job_id, attempt, "Worker process died")
+                return False
+            except Exception as e:
+                job = self.queue.fail(session, job_id, attempt, f"{type(e).__name__}: {e}")
+                status = job.status if job is not None else "claim lost"
+                logger.error(f"Job {job_id} failed ({status}): {''.join(traceback.format_exception(e))}")
+                return True
+            completed = self.queue.complete(session, job_id, attempt, result)
+        if not completed:
+            logger.warning(f"Job {job_id} finished after its lease was lost; result discarded")
+            return True
+        logger.info(f"Job {job_id} succeeded")
+        return True
+
+    def replace_pool(self, executor: Executor) -> Executor:
+        """Settle every job of a broken pool and start a fresh one."""
+        done, not_done = wait(self.running, timeout=5)
+        for future in done:
+            self.finish_job(future)
+        with self.session_factory() as session:
+            for future in not_done:
+                job_id, attempt = self.running.pop(future)
+                self.queue.fail(session, job_id, attempt, "Worker process died")
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("Worker process pool broke, starting a new one")
+        return self.executor_factory(self.processes)
+
+    def run(self) -> None:
+        logger.info(f"Worker started with {self.processes} processes")
+        executor = self.executor_factory(self.processes)
+        last_lease_renewal = time.monotonic()
+        try:
+            while not self.stopping or self.running:
+                self.claim_jobs(executor)
+
+                if not self.running:
+                    time.sleep(self.poll_interval)
+                    continue
+
+                done, _ = wait(self.running, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                pool_ok = all([self.finish_job(future) for future in done])
+                if not pool_ok:
+                    executor = self.replace_pool(executor)
+
+                if time.monotonic() - last_lease_renewal >= self.lease_interval:
+                    with self.session_factory() as session:
+                        self.queue.extend_leases(session, list(self.running.values()))
+                    last_lease_renewal = time.monotonic()
+        finally:
+            executor.shutdown(wait=True)
+            logger.info("Worker stopped")
+
+
+def main() -> None:
+    worker = Worker()
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    try:
+        worker.run()
+    finally:
+        get_engine().dispose()
+        log_pipeline.stop()
+
+
+if __name__ == "__main__":
+    main()
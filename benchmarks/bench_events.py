@@ -0,0 +1,53 @@
+"""Event ingestion throughput: cost of record() on the request path, and end-to-end
+batched flushing (into an in-memory sink, or into Postgres with --database).
+
+Run with: python -m benchmarks.bench_events [--database]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from typing import List
+
+from app.db.base_model import utcnow
+from app.services.events import EventPipeline, EventRecord, EventSpool, copy_events
+
+
+def make_event(i: int) -> EventRecord:
+    return EventRecord(occurred_at=utcnow(), event_type="click", link_code=f"code{i % 1000:04d}", visitor_id="abcdef0123456789")
+
+
+async def run(number: int, database: bool) -> None:
+    written: List[int] = []
+
+    async def sink(records: List[EventRecord]) -> None:
+        written.append(len(records))
+
+    pipeline = EventPipeline(
+        writer=copy_events if database else sink,
+        spool=EventSpool(tempfile.mkdtemp(prefix="bench-events-")),
+        max_buffer=number,
+        batch_size=5000,
+        flush_interval=0.1,
+    )
+    await pipeline.start()
+
+    events = [make_event(i) for i in range(number)]
+    start = time.perf_counter()
+    for event in events:
+        pipeline.record(event)
+    record_elapsed = time.perf_counter() - start
+    await pipeline.stop()
+    total_elapsed = time.perf_counter() - start
+
+    print(f"record():        {record_elapsed / number * 1e6:.2f} us/event ({number / record_elapsed:,.0f} events/s)")
+    target = "Postgres COPY" if database else "in-memory sink"
+    print(f"end to end ({target}): {number / total_elapsed:,.0f} events/s")
+
+
+def main(number: int = 200_000) -> None:
+    asyncio.run(run(number, database="--database" in sys.argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Per-request overhead of MetricsMiddleware on a bare ASGI app.
+
+Run with: python -m benchmarks.bench_metrics
+"""
+import asyncio
+import time
+
+from app.api.middleware import MetricsMiddleware
+from app.utils.metrics import registry
+
+
+class Route:
+    path = "/api/v1/users/{user_id}"
+
+
+async def endpoint(scope, receive, send):
+    scope["route"] = Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message):
+    pass
+
+
+async def run(app, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        await app({"type": "http", "method": "GET", "path": "/"}, receive, send)
+    return time.perf_counter() - start
+
+
+def main(number: int = 200_000) -> None:
+    bare = asyncio.run(run(endpoint, number))
+    instrumented = asyncio.run(run(MetricsMiddleware(endpoint), number))
+    overhead = (instrumented - bare) / number * 1e6
+    print(f"bare: {bare / number * 1e6:.2f} us/request | with metrics: {instrumented / number * 1e6:.2f} us/request")
+    print(f"metrics middleware overhead: {overhead:.2f} us/request")
+
+    start = time.perf_counter()
+    registry.render()
+    print(f"/metrics render: {(time.perf_counter() - start) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Serialization cost per response: jsonable_encoder + stdlib JSONResponse vs the orjson envelope.
+
+Run with: python -m benchmarks.bench_response
+"""
+import timeit
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.api.dependencies.response import success_response
+from app.schemas.enums import AuthProvider
+from app.schemas.responses.user import UserResponse
+from app.schemas.user import RegisteredUserData
+
+
+def build_payload() -> UserResponse:
+    return UserResponse(
+        user=RegisteredUserData(
+            uuid=str(uuid4()),
+            email="creator@vidkarma.ad",
+            is_active=True,
+            is_superadmin=False,
+            is_verified=True,
+            is_deleted=False,
+            auth_provider=AuthProvider.LOCAL,
+            created_at=datetime.now(timezone.utc),
+        ),
+        access_token="x" * 180,
+    )
+
+
+def legacy_success_response(status_code, message, data):
+    return JSONResponse(
+        status_code=status_code,
+        content=jsonable_encoder({
+            "status": "success",
+            "status_code": status_code,
+            "message": message,
+            "data": data or {},
+        }),
+    )
+
+
+def main(number: int = 20_000) -> None:
+    single = build_payload()
+    listing = [{"uuid": uuid4(), "created_at": datetime.now(timezone.utc), "user": build_payload()} for _ in range(50)]
+
+    for name, data in (("single user", single), ("50-item list", listing)):
+        before = timeit.timeit(lambda: legacy_success_response(200, "ok", data), number=number)
+        after = timeit.timeit(lambda: success_response(200, "ok", data), number=number)
+        print(
+            f"{name:>14}: jsonable_encoder+json {before / number * 1e6:8.1f} us/response | "
+            f"orjson envelope {after / number * 1e6:8.1f} us/response | {before / after:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Search latency on a synthetic corpus: the Postgres backend over a temporary
+1M-row product table (GIN-indexed tsvector), or the in-memory backend with --memory.
+
+Run with: python -m benchmarks.bench_search [--memory] [--rows N]
+"""
+import argparse
+import asyncio
+import csv
+import io
+import random
+import statistics
+import time
+from datetime import timedelta
+from typing import Callable, Dict, List
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.config import Config
+from app.db import get_engine
+from app.db.base_model import utcnow
+from app.schemas.enums import SearchKind
+from app.services.search import (
+    IndexedDocument,
+    MemorySearchBackend,
+    SearchAfter,
+    build_search_statement,
+    parse_query,
+    search_params,
+)
+
+
+SYLLABLES = ["ka", "lo", "mi", "ra", "ten", "vo", "shi", "der", "pa", "nu", "tri", "bel", "os", "quin", "za", "mar"]
+PAGE_SIZE = 20
+
+
+class Corpus:
+    """Titles and descriptions drawn from a Zipf-distributed made-up vocabulary."""
+
+    def __init__(self, vocabulary_size: int = 20_000, seed: int = 42):
+        self.random = random.Random(seed)
+        words = set()
+        while len(words) < vocabulary_size:
+            words.add("".join(self.random.choices(SYLLABLES, k=self.random.randint(2, 4))))
+        self.words = sorted(words, key=lambda word: (len(word), word))
+        self.cum_weights = []
+        total = 0.0
+        for rank in range(1, len(self.words) + 1):
+            total += 1.0 / rank
+            self.cum_weights.append(total)
+
+    def text(self, count: int) -> str:
+        return " ".join(self.random.choices(self.words, cum_weights=self.cum_weights, k=count))
+
+    def rows(self, number: int):
+        now = utcnow()
+        for i in range(number):
+            yield {
+                "uuid": uuid4(),
+                "created_at": now - timedelta(seconds=self.random.randint(0, 365 * 86400)),
+                "title": self.text(self.random.randint(3, 8)),
+                "description": self.text(self.random.randint(15, 40)),
+                "brand": self.words[self.random.randrange(200)],
+                "category": self.words[self.random.randrange(50)],
+                "sku": f"sku-{i}",
+            }
+
+
+def report(name: str, timings: List[float], hits: int) -> None:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{name:14} p50 {statistics.median(timings) * 1000:8.2f} ms   p95 {p95 * 1000:8.2f} ms   ({hits} hits on page 1)")
+
+
+def measure(search: Callable, terms: List[str], repeat: int) -> None:
+    """Time page 1, then page 2 through the cursor of page 1."""
+    pages: Dict[str, List[float]] = {"page 1": [], "page 2": []}
+    hits = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hits = search(terms, None)
+        pages["page 1"].append(time.perf_counter() - start)
+        if len(hits) == PAGE_SIZE:
+            start = time.perf_counter()
+            search(terms, SearchAfter(hits[-1].score, hits[-1].uuid))
+            pages["page 2"].append(time.perf_counter() - start)
+    for page, timings in pages.items():
+        if timings:
+            report(f"  {page}", timings, len(hits))
+
+
+def load_postgres(session: Session, corpus: Corpus, number: int) -> None:
+    session.execute(text(
+        "CREATE TEMP TABLE search_bench "
+        "(LIKE product INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING INDEXES)"
+    ))
+    cursor = session.connection().connection.cursor()
+    columns = ["uuid", "created_at", "merchant", "sku", "title", "description", "brand", "category", "price", "currency", "url"]
+    rows = corpus.rows(number)
+    start = time.perf_counter()
+    while True:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        batch = 0
+        for row in rows:
+            writer.writerow([
+                row["uuid"], row["created_at"].isoformat(), "bench", row["sku"], row["title"],
+                row["description"], row["brand"], row["category"], "9.99", "USD", "https://example.com",
+            ])
+            batch += 1
+            if batch == 50_000:
+                break
+        if not batch:
+            break
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY search_bench ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+    session.execute(text("ANALYZE search_bench"))
+    print(f"Loaded {number:,} rows in {time.perf_counter() - start:.0f}s")
+
+
+def run_postgres(corpus: Corpus, number: int, repeat: int, queries: Dict[str, str]) -> None:
+    half_life = Config.SEARCH_RECENCY_HALF_LIFE_DAYS * 86400
+    with Session(get_engine()) as session:
+        load_postgres(session, corpus, number)
+        statements = {after: build_search_statement("search_bench", after=after) for after in (False, True)}
+        as_of = utcnow()
+
+        def search(terms: List[str], after):
+            params = search_params(terms, as_of, PAGE_SIZE, after, half_life)
+            return session.execute(statements[after is not None], params).all()
+
+        for name, query in queries.items():
+            print(name, repr(query))
+            measure(search, parse_query(query), repeat)
+        session.rollback()
+
+
+def run_memory(corpus: Corpus, number: int, repeat: int, queries: Dict[str, str]) -> None:
+    backend = MemorySearchBackend(Config.SEARCH_RECENCY_HALF_LIFE_DAYS)
+    index = backend.indexes[SearchKind.PRODUCT]
+    start = time.perf_counter()
+    for row in corpus.rows(number):
+        document = IndexedDocument(row["uuid"], row["title"], row["description"], row["created_at"])
+        index.add(document, {"A": row["title"], "B": f"{row['brand']} {row['category']}", "C": row["description"]})
+    print(f"Indexed {number:,} rows in {time.perf_counter() - start:.0f}s")
+    as_of = utcnow()
+    loop = asyncio.new_event_loop()
+
+    def search(terms: List[str], after):
+        return loop.run_until_complete(backend.search(SearchKind.PRODUCT, terms, as_of, PAGE_SIZE, after))
+
+    for name, query in queries.items():
+        print(name, repr(query))
+        measure(search, parse_query(query), repeat)
+    loop.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_search")
+    parser.add_argument("--memory", action="store_true", help="Benchmark the in-memory backend")
+    parser.add_argument("--rows", type=int, help="Corpus size (default 1M, or 100k with --memory)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    corpus = Corpus()
+    # Word frequencies follow the vocabulary order
+    queries = {
+        "common word": corpus.words[0],
+        "short prefix": corpus.words[0][:2],
+        "two words": f"{corpus.words[0]} {corpus.words[1]}",
+        "rare word": corpus.words[-1],
+        "no match": "qqqzzz",
+    }
+    if args.memory:
+        run_memory(corpus, args.rows or 100_000, args.repeat, queries)
+    else:
+        run_postgres(corpus, args.rows or 1_000_000, args.repeat, queries)
+
+
+if __name__ == "__main__":
+    main()